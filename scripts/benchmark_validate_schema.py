@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Beckn Schema Validator Benchmark
+
+This script measures how fast `validate_schema.py` validates large Beckn messages, so
+regressions in `validate_payload` show up before a CI job times out. Payloads are built
+by fanning out the real examples in this repo to a given number of catalog items and
+offers, and validated against schemas from the local schema cache (no network access).
+
+WHAT IT MEASURES
+----------------
+For each scenario and scale:
+- objects/s: validated @context/@type objects per second
+- p50 / p99: latency per message (one validate_payload call on the scaled payload)
+- peak MB: peak Python memory allocated while validating one message (tracemalloc)
+
+Results can be written as JSON (with the git commit, Python version and platform) and
+compared against an earlier run, so numbers are comparable across commits.
+
+SCENARIOS
+---------
+- ev-on-discover: examples/ev-charging/v2/02_on_discover/time-based-ev-charging-slot-catalog.json
+- p2p-discover:   examples/v2/P2P_Trading/discover-response.json
+
+CLI USAGE
+---------
+# Populate the schema cache once (needs network), e.g. by validating the examples:
+python3 scripts/validate_schema.py examples/ev-charging/v2/*/*.json examples/v2/P2P_Trading/*.json
+
+# Run the default scales (10 to 10,000 items) and save the results:
+python3 scripts/benchmark_validate_schema.py --output bench-main.json
+
+# Run a larger scale on one scenario and compare with the saved results:
+python3 scripts/benchmark_validate_schema.py --scenario ev-on-discover --scales 1000 100000 \\
+  --compare bench-main.json
+
+Arguments:
+- --scenario      Scenario to run (repeatable; default: all)
+- --scales        Number of catalog items and offers per message (default: 10 100 1000 10000)
+- --repeat        Timed validations per scale (default: 20)
+- --output        Write results as JSON
+- --compare       Earlier JSON results to show changes against
+- --online        Allow fetching schemas missing from the cache
+- --codegen       Validate with generated validators (validate_schema.py --codegen)
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Import validation functions from validate_schema
+try:
+    # Try importing as module (if scripts directory is in path)
+    import validate_schema
+except ImportError:
+    # If running as a script, import from same directory
+    import importlib.util
+    validate_schema_path = Path(__file__).parent / "validate_schema.py"
+    spec = importlib.util.spec_from_file_location("validate_schema", validate_schema_path)
+    validate_schema = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(validate_schema)
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Example to fan out, and the catalog arrays whose elements are replicated
+SCENARIOS = {
+    "ev-on-discover": {
+        "example": "examples/ev-charging/v2/02_on_discover/time-based-ev-charging-slot-catalog.json",
+        "fan_out": ["beckn:items", "beckn:offers"],
+    },
+    "p2p-discover": {
+        "example": "examples/v2/P2P_Trading/discover-response.json",
+        "fan_out": ["beckn:items", "beckn:offers"],
+    },
+}
+
+DEFAULT_SCALES = [10, 100, 1000, 10000]
+
+
+def fan_out_payload(example: Dict[str, Any], fan_out: List[str], count: int) -> Dict[str, Any]:
+    """
+    Build a payload whose first catalog holds `count` elements in each fan-out array.
+
+    Elements are copied round-robin from the example, with a numeric suffix added to
+    beckn:id (and to the offers' beckn:items references) so every id stays unique.
+    """
+    payload = copy.deepcopy(example)
+    catalog = payload["message"]["catalogs"][0]
+    for key in fan_out:
+        templates = catalog.get(key) or []
+        if not templates:
+            continue
+        elements = []
+        for i in range(count):
+            element = copy.deepcopy(templates[i % len(templates)])
+            suffix = f"-{i // len(templates)}"
+            if isinstance(element.get("beckn:id"), str):
+                element["beckn:id"] += suffix
+            if key == "beckn:offers" and isinstance(element.get("beckn:items"), list):
+                element["beckn:items"] = [f"{item_id}{suffix}" for item_id in element["beckn:items"]]
+            elements.append(element)
+        catalog[key] = elements
+    return payload
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list (pct from 0 to 100)."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_case(store, payload: Dict[str, Any], repeat: int) -> Optional[Dict[str, Any]]:
+    """
+    Validate one payload repeatedly and measure throughput, latency and peak memory.
+
+    Schemas are loaded and compiled before timing starts, so only validation is measured.
+    A payload that fails validation is still measured; its errors are counted in the result.
+
+    Returns:
+        Measurements for the payload, or None if some of its schemas could not be loaded
+        (typically because they are missing from the cache)
+    """
+    registry_list, attributes_schema, attribute_schemas_map = store
+    refs = validate_schema.collect_schema_refs(payload)
+    validate_schema.warm_schema_refs(refs, registry_list, attribute_schemas_map)
+    if validate_schema.missing_schema_urls(refs, registry_list, attribute_schemas_map):
+        return None
+
+    records = []
+    errors = validate_schema.validate_payload(payload, registry_list, attributes_schema, attribute_schemas_map, records=records)
+
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        validate_schema.validate_payload(payload, registry_list, attributes_schema, attribute_schemas_map)
+        latencies.append(time.perf_counter() - started)
+
+    # Separate pass: tracemalloc slows allocation, so it must not affect the timings
+    tracemalloc.start()
+    validate_schema.validate_payload(payload, registry_list, attributes_schema, attribute_schemas_map)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "objects": len(records),
+        "errors": len(errors),
+        "objects_per_s": round(len(records) * repeat / total, 1) if total else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "peak_mb": round(peak / (1024 * 1024), 2),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_change(current: Optional[float], baseline: Optional[float]) -> str:
+    if not current or not baseline:
+        return ""
+    return f" ({(current - baseline) / baseline * 100:+.1f}%)"
+
+
+def print_table(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Print results as a table, with changes relative to baseline results if given."""
+    previous = {}
+    if baseline:
+        previous = {(r["scenario"], r["scale"]): r for r in baseline.get("results", [])}
+
+    print(f"{'scenario':<16} {'scale':>7} {'objects':>8} {'objects/s':>22} {'p50 ms':>20} {'p99 ms':>20} {'peak MB':>18}")
+    for r in results:
+        old = previous.get((r["scenario"], r["scale"]), {})
+        print(
+            f"{r['scenario']:<16} {r['scale']:>7} {r['objects']:>8} "
+            f"{str(r['objects_per_s']) + _format_change(r['objects_per_s'], old.get('objects_per_s')):>22} "
+            f"{str(r['p50_ms']) + _format_change(r['p50_ms'], old.get('p50_ms')):>20} "
+            f"{str(r['p99_ms']) + _format_change(r['p99_ms'], old.get('p99_ms')):>20} "
+            f"{str(r['peak_mb']) + _format_change(r['peak_mb'], old.get('peak_mb')):>18}"
+        )
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark validate_schema.py on example payloads fanned out to large catalogs"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        default=None,
+        help="Scenario to run (repeatable; default: all)"
+    )
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="Catalog items and offers per message (default: %(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed validations per scale (default: %(default)s)")
+    parser.add_argument("--output", type=str, default=None, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=str, default=None, help="Earlier JSON results to compare against")
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=validate_schema.DEFAULT_CACHE_DIR,
+        help="Schema cache directory (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--online",
+        action="store_true",
+        default=False,
+        help="Fetch schemas missing from the cache instead of failing (default: offline)"
+    )
+    parser.add_argument(
+        "--codegen",
+        action="store_true",
+        default=False,
+        help="Validate with generated validators, as validate_schema.py --codegen does"
+    )
+
+    args = parser.parse_args()
+    validate_schema.configure_schema_cache(cache_dir=args.cache_dir, offline=not args.online)
+    validate_schema.configure_reporting(verbose=False)
+    validate_schema.configure_codegen(enabled=args.codegen)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = []
+    for scenario in args.scenario or sorted(SCENARIOS):
+        config = SCENARIOS[scenario]
+        with open(REPO_ROOT / config["example"], "r", encoding="utf-8") as f:
+            example = json.load(f)
+        store = validate_schema.get_schema_store()
+        for scale in args.scales:
+            payload = fan_out_payload(example, config["fan_out"], scale)
+            result = run_case(store, payload, args.repeat)
+            if result is None:
+                print(f"Error: schemas for {scenario} could not be loaded; are they in {args.cache_dir}?", file=sys.stderr)
+                sys.exit(1)
+            results.append({"scenario": scenario, "scale": scale, **result})
+            print(f"  {scenario} x{scale}: {result['objects_per_s']} objects/s, {result['errors']} error(s)", file=sys.stderr)
+
+    print_table(results, baseline)
+
+    if args.output:
+        report = {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "codegen": args.codegen,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Wrote benchmark results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Beckn Example Index
+
+This script indexes the example JSON messages in this repo in a single pass, recording for
+each example its devkit, the roles and actions it is an example of, its step in the flow
+and its content hash. The index is persisted, so tools that need "the BAP examples of the
+ev-charging devkit, by action" (the Postman generator, schema validation runs, docs) can
+look them up instead of walking the tree and matching file and folder names again.
+
+WHAT IT DOES
+------------
+1) Lists the examples under each examples directory, in one of two layouts:
+   - folders: one folder per flow step, named <NN>_<action>
+     (e.g. examples/ev-charging/v2/01_discover/*.json)
+   - flat:    one file per message, named <action>-request.json / <action>-response.json
+     (e.g. examples/v2/P2P_Trading/discover-request.json)
+2) Classifies each example for every role (BAP, BPP, UtilityBPP), using the same rules the
+   Postman generator has always used (ROLE_FILTERS and the action tables below)
+3) Hashes each new or changed example; examples whose size and mtime match the persisted
+   index are not read again
+4) Saves the index (by default to ~/.cache/beckn-examples/index.json) for the next run
+
+Queries by examples directory (or devkit) and role are dictionary lookups.
+
+FLOW STEPS
+----------
+In the folders layout the step is the folder's number (01_discover -> 1). In the flat
+layout it is the action's position in the Beckn flow: discover = 1, on_discover = 2,
+select = 3, and so on through cancel / on_cancel.
+
+CLI USAGE
+---------
+# Index the examples of every devkit and summarise them by devkit, role and action:
+python3 scripts/example_index.py
+
+# List the BAP examples of a devkit, e.g. to validate them:
+python3 scripts/validate_schema.py $(python3 scripts/example_index.py --list --devkit ev-charging --role BAP)
+
+Arguments:
+- --devkit        Only this devkit (repeatable; default: all in EXAMPLE_SOURCES)
+- --role          Only examples of this role
+- --action        Only examples of this action (e.g. on_discover)
+- --list          Print the matching example paths, one per line, instead of a summary
+- --json          Print the matching index entries as JSON
+- --index         Index file (default: ~/.cache/beckn-examples/index.json)
+- --no-index      Do not read or write an index file
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Examples directory and layout of each devkit, relative to the repo root. The single source
+# for these: the Postman generator's DEVKIT_CONFIGS takes its examples_path and structure from here
+EXAMPLE_SOURCES = {
+    "ev-charging": {"path": "examples/ev-charging/v2", "layout": "folders"},
+    "p2p-trading": {"path": "examples/v2/P2P_Trading", "layout": "flat"},
+}
+
+# Role-based file name filters (regex patterns)
+ROLE_FILTERS = {
+    "BAP": [
+        r".*-request\.json$",  # P2P trading: *-request.json
+        r"^\d+_(discover|select|init|confirm|status|update|track|rating|support|cancel)\.json$",  # EV charging: numbered folders
+        r"^(discover|select|init|confirm|status|update|track|rating|support|cancel).*\.json$"  # General pattern
+    ],
+    "BPP": [
+        r".*-response\.json$",  # P2P trading: *-response.json
+        r"^\d+_on_(discover|select|init|confirm|update|track|status|rating|support|cancel).*\.json$",  # EV charging: on_* folders
+        r"^on_(discover|select|init|confirm|update|track|status|rating|support|cancel).*\.json$"  # General pattern
+    ],
+    "UtilityBPP": [
+        r"^cascaded-.*\.json$"  # Cascaded requests/responses
+    ]
+}
+
+# All BAP-initiated actions (including status), in flow order
+BAP_ACTIONS = {
+    "discover": "discover",
+    "select": "select",
+    "init": "init",
+    "confirm": "confirm",
+    "status": "status",
+    "update": "update",
+    "track": "track",
+    "rating": "rating",
+    "support": "support",
+    "cancel": "cancel",
+}
+
+# BPP response actions
+BPP_ACTIONS = {
+    "on_discover": "on_discover",
+    "on_select": "on_select",
+    "on_init": "on_init",
+    "on_confirm": "on_confirm",
+    "on_status": "on_status",
+    "on_update": "on_update",
+    "on_track": "on_track",
+    "on_rating": "on_rating",
+    "on_support": "on_support",
+    "on_cancel": "on_cancel",
+}
+
+# Bump INDEX_VERSION whenever the classification of an example changes
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "beckn-examples", "index.json"
+)
+
+
+def matches_role_filter(filename: str, role: str) -> bool:
+    """
+    Check if filename matches role-based filter patterns.
+
+    Args:
+        filename: Name of the file
+        role: Role (BAP, BPP, or UtilityBPP)
+
+    Returns:
+        True if filename matches role filters
+    """
+    if role not in ROLE_FILTERS:
+        return False
+
+    for pattern in ROLE_FILTERS[role]:
+        if re.match(pattern, filename, re.IGNORECASE):
+            return True
+    return False
+
+
+def extract_action_from_filename(filename: str, role: str) -> Optional[str]:
+    """
+    Extract action name from filename based on role.
+
+    Examples:
+        "discover-request.json" (BAP) -> "discover"
+        "discover-response.json" (BPP) -> "on_discover"
+        "cascaded-init-request.json" (UtilityBPP) -> "init"
+    """
+    # Remove .json extension
+    name = filename.replace('.json', '')
+
+    # Handle P2P trading flat structure - strict role-based matching
+    if role == "BAP":
+        # BAP only matches *-request.json (not *-response.json)
+        if name.endswith('-request'):
+            action = name.replace('-request', '')
+            if action in BAP_ACTIONS:
+                return action
+        # Also handle cascaded requests for BAP (though typically UtilityBPP)
+        if name.startswith('cascaded-') and name.endswith('-request'):
+            action = name.replace('cascaded-', '').replace('-request', '')
+            if action in BAP_ACTIONS:
+                return action
+
+    elif role == "BPP":
+        # BPP only matches *-response.json (not *-request.json)
+        if name.endswith('-response'):
+            # For responses, the action in filename is the request action
+            # We need to convert to BPP action (e.g., "discover" -> "on_discover")
+            request_action = name.replace('-response', '')
+            # Check if it's a direct BPP action
+            if request_action in BPP_ACTIONS:
+                return request_action
+            # Convert request action to response action
+            if request_action in BAP_ACTIONS:
+                return f"on_{request_action}"
+        # Handle cascaded responses
+        if name.startswith('cascaded-') and name.endswith('-response'):
+            request_action = name.replace('cascaded-', '').replace('-response', '')
+            if request_action in BAP_ACTIONS:
+                return f"on_{request_action}"
+
+    elif role == "UtilityBPP":
+        # UtilityBPP matches cascaded-*-request.json
+        if name.startswith('cascaded-') and name.endswith('-request'):
+            action = name.replace('cascaded-', '').replace('-request', '')
+            if action in BAP_ACTIONS:
+                return action
+
+    return None
+
+
+def extract_action_from_folder(folder_name: str, role: str) -> Optional[str]:
+    """
+    Extract action name from folder name (for folder-based structure).
+
+    Examples:
+        "01_discover" (BAP) -> "discover"
+        "02_on_discover" (BPP) -> "on_discover"
+        "03_select" (BAP) -> "select"
+    """
+    # Remove leading numbers and underscores
+    match = re.match(r'^\d+_(.+)', folder_name)
+    if match:
+        action = match.group(1)
+
+        if role == "BAP":
+            # BAP uses regular actions
+            if action in BAP_ACTIONS:
+                return action
+        elif role == "BPP":
+            # BPP uses on_* actions
+            if action in BPP_ACTIONS:
+                return action
+        elif role == "UtilityBPP":
+            # UtilityBPP uses cascaded actions (same as BAP actions)
+            if action in BAP_ACTIONS:
+                return action
+
+    return None
+
+
+def flow_step(action: str) -> Optional[int]:
+    """Position of an action in the Beckn flow: discover = 1, on_discover = 2, select = 3, ..."""
+    request_action = action[3:] if action.startswith("on_") else action
+    if request_action not in BAP_ACTIONS:
+        return None
+    return list(BAP_ACTIONS).index(request_action) * 2 + (2 if action.startswith("on_") else 1)
+
+
+def classify_example(filename: str, folder: Optional[str], layout: str) -> Tuple[Dict[str, str], Optional[int]]:
+    """
+    Classify an example for every role.
+
+    Args:
+        filename: Example file name
+        folder: Name of the folder holding it ("folders" layout), or None
+        layout: "folders" or "flat"
+
+    Returns:
+        ({role: action} for each role the example belongs to, flow step or None)
+    """
+    roles = {}
+    if layout == "folders":
+        # For folder-based structure, the folder name decides the role and action
+        for role in ROLE_FILTERS:
+            action = extract_action_from_folder(folder, role)
+            if action is not None:
+                roles[role] = action
+        match = re.match(r'^(\d+)_', folder)
+        step = int(match.group(1)) if match else None
+    else:
+        for role in ROLE_FILTERS:
+            if not matches_role_filter(filename, role):
+                continue
+            action = extract_action_from_filename(filename, role)
+            if action is not None:
+                roles[role] = action
+        step = min((flow_step(action) for action in roles.values()), default=None)
+    return roles, step
+
+
+def devkit_for_directory(examples_dir: Path) -> Optional[str]:
+    """Return the devkit in EXAMPLE_SOURCES whose examples directory is examples_dir, if any."""
+    resolved = examples_dir.resolve()
+    for devkit, source in EXAMPLE_SOURCES.items():
+        if (REPO_ROOT / source["path"]).resolve() == resolved:
+            return devkit
+    return None
+
+
+def _list_examples(root: Path, layout: str) -> List[Tuple[Path, Optional[str]]]:
+    """List (example file, folder name) pairs under an examples directory."""
+    found = []
+    if layout == "folders":
+        for folder in root.iterdir():
+            if folder.is_dir():
+                found.extend((json_file, folder.name) for json_file in folder.glob("*.json"))
+    else:
+        found.extend((json_file, None) for json_file in root.glob("*.json"))
+    return found
+
+
+class ExampleIndex:
+    """
+    Persistent index of example messages, by examples directory, role and action.
+
+    Call scan() for each examples directory before querying it; a directory is only listed
+    once per ExampleIndex, and examples unchanged since the index was saved are not read.
+
+    Args:
+        path: Index file to load and save, or None to keep the index in memory only
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_INDEX_PATH):
+        self.path = path
+        self._roots = {}
+        self._scanned = set()
+        self._by_role = {}
+        self._dirty = False
+        if path:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+                    self._roots = data.get("roots", {})
+            except (OSError, ValueError):
+                pass
+
+    def scan(self, examples_dir: Path, layout: str, devkit: Optional[str] = None) -> None:
+        """
+        Bring the index of one examples directory up to date.
+
+        Args:
+            examples_dir: Examples directory
+            layout: "folders" or "flat"
+            devkit: Devkit the examples belong to (default: looked up in EXAMPLE_SOURCES)
+        """
+        root = str(examples_dir.resolve())
+        if (root, layout) in self._scanned:
+            return
+        self._scanned.add((root, layout))
+        if devkit is None:
+            devkit = devkit_for_directory(examples_dir)
+
+        previous = self._roots.get(root)
+        if previous is None or previous.get("layout") != layout or previous.get("devkit") != devkit:
+            previous = {"examples": {}}
+        old_examples = previous["examples"]
+        examples = {}
+        if examples_dir.is_dir():
+            for json_file, folder in _list_examples(examples_dir, layout):
+                path = str(json_file.resolve())
+                try:
+                    stat = json_file.stat()
+                    entry = old_examples.get(path)
+                    if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                        examples[path] = entry
+                        continue
+                    content_hash = hashlib.sha256(json_file.read_bytes()).hexdigest()
+                except OSError:
+                    continue
+                roles, step = classify_example(json_file.name, folder, layout)
+                examples[path] = {
+                    "name": json_file.name,
+                    "folder": folder,
+                    "roles": roles,
+                    "step": step,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": content_hash,
+                }
+
+        if examples != old_examples or root not in self._roots:
+            self._dirty = True
+        self._roots[root] = {"devkit": devkit, "layout": layout, "examples": examples}
+        self._by_role = {key: value for key, value in self._by_role.items() if key[0] != root}
+
+    def by_action(self, examples_dir: Path, role: str) -> Dict[str, List[Path]]:
+        """
+        Return the examples of a role in a scanned examples directory.
+
+        Returns:
+            {action: [example paths]}, with the paths of each action sorted
+        """
+        root = str(examples_dir.resolve())
+        key = (root, role)
+        if key not in self._by_role:
+            actions = {}
+            for path, entry in self._roots.get(root, {}).get("examples", {}).items():
+                action = entry["roles"].get(role)
+                if action is not None:
+                    actions.setdefault(action, []).append(Path(path))
+            for paths in actions.values():
+                paths.sort()
+            self._by_role[key] = actions
+        return self._by_role[key]
+
+    def entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Return the index entry of an example (with its devkit), or None if it is not indexed."""
+        path = str(Path(path).resolve())
+        for root in self._roots.values():
+            entry = root["examples"].get(path)
+            if entry is not None:
+                return {"path": path, "devkit": root["devkit"], **entry}
+        return None
+
+    def find(self, devkit: Optional[str] = None, role: Optional[str] = None, action: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the index entries matching all the given filters, ordered by devkit, step and path.
+
+        Each entry has path, devkit, name, folder, roles ({role: action}), step, mtime_ns,
+        size and sha256.
+        """
+        found = []
+        for root in self._roots.values():
+            if devkit is not None and root["devkit"] != devkit:
+                continue
+            for path, entry in root["examples"].items():
+                roles = entry["roles"]
+                if role is not None and role not in roles:
+                    continue
+                if action is not None and action not in ([roles[role]] if role else roles.values()):
+                    continue
+                found.append({"path": path, "devkit": root["devkit"], **entry})
+        found.sort(key=lambda e: (e["devkit"] or "", e["step"] if e["step"] is not None else sys.maxsize, e["path"]))
+        return found
+
+    def save(self) -> None:
+        """Atomically write the index to its file, if it has one and anything changed."""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "roots": self._roots}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Index the example messages of every devkit by role, action and flow step"
+    )
+    parser.add_argument(
+        "--devkit",
+        action="append",
+        choices=sorted(EXAMPLE_SOURCES),
+        default=None,
+        help="Only this devkit (repeatable; default: all)"
+    )
+    parser.add_argument("--role", choices=list(ROLE_FILTERS), default=None, help="Only examples of this role")
+    parser.add_argument("--action", default=None, help="Only examples of this action (e.g. on_discover)")
+    parser.add_argument("--list", action="store_true", default=False, help="Print matching example paths, one per line")
+    parser.add_argument("--json", action="store_true", default=False, help="Print matching index entries as JSON")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="Index file (default: %(default)s)")
+    parser.add_argument("--no-index", dest="index", action="store_const", const=None, help="Do not read or write an index file")
+
+    args = parser.parse_args()
+
+    index = ExampleIndex(args.index)
+    devkits = args.devkit or list(EXAMPLE_SOURCES)
+    for devkit in devkits:
+        source = EXAMPLE_SOURCES[devkit]
+        examples_dir = REPO_ROOT / source["path"]
+        if not examples_dir.is_dir():
+            print(f"Warning: examples directory not found for {devkit}: {examples_dir}", file=sys.stderr)
+        index.scan(examples_dir, source["layout"], devkit)
+    index.save()
+
+    entries = [e for devkit in devkits for e in index.find(devkit, args.role, args.action)]
+    if args.list:
+        for entry in entries:
+            print(os.path.relpath(entry["path"]))
+    elif args.json:
+        print(json.dumps(entries, indent=2))
+    else:
+        counts = {}
+        for entry in entries:
+            for role, action in entry["roles"].items():
+                if args.role is None or role == args.role:
+                    key = (entry["devkit"], role, action, flow_step(action))
+                    counts[key] = counts.get(key, 0) + 1
+        print(f"{'devkit':<14} {'role':<11} {'action':<14} {'examples':>8}")
+        for devkit, role, action, _ in sorted(counts, key=lambda k: (k[0], k[1], k[3] or 0, k[2])):
+            print(f"{devkit:<14} {role:<11} {action:<14} {counts[(devkit, role, action, _)]:>8}")
+        print(f"\n{len(entries)} example(s) indexed")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,31 @@ resulting collection against Beckn schemas.
 
 WHAT IT DOES
 ------------
-1) Discovers example JSON files under a devkit-specific examples directory
+1) Looks up the example JSON files of the role under a devkit-specific examples directory
+   in the example index (see example_index.py), which lists and classifies them once
 2) Builds Postman items for each API flow, adding environment macros for BAP/BPP IDs and URIs
-3) Writes a Postman collection JSON to the requested output directory
+3) Writes a Postman collection JSON to the requested output directory, only if its content
+   changed (the collection's _postman_id is kept stable across runs)
 4) Optionally validates the generated collection using the local `validate_schema.py`
 
+Regeneration is incremental: a manifest (by default in ~/.cache/beckn-postman) records each
+example's size, mtime and content hash together with the Postman item built from it, so
+only new or changed examples are re-read and rebuilt. With the manifest, validation is
+incremental too (`validate_schema.py --incremental`), so an unchanged collection is not
+validated again unless its schemas changed.
+
+With --all, every devkit x role collection is generated in one run: each example is parsed
+once into an index shared by all the collections built from it, the collections are built
+in parallel worker processes, and they are then validated together against a single warm
+schema store, so shared schemas are fetched and compiled once.
+
 KEY FUNCTIONS
 -------------
 - `generate_collection(...)`: Core builder; converts example flows to Postman items
 - `build_item(...)`: Creates a Postman item with request, headers, and body
 - `attach_env_macros(...)`: Injects {{bap_id}}, {{bap_uri}}, {{bpp_id}}, {{bpp_uri}}
   placeholders so the same collection works across environments
+- `generate_all_collections(...)`: Batch builder for every devkit and role (--all)
 - `main()`: CLI entry point (parses args, resolves paths, runs generation, optional validation)
 
 CLI USAGE
@@ -33,14 +47,29 @@ python3 scripts/generate_postman_collection.py \\
   --description \"EV Charging BAP flows\" \\
   --validate
 
+# Every devkit and role, written as <output-dir>/<devkit>:<role>-DEG.postman_collection.json
+python3 scripts/generate_postman_collection.py --all --output-dir build/postman
+
 Arguments:
 - --devkit        Devkit key (e.g., ev-charging)
 - --role          Role in the flows (BAP or BPP)
+- --all           Generate the collection of every devkit and each role it defines instead
+                  of one (roles without examples are skipped; a missing devkit examples
+                  directory is an error)
 - --output-dir    Where to write the Postman collection
 - --examples      Root path to example JSONs (defaults from devkit config)
 - --name          Collection name (default: <devkit>:<role>-DEG)
 - --description   Collection description (optional)
 - --validate      Run schema validation on the generated collection using validate_schema.py
+- --bundle        Validate against a schema bundle written by `validate_schema.py bundle`
+- --jobs          Worker processes for validating the collection's distinct request bodies,
+                  or with --all for building and validating the collections
+                  (0 uses all CPUs; default: 1, or 0 with --all)
+- --manifest      Manifest of examples and generated items (default: ~/.cache/beckn-postman/manifest.json)
+- --no-manifest   Rebuild every item and validate the whole collection
+- --example-index Index of examples by role and action, shared with example_index.py
+                  (default: ~/.cache/beckn-examples/index.json)
+- --no-example-index  Do not read or write the example index
 
 OUTPUT
 ------
@@ -48,10 +77,15 @@ Writes a Postman collection JSON with environment macros for IDs/URIs, suitable
 importing into Postman or running via newman with environment files.
 """
 
+import io
 import json
 import os
-import re
+import contextlib
+import multiprocessing
 import uuid
+import hashlib
+import stat
+import tempfile
 import argparse
 import sys
 from pathlib import Path
@@ -60,7 +94,10 @@ from typing import Dict, List, Any, Optional, Tuple
 # Import validation functions from validate_schema
 try:
     # Try importing as module (if scripts directory is in path)
-    from validate_schema import get_schema_store, process_file
+    from validate_schema import (
+        get_schema_store, load_schema_bundle, process_file, process_files, process_files_incremental,
+        load_manifest, save_manifest, DEFAULT_CACHE_DIR, DEFAULT_MANIFEST_NAME
+    )
 except ImportError:
     # If running as a script, import from same directory
     import importlib.util
@@ -70,13 +107,50 @@ except ImportError:
         validate_schema = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(validate_schema)
         get_schema_store = validate_schema.get_schema_store
+        load_schema_bundle = validate_schema.load_schema_bundle
         process_file = validate_schema.process_file
+        process_files = validate_schema.process_files
+        process_files_incremental = validate_schema.process_files_incremental
+        load_manifest = validate_schema.load_manifest
+        save_manifest = validate_schema.save_manifest
+        DEFAULT_CACHE_DIR = validate_schema.DEFAULT_CACHE_DIR
+        DEFAULT_MANIFEST_NAME = validate_schema.DEFAULT_MANIFEST_NAME
     else:
         get_schema_store = None
+        load_schema_bundle = None
         process_file = None
+        process_files = None
+        process_files_incremental = None
+        load_manifest = None
+        save_manifest = None
+        DEFAULT_CACHE_DIR = None
+        DEFAULT_MANIFEST_NAME = None
+
+
+# Example classification and index
+try:
+    from example_index import (
+        ExampleIndex, EXAMPLE_SOURCES, ROLE_FILTERS, BAP_ACTIONS, BPP_ACTIONS, DEFAULT_INDEX_PATH,
+        matches_role_filter, extract_action_from_filename, extract_action_from_folder
+    )
+except ImportError:
+    import importlib.util
+    example_index_path = Path(__file__).parent / "example_index.py"
+    spec = importlib.util.spec_from_file_location("example_index", example_index_path)
+    example_index = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(example_index)
+    ExampleIndex = example_index.ExampleIndex
+    EXAMPLE_SOURCES = example_index.EXAMPLE_SOURCES
+    ROLE_FILTERS = example_index.ROLE_FILTERS
+    BAP_ACTIONS = example_index.BAP_ACTIONS
+    BPP_ACTIONS = example_index.BPP_ACTIONS
+    DEFAULT_INDEX_PATH = example_index.DEFAULT_INDEX_PATH
+    matches_role_filter = example_index.matches_role_filter
+    extract_action_from_filename = example_index.extract_action_from_filename
+    extract_action_from_folder = example_index.extract_action_from_folder
 
 
-# Configuration for different devkits
+# Configuration for different devkits; examples paths and layouts come from EXAMPLE_SOURCES
 DEVKIT_CONFIGS = {
     "ev-charging": {
         "domain": "beckn.one:deg:ev-charging:2.0.0",
@@ -86,9 +160,10 @@ DEVKIT_CONFIGS = {
         "bpp_uri": "http://onix-bpp:8082/bpp/receiver",
         "bap_adapter_url": "http://localhost:8081/bap/caller",
         "bpp_adapter_url": "http://localhost:8082/bpp/caller",
-        "examples_path": "examples/ev-charging/v2",
+        "examples_path": EXAMPLE_SOURCES["ev-charging"]["path"],
         # "output_path": "testnet/ev-charging-devkit/postman",
-        "structure": "folders"  # Folder-based structure
+        "structure": EXAMPLE_SOURCES["ev-charging"]["layout"],  # Folder-based structure
+        "roles": ["BAP", "BPP"]  # Roles with collections of their own (--all)
     },
     "p2p-trading": {
         "domain": "beckn.one:deg:p2p-trading:2.0.0",
@@ -98,56 +173,27 @@ DEVKIT_CONFIGS = {
         "bpp_uri": "http://onix-bpp:8082/bpp/receiver",
         "bap_adapter_url": "http://localhost:8081/bap/caller",
         "bpp_adapter_url": "http://localhost:8082/bpp/caller",
-        "examples_path": "examples/p2p-trading/v2",
+        "examples_path": EXAMPLE_SOURCES["p2p-trading"]["path"],
         # "output_path": "testnet/p2p-energy-trading-devkit/postman",
-        "structure": "flat"  # Flat file structure
+        "structure": EXAMPLE_SOURCES["p2p-trading"]["layout"],  # Flat file structure
+        "roles": ["BAP", "BPP", "UtilityBPP"]
     }
 }
 
-# Role-based file name filters (regex patterns)
-ROLE_FILTERS = {
-    "BAP": [
-        r".*-request\.json$",  # P2P trading: *-request.json
-        r"^\d+_(discover|select|init|confirm|status|update|track|rating|support|cancel)\.json$",  # EV charging: numbered folders
-        r"^(discover|select|init|confirm|status|update|track|rating|support|cancel).*\.json$"  # General pattern
-    ],
-    "BPP": [
-        r".*-response\.json$",  # P2P trading: *-response.json
-        r"^\d+_on_(discover|select|init|confirm|update|track|status|rating|support|cancel).*\.json$",  # EV charging: on_* folders
-        r"^on_(discover|select|init|confirm|update|track|status|rating|support|cancel).*\.json$"  # General pattern
-    ],
-    "UtilityBPP": [
-        r"^cascaded-.*\.json$"  # Cascaded requests/responses
-    ]
-}
+# Manifest of examples and the Postman items built from them, for incremental regeneration.
+# Bump GENERATOR_VERSION whenever the items built from an example change.
+GENERATOR_VERSION = 1
+DEFAULT_GENERATION_MANIFEST = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "beckn-postman", "manifest.json"
+)
 
-# All BAP-initiated actions (including status)
-BAP_ACTIONS = {
-    "discover": "discover",
-    "select": "select",
-    "init": "init",
-    "confirm": "confirm",
-    "status": "status",
-    "update": "update",
-    "track": "track",
-    "rating": "rating",
-    "support": "support",
-    "cancel": "cancel",
-}
+# Example index shared by every collection generated in this run (see get_example_index)
+_example_index_config = {"path": DEFAULT_INDEX_PATH}
+_example_index = None
 
-# BPP response actions
-BPP_ACTIONS = {
-    "on_discover": "on_discover",
-    "on_select": "on_select",
-    "on_init": "on_init",
-    "on_confirm": "on_confirm",
-    "on_status": "on_status",
-    "on_update": "on_update",
-    "on_track": "on_track",
-    "on_rating": "on_rating",
-    "on_support": "on_support",
-    "on_cancel": "on_cancel",
-}
+# Namespace for _postman_id values of collections that do not exist yet
+POSTMAN_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/Beckn-One/DEG/postman")
 
 # Pre-request script for ISO timestamp generation
 PRE_REQUEST_SCRIPT = """// Pure JS pre-request script to replace moment()
@@ -157,109 +203,6 @@ pm.collectionVariables.set('iso_date', isoTimestamp);
 """
 
 
-def matches_role_filter(filename: str, role: str) -> bool:
-    """
-    Check if filename matches role-based filter patterns.
-    
-    Args:
-        filename: Name of the file
-        role: Role (BAP, BPP, or UtilityBPP)
-    
-    Returns:
-        True if filename matches role filters
-    """
-    if role not in ROLE_FILTERS:
-        return False
-    
-    for pattern in ROLE_FILTERS[role]:
-        if re.match(pattern, filename, re.IGNORECASE):
-            return True
-    return False
-
-
-def extract_action_from_filename(filename: str, role: str) -> Optional[str]:
-    """
-    Extract action name from filename based on role.
-    
-    Examples:
-        "discover-request.json" (BAP) -> "discover"
-        "discover-response.json" (BPP) -> "on_discover"
-        "cascaded-init-request.json" (UtilityBPP) -> "init"
-    """
-    # Remove .json extension
-    name = filename.replace('.json', '')
-    
-    # Handle P2P trading flat structure - strict role-based matching
-    if role == "BAP":
-        # BAP only matches *-request.json (not *-response.json)
-        if name.endswith('-request'):
-            action = name.replace('-request', '')
-            if action in BAP_ACTIONS:
-                return action
-        # Also handle cascaded requests for BAP (though typically UtilityBPP)
-        if name.startswith('cascaded-') and name.endswith('-request'):
-            action = name.replace('cascaded-', '').replace('-request', '')
-            if action in BAP_ACTIONS:
-                return action
-    
-    elif role == "BPP":
-        # BPP only matches *-response.json (not *-request.json)
-        if name.endswith('-response'):
-            # For responses, the action in filename is the request action
-            # We need to convert to BPP action (e.g., "discover" -> "on_discover")
-            request_action = name.replace('-response', '')
-            # Check if it's a direct BPP action
-            if request_action in BPP_ACTIONS:
-                return request_action
-            # Convert request action to response action
-            if request_action in BAP_ACTIONS:
-                return f"on_{request_action}"
-        # Handle cascaded responses
-        if name.startswith('cascaded-') and name.endswith('-response'):
-            request_action = name.replace('cascaded-', '').replace('-response', '')
-            if request_action in BAP_ACTIONS:
-                return f"on_{request_action}"
-    
-    elif role == "UtilityBPP":
-        # UtilityBPP matches cascaded-*-request.json
-        if name.startswith('cascaded-') and name.endswith('-request'):
-            action = name.replace('cascaded-', '').replace('-request', '')
-            if action in BAP_ACTIONS:
-                return action
-    
-    return None
-
-
-def extract_action_from_folder(folder_name: str, role: str) -> Optional[str]:
-    """
-    Extract action name from folder name (for folder-based structure).
-    
-    Examples:
-        "01_discover" (BAP) -> "discover"
-        "02_on_discover" (BPP) -> "on_discover"
-        "03_select" (BAP) -> "select"
-    """
-    # Remove leading numbers and underscores
-    match = re.match(r'^\d+_(.+)', folder_name)
-    if match:
-        action = match.group(1)
-        
-        if role == "BAP":
-            # BAP uses regular actions
-            if action in BAP_ACTIONS:
-                return action
-        elif role == "BPP":
-            # BPP uses on_* actions
-            if action in BPP_ACTIONS:
-                return action
-        elif role == "UtilityBPP":
-            # UtilityBPP uses cascaded actions (same as BAP actions)
-            if action in BAP_ACTIONS:
-                return action
-    
-    return None
-
-
 def get_request_name(filename: str) -> str:
     """
     Use filename directly as request name (remove .json extension).
@@ -275,8 +218,17 @@ def get_request_name(filename: str) -> str:
 def load_example_json(filepath: Path) -> Optional[Dict[str, Any]]:
     """Load and parse JSON example file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        content = filepath.read_bytes()
+    except Exception as e:
+        print(f"  Error reading {filepath.name}: {e}, skipping")
+        return None
+    return parse_example_json(filepath, content)
+
+
+def parse_example_json(filepath: Path, content: bytes) -> Optional[Dict[str, Any]]:
+    """Parse the content of a JSON example file, or return None if it is not a Beckn message."""
+    try:
+        data = json.loads(content)
         
         # Validate structure
         if not isinstance(data, dict):
@@ -288,12 +240,9 @@ def load_example_json(filepath: Path) -> Optional[Dict[str, Any]]:
             return None
         
         return data
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"  Error: {filepath.name} is not valid JSON: {e}, skipping")
         return None
-    except Exception as e:
-        print(f"  Error reading {filepath.name}: {e}, skipping")
-        return None
 
 
 def replace_context_macros(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -408,69 +357,188 @@ def create_postman_request(
     }
 
 
-def scan_examples_directory(examples_dir: Path, structure: str, role: str) -> Dict[str, List[Tuple[Path, str]]]:
+def scan_examples_directory(examples_dir: Path, structure: str, role: str, devkit: Optional[str] = None) -> Dict[str, List[Tuple[Path, str]]]:
     """
-    Scan examples directory and group JSON files by action.
+    Group the JSON examples of a role in an examples directory by action.
+    
+    The examples come from the example index (see example_index.py), so a directory is
+    only listed once per run however many roles are generated from it.
     
     Args:
         examples_dir: Path to examples directory
         structure: "folders" or "flat"
         role: "BAP", "BPP", or "UtilityBPP"
+        devkit: Devkit the examples belong to, recorded in the index (optional)
     
     Returns: {action: [(filepath, request_name)]}
     """
-    actions_map = {}
-    
     if not examples_dir.exists():
         print(f"Error: Examples directory not found: {examples_dir}")
-        return actions_map
+        return {}
     
-    if structure == "folders":
-        # Folder-based structure (ev-charging)
-        for item in examples_dir.iterdir():
-            if not item.is_dir():
-                continue
-            
-            action = extract_action_from_folder(item.name, role)
-            if action is None:
-                continue
-            
-            # Find all JSON files in this folder
-            json_files = list(item.glob("*.json"))
-            for json_file in json_files:
-                # For folder-based structure, we trust the folder name for role filtering
-                # But we can still check filename as secondary filter
-                request_name = get_request_name(json_file.name)
-                if action not in actions_map:
-                    actions_map[action] = []
-                actions_map[action].append((json_file, request_name))
-        
-        for action, files in actions_map.items():
-            print(f"Found {len(files)} example(s) for action '{action}'")
+    index = get_example_index()
+    index.scan(examples_dir, structure, devkit)
+    actions_map = {
+        action: [(json_file, get_request_name(json_file.name)) for json_file in json_files]
+        for action, json_files in index.by_action(examples_dir, role).items()
+    }
     
-    else:
-        # Flat structure (p2p-trading)
-        json_files = list(examples_dir.glob("*.json"))
-        for json_file in json_files:
-            # Check if file matches role filter
-            if not matches_role_filter(json_file.name, role):
-                continue
-            
-            action = extract_action_from_filename(json_file.name, role)
-            if action is None:
-                continue
-            
-            request_name = get_request_name(json_file.name)
-            if action not in actions_map:
-                actions_map[action] = []
-            actions_map[action].append((json_file, request_name))
-        
-        for action, files in actions_map.items():
-            print(f"Found {len(files)} example(s) for action '{action}'")
+    for action, files in actions_map.items():
+        print(f"Found {len(files)} example(s) for action '{action}'")
     
     return actions_map
 
 
+def get_example_index() -> ExampleIndex:
+    """Return the example index of this run, loading it from the configured file on first use."""
+    global _example_index
+    if _example_index is None:
+        _example_index = ExampleIndex(_example_index_config["path"])
+    return _example_index
+
+
+def configure_example_index(path: Optional[str] = DEFAULT_INDEX_PATH) -> None:
+    """Set the example index file (None keeps the index in memory only)."""
+    global _example_index
+    _example_index_config["path"] = path
+    _example_index = None
+
+
+def load_generation_manifest(path: Path) -> Dict[str, Any]:
+    """Load the generation manifest, or return an empty one if it is missing, unreadable or outdated."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and manifest.get("version") == GENERATOR_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": GENERATOR_VERSION, "collections": {}}
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Atomically write text to path unless the file already holds exactly that text.
+    
+    The file keeps the permissions of the one it replaces; a new file gets 0666 less the
+    umask, as open() would create it.
+    
+    Returns:
+        True if the file was written
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp creates the file 0600
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def stable_postman_id(output_path: Path, devkit: str, role: str, collection_name: str) -> str:
+    """
+    Return the _postman_id for a collection: the one already in output_path if there is one,
+    otherwise a UUID derived from the devkit, role and name, so regeneration never changes it.
+    """
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            postman_id = json.load(f)["info"]["_postman_id"]
+        if isinstance(postman_id, str) and postman_id:
+            return postman_id
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return str(uuid.uuid5(POSTMAN_ID_NAMESPACE, f"{devkit}/{role}/{collection_name}"))
+
+
+def build_request_cached(
+    json_file: Path,
+    key: List[str],
+    previous: Dict[str, Any],
+    current: Dict[str, Any],
+    action: str,
+    endpoint: str,
+    request_name: str,
+    role: str,
+    adapter_url_var: str,
+    parsed_examples: Optional[Dict[str, Tuple[str, Optional[Dict[str, Any]]]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the Postman request for an example, reusing the manifest's item if the example is unchanged.
+    
+    An example whose size and mtime match its manifest entry is not read at all; one whose
+    content hash matches is not parsed. The entry for the example is stored in current.
+    Examples in parsed_examples (see parse_examples) are not read or parsed again.
+    
+    Args:
+        json_file: Example JSON file
+        key: Inputs besides the file that the item depends on (action, endpoint, ...)
+        previous: Manifest entries from the last run, by example path
+        current: Manifest entries for this run (mutated in place)
+        action, endpoint, request_name, role, adapter_url_var: As for create_postman_request
+        parsed_examples: Optional {example path: (content hash, parsed example or None)}
+    
+    Returns:
+        The Postman request, or None if the example is not a valid Beckn message
+    """
+    path = str(json_file.resolve())
+    entry = previous.get(path)
+    if entry is not None and entry.get("key") != key:
+        entry = None
+    try:
+        stat = json_file.stat()
+    except OSError:
+        stat = None
+    if entry is not None and stat is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        current[path] = entry
+        return entry["item"]
+    
+    print(f"  Processing: {json_file.name}")
+    indexed = parsed_examples.get(path) if parsed_examples is not None else None
+    if indexed is not None:
+        content_hash, json_data = indexed
+    else:
+        try:
+            content = json_file.read_bytes()
+        except OSError as e:
+            print(f"  Error reading {json_file.name}: {e}, skipping")
+            return None
+        content_hash = hashlib.sha256(content).hexdigest()
+        json_data = None
+    if entry is not None and entry["sha256"] == content_hash:
+        item = entry["item"]
+    else:
+        if indexed is None:
+            json_data = parse_example_json(json_file, content)
+        if json_data is None:
+            return None
+        item = create_postman_request(json_data, action, endpoint, request_name, role, adapter_url_var)
+    current[path] = {
+        "key": key,
+        "mtime_ns": stat.st_mtime_ns if stat is not None else None,
+        "size": stat.st_size if stat is not None else None,
+        "sha256": content_hash,
+        "item": item,
+    }
+    return item
+
+
 def get_collection_variables(devkit: str, role: str) -> List[Dict[str, str]]:
     """Get collection variables based on devkit and role."""
     config = DEVKIT_CONFIGS[devkit]
@@ -504,11 +572,15 @@ def generate_collection(
     devkit: str,
     role: str,
     collection_name: Optional[str] = None,
-    collection_description: Optional[str] = None
-) -> None:
+    collection_description: Optional[str] = None,
+    manifest: Optional[Dict[str, Any]] = None,
+    parsed_examples: Optional[Dict[str, Tuple[str, Optional[Dict[str, Any]]]]] = None
+) -> Optional[Path]:
     """
     Generate Postman collection from examples.
     
+    The output file is only written when its content changes, and keeps its _postman_id.
+    
     Args:
         examples_dir: Path to examples directory
         output_path: Output path for collection
@@ -516,6 +588,12 @@ def generate_collection(
         role: "BAP", "BPP", or "UtilityBPP"
         collection_name: Optional collection name (auto-generated if None)
         collection_description: Optional description (auto-generated if None)
+        manifest: Optional manifest from load_generation_manifest; items of unchanged
+            examples are reused from it, and it is updated in place
+        parsed_examples: Optional examples parsed in advance, from parse_examples
+    
+    Returns:
+        output_path, or None if no examples were found
     """
     config = DEVKIT_CONFIGS[devkit]
     structure = config["structure"]
@@ -549,7 +627,7 @@ def generate_collection(
     print(f"Scanning examples directory: {examples_dir}")
     print(f"Devkit: {devkit}, Role: {role}, Structure: {structure}")
     
-    actions_map = scan_examples_directory(examples_dir, structure, role)
+    actions_map = scan_examples_directory(examples_dir, structure, role, devkit)
     
     if not actions_map:
         print("No valid examples found. Exiting.")
@@ -557,6 +635,10 @@ def generate_collection(
     
     # Build collection items (folders)
     collection_items = []
+    previous_examples = {}
+    current_examples = {}
+    if manifest is not None:
+        previous_examples = manifest["collections"].get(str(output_path.resolve()), {}).get("examples", {})
     
     # Process each action in order (include all BAP actions, even if no examples)
     all_actions = sorted(set(list(actions_map.keys()) + list(action_mapping.keys())))
@@ -572,17 +654,14 @@ def generate_collection(
         action_items = []
         
         for json_file, request_name in sorted(files_list):
-            print(f"  Processing: {json_file.name}")
-            
-            # Load JSON
-            json_data = load_example_json(json_file)
-            if json_data is None:
-                continue
-            
-            # Create Postman request
-            request = create_postman_request(
-                json_data, action, endpoint, request_name, role, adapter_url_var
+            # Create Postman request (reused from the manifest if the example is unchanged)
+            request = build_request_cached(
+                json_file, [action, endpoint, request_name, role, adapter_url_var],
+                previous_examples, current_examples,
+                action, endpoint, request_name, role, adapter_url_var, parsed_examples
             )
+            if request is None:
+                continue
             action_items.append(request)
         
         # Create folder even if empty (for actions with no examples yet, like status)
@@ -599,7 +678,7 @@ def generate_collection(
     # Build collection
     collection = {
         "info": {
-            "_postman_id": str(uuid.uuid4()),
+            "_postman_id": stable_postman_id(output_path, devkit, role, collection_name),
             "name": collection_name,
             "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
             "description": collection_description
@@ -617,18 +696,157 @@ def generate_collection(
         "variable": get_collection_variables(devkit, role)
     }
     
-    # Write output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(collection, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n✓ Generated Postman collection: {output_path}")
+    # Write output, leaving the file (and its mtime) alone if nothing changed
+    if manifest is not None:
+        manifest["collections"][str(output_path.resolve())] = {"examples": current_examples}
+    if write_if_changed(output_path, json.dumps(collection, indent=2, ensure_ascii=False)):
+        print(f"\n✓ Generated Postman collection: {output_path}")
+    else:
+        print(f"\n✓ Postman collection unchanged: {output_path}")
     print(f"  Total folders: {len(collection_items)}")
     print(f"  Total requests: {sum(len(item['item']) for item in collection_items)}")
     
     return output_path
 
 
+def parse_examples(json_files: List[Path], manifest: Optional[Dict[str, Any]] = None) -> Dict[str, Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Read and parse each example once, for sharing between the collections built from it.
+    
+    Examples whose size and mtime match an entry in the manifest are left out: their items
+    are reused from the manifest without reading them.
+    
+    Args:
+        json_files: Example JSON files (duplicates are read once)
+        manifest: Optional manifest from load_generation_manifest
+    
+    Returns:
+        {example path: (content hash, parsed example, or None if it is not a Beckn message)}
+    """
+    unchanged = set()
+    if manifest is not None:
+        for collection in manifest["collections"].values():
+            for path, entry in collection.get("examples", {}).items():
+                unchanged.add((path, entry.get("mtime_ns"), entry.get("size")))
+    
+    index = {}
+    for json_file in json_files:
+        path = str(json_file.resolve())
+        if path in index:
+            continue
+        try:
+            stat = json_file.stat()
+            if (path, stat.st_mtime_ns, stat.st_size) in unchanged:
+                continue
+            content = json_file.read_bytes()
+        except OSError:
+            # Not indexed; build_request_cached reports the error
+            continue
+        index[path] = (hashlib.sha256(content).hexdigest(), parse_example_json(json_file, content))
+    return index
+
+
+# Parsed examples and manifest shared with batch generation workers (set by _init_batch_worker)
+_batch_state = {}
+
+
+def _init_batch_worker(index, parsed_examples, manifest):
+    """Initializer for batch generation worker processes."""
+    global _example_index
+    _example_index = index
+    _batch_state["parsed_examples"] = parsed_examples
+    _batch_state["manifest"] = manifest
+
+
+def _generate_collection_in_worker(task):
+    """Generate one collection of a batch, capturing its output so it can be printed in order."""
+    examples_dir, output_path, devkit, role = task
+    manifest = _batch_state["manifest"]
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = generate_collection(examples_dir, output_path, devkit, role, manifest=manifest,
+                                     parsed_examples=_batch_state["parsed_examples"])
+    section = None
+    if manifest is not None and result is not None:
+        section = manifest["collections"].get(str(output_path.resolve()))
+    return output.getvalue(), result, section
+
+
+def generate_all_collections(
+    repo_root_dir: Path,
+    output_dir: Path,
+    manifest: Optional[Dict[str, Any]] = None,
+    jobs: int = 1
+) -> List[Path]:
+    """
+    Generate the collection for every devkit in DEVKIT_CONFIGS and each of its roles.
+    
+    All examples are parsed once, up front, and shared by the collections built from them.
+    The collections are then built in worker processes, with each one's output printed in
+    order. Roles without examples are skipped.
+    
+    Args:
+        repo_root_dir: Repository root, which examples paths are relative to
+        output_dir: Directory for the collections, named
+            <devkit>:<role>-DEG.postman_collection.json
+        manifest: Optional manifest from load_generation_manifest (updated in place)
+        jobs: Number of worker processes (1 generates in this process)
+    
+    Returns:
+        Paths of the generated collections
+    
+    Raises:
+        FileNotFoundError: If a devkit's examples directory does not exist
+    """
+    missing = [
+        str(repo_root_dir / config["examples_path"]) for config in DEVKIT_CONFIGS.values()
+        if not (repo_root_dir / config["examples_path"]).is_dir()
+    ]
+    if missing:
+        raise FileNotFoundError(f"Examples directory not found: {', '.join(missing)}")
+    
+    tasks = []
+    json_files = []
+    for devkit, config in DEVKIT_CONFIGS.items():
+        examples_dir = repo_root_dir / config["examples_path"]
+        for role in config["roles"]:
+            # Only decides what to parse; generate_collection looks the examples up again
+            with contextlib.redirect_stdout(io.StringIO()):
+                actions_map = scan_examples_directory(examples_dir, config["structure"], role, devkit)
+            for files in actions_map.values():
+                json_files.extend(json_file for json_file, _ in files)
+            output_path = output_dir / f"{devkit}:{role}-DEG.postman_collection.json"
+            tasks.append((examples_dir, output_path, devkit, role))
+    
+    parsed_examples = parse_examples(sorted(json_files), manifest)
+    print(f"Parsed {len(parsed_examples)} example(s) for {len(tasks)} collection(s)\n")
+    
+    if jobs > 1 and len(tasks) > 1:
+        sys.stdout.flush()
+        pool = multiprocessing.Pool(min(jobs, len(tasks)), _init_batch_worker,
+                                    (get_example_index(), parsed_examples, manifest))
+    else:
+        _init_batch_worker(get_example_index(), parsed_examples, manifest)
+        pool = None
+    generated = []
+    try:
+        results = pool.imap(_generate_collection_in_worker, tasks) if pool else map(_generate_collection_in_worker, tasks)
+        for task, (output, result, section) in zip(tasks, results):
+            print("-" * 60)
+            sys.stdout.write(output)
+            if result is None:
+                continue
+            if section is not None:
+                manifest["collections"][str(result.resolve())] = section
+            generated.append(result)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _batch_state.clear()
+    return generated
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -638,15 +856,21 @@ def main():
         "--devkit",
         type=str,
         choices=["ev-charging", "p2p-trading"],
-        required=True,
-        help="Devkit type: 'ev-charging' or 'p2p-trading'"
+        default=None,
+        help="Devkit type: 'ev-charging' or 'p2p-trading' (required unless --all)"
     )
     parser.add_argument(
         "--role",
         type=str,
         choices=["BAP", "BPP", "UtilityBPP"],
-        required=True,
-        help="Role: 'BAP', 'BPP', or 'UtilityBPP'"
+        default=None,
+        help="Role: 'BAP', 'BPP', or 'UtilityBPP' (required unless --all)"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        default=False,
+        help="Generate the collections for every devkit and role, and validate them together"
     )
     parser.add_argument(
         "--examples",
@@ -659,7 +883,7 @@ def main():
         type=str,
         required=True,
         dest="output_dir",
-        help="Output directory for Postman collection (required)"
+        help="Output directory for Postman collection(s) (required)"
     )
     parser.add_argument(
         "--name",
@@ -685,62 +909,151 @@ def main():
         action="store_false",
         help="Skip schema validation"
     )
+    parser.add_argument(
+        "--bundle",
+        type=str,
+        default=None,
+        help="Schema bundle from `validate_schema.py bundle` to validate against (avoids parsing schemas)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for validating distinct request bodies, or with --all for generating and "
+             "validating the collections; 0 uses all CPUs (default: 1, or 0 with --all)"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=DEFAULT_GENERATION_MANIFEST,
+        help="Manifest of examples and generated items for incremental regeneration (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-manifest",
+        dest="manifest",
+        action="store_const",
+        const=None,
+        help="Rebuild every item from its example and validate the whole collection"
+    )
+    parser.add_argument(
+        "--example-index",
+        type=str,
+        default=DEFAULT_INDEX_PATH,
+        help="Index of examples by role and action, from example_index.py (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-example-index",
+        dest="example_index",
+        action="store_const",
+        const=None,
+        help="Classify the examples without reading or writing the example index"
+    )
     
     args = parser.parse_args()
+    if args.all:
+        if args.devkit or args.role or args.examples or args.name or args.description:
+            parser.error("--all cannot be combined with --devkit, --role, --examples, --name or --description")
+    elif not (args.devkit and args.role):
+        parser.error("--devkit and --role are required unless --all is given")
+    if args.jobs is None:
+        args.jobs = 0 if args.all else 1
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     
-    # Get devkit configuration
-    config = DEVKIT_CONFIGS[args.devkit]
+    configure_example_index(args.example_index)
     
     # Convert to Path objects
     repo_root_dir = Path(__file__).parent.parent
+    manifest = load_generation_manifest(Path(args.manifest)) if args.manifest else None
     
-    # Use provided paths or defaults from config
-    examples_dir = repo_root_dir / (args.examples or config["examples_path"])
-    
-    # Generate collection name if not provided
-    if args.name is None:
-        collection_name = f"{args.devkit}:{args.role}-DEG"
+    if args.all:
+        print("=" * 60)
+        print(f"Postman Collection Generator")
+        print(f"All devkits and roles ({jobs} job(s))")
+        print("=" * 60)
+        print()
+        
+        try:
+            output_paths = generate_all_collections(repo_root_dir, repo_root_dir / args.output_dir, manifest, jobs)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
     else:
-        collection_name = args.name
-    
-    # Construct output filename from collection name
-    filename = f"{collection_name}.postman_collection.json"
-    output_path = repo_root_dir / args.output_dir / filename
-    
-    print("=" * 60)
-    print(f"Postman Collection Generator")
-    print(f"Devkit: {args.devkit}, Role: {args.role}")
-    print("=" * 60)
-    print()
-    
-    output_path = generate_collection(
-        examples_dir=examples_dir,
-        output_path=output_path,
-        devkit=args.devkit,
-        role=args.role,
-        collection_name=collection_name,
-        collection_description=args.description
-    )
+        # Get devkit configuration
+        config = DEVKIT_CONFIGS[args.devkit]
+        
+        # Use provided paths or defaults from config
+        examples_dir = repo_root_dir / (args.examples or config["examples_path"])
+        
+        # Generate collection name if not provided
+        if args.name is None:
+            collection_name = f"{args.devkit}:{args.role}-DEG"
+        else:
+            collection_name = args.name
+        
+        # Construct output filename from collection name
+        filename = f"{collection_name}.postman_collection.json"
+        output_path = repo_root_dir / args.output_dir / filename
+        
+        print("=" * 60)
+        print(f"Postman Collection Generator")
+        print(f"Devkit: {args.devkit}, Role: {args.role}")
+        print("=" * 60)
+        print()
+        
+        output_path = generate_collection(
+            examples_dir=examples_dir,
+            output_path=output_path,
+            devkit=args.devkit,
+            role=args.role,
+            collection_name=collection_name,
+            collection_description=args.description,
+            manifest=manifest
+        )
+        output_paths = [output_path] if output_path is not None else []
+    if manifest is not None:
+        write_if_changed(Path(args.manifest), json.dumps(manifest, separators=(",", ":")))
+    get_example_index().save()
     
-    # Validate collection if requested
-    if args.validate:
+    # Validate collection(s) if requested, all against one schema store
+    if args.validate and output_paths:
         if get_schema_store is None or process_file is None:
             print("\n⚠ Warning: Schema validation module not available, skipping validation")
         else:
             print("\n" + "=" * 60)
-            print("Validating Postman collection against schema...")
+            print(f"Validating {len(output_paths)} Postman collection(s) against schema...")
             print("=" * 60)
             try:
-                schema_store, attributes_schema, attribute_schemas_map = get_schema_store()
-                process_file(str(output_path), schema_store, attributes_schema, attribute_schemas_map)
-                print("\n✓ Schema validation completed")
+                if args.bundle:
+                    schema_store, attributes_schema, attribute_schemas_map = load_schema_bundle(args.bundle)
+                else:
+                    schema_store, attributes_schema, attribute_schemas_map = get_schema_store()
+                files = [str(path) for path in output_paths]
+                if manifest is not None:
+                    # Skips collections if neither they nor their schemas changed since they were last validated
+                    validation_manifest_path = os.path.join(DEFAULT_CACHE_DIR, DEFAULT_MANIFEST_NAME)
+                    validation_manifest = load_manifest(validation_manifest_path)
+                    results = process_files_incremental(files, schema_store, attributes_schema,
+                                                        attribute_schemas_map, validation_manifest, jobs=jobs)
+                    save_manifest(validation_manifest_path, validation_manifest)
+                elif len(files) == 1:
+                    results = {files[0]: process_file(files[0], schema_store, attributes_schema, attribute_schemas_map, jobs=jobs)}
+                else:
+                    # The collections' schemas are fetched and compiled once, then shared by the workers
+                    results = process_files(files, schema_store, attributes_schema, attribute_schemas_map, jobs=jobs)
+                total_errors = 0
+                for filepath, errors in results.items():
+                    if len(files) > 1:
+                        print(f"\n{filepath}: {len(errors)} error(s)")
+                    for error in errors:
+                        print(f"  {error}")
+                    total_errors += len(errors)
+                print(f"\n✓ Schema validation completed ({total_errors} error(s))")
             except Exception as e:
                 print(f"\n⚠ Warning: Schema validation failed: {e}")
                 import traceback
                 traceback.print_exc()
                 print("  Collection was still generated successfully")
 
-
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Beckn Mock Network Participant
+
+This script stands in for the BPP (or BAP) backend behind a devkit's ONIX adapter, so the
+adapters can be load-tested without a real CPO or BAP application. As a BPP it answers every
+action it receives with the matching on_<action> callback built from the repo's examples;
+as a BAP it acknowledges the callbacks it receives.
+
+It replaces the sandbox containers of testnet/ev-charging-devkit: the BPP adapter forwards
+actions to sandbox-bpp (port 3002, .../api/webhook/<action>) and the BAP adapter forwards
+callbacks to sandbox-bap (port 3001, .../api/bap-webhook/<on_action>).
+
+WHAT IT DOES
+------------
+1) Loads the devkit's on_<action> examples from the example index (example_index.py): the
+   NN_on_<action> folders for ev-charging, the *-response.json files for P2P trading
+2) Listens for POST <any path>/<action> (the action is the last path segment, or else
+   context.action) and responds ACK at once, over keep-alive HTTP/1.1
+3) As a BPP, after --delay (plus up to --jitter) seconds, POSTs the on_<action> callback to
+   <callback-url>/on_<action>. The callback is the example with its context rewritten to
+   echo the caller's transaction_id, message_id, domain, version and BAP/BPP ids and URIs,
+   with a new timestamp. Actions with several examples use them in turn.
+4) Injects failures on request: --nack-rate answers NACK (and sends no callback),
+   --error-rate sends the callback with an error object
+5) On exit (Ctrl-C, or after --duration), reports per action: requests received, NACKs,
+   callbacks sent and failed, and the rates
+
+Requests are handled on one asyncio event loop with no per-request parsing beyond the
+JSON body, so one process sustains thousands of transactions per second on one core.
+GET /api/health answers 200, like the sandbox containers.
+
+CLI USAGE
+---------
+# Mock BPP for the ev-charging devkit, calling back through the local BPP adapter:
+python3 scripts/mock_participant.py --devkit ev-charging --port 3002 \\
+  --callback-url http://localhost:8082/bpp/caller
+
+# Mock BAP that acknowledges callbacks:
+python3 scripts/mock_participant.py --devkit ev-charging --role BAP --port 3001
+
+# A whole flow on one machine, without adapters: replay_flows.py -> mock BPP (50 ms callbacks,
+# 1% NACKs) -> mock BAP
+python3 scripts/mock_participant.py --devkit ev-charging --role BAP --port 3001 &
+python3 scripts/mock_participant.py --devkit ev-charging --delay 0.05 --nack-rate 0.01 \\
+  --callback-url http://localhost:3001/api/bap-webhook &
+python3 scripts/replay_flows.py --devkit ev-charging --bap-adapter-url http://localhost:3002/api/webhook
+
+Arguments:
+- --devkit        Devkit whose examples to answer with (e.g. ev-charging)
+- --role          BPP (answer actions with callbacks) or BAP (acknowledge callbacks; default: BPP)
+- --host          Interface to listen on (default: 127.0.0.1)
+- --port          TCP port to listen on (default: 3002 for BPP, 3001 for BAP)
+- --callback-url  Where callbacks are sent (default: the devkit's bpp_adapter_url)
+- --delay         Seconds before sending each callback (default: 0)
+- --jitter        Up to this many extra seconds, at random (default: 0)
+- --nack-rate     Fraction of requests answered with NACK (default: 0)
+- --error-rate    Fraction of callbacks sent with an error object (default: 0)
+- --connections   Keep-alive connections for sending callbacks (default: 64)
+- --duration      Stop after this many seconds (default: run until interrupted)
+- --output        Write the report as JSON
+- --example-index Example index file (default: ~/.cache/beckn-examples/index.json)
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Import the example index and the replay tool's HTTP client
+try:
+    # Try importing as modules (if scripts directory is in path)
+    import example_index
+    import generate_postman_collection
+    import replay_flows
+except ImportError:
+    # If running as a script, import from same directory
+    import importlib.util
+    for _module_name in ("example_index", "generate_postman_collection", "replay_flows"):
+        _spec = importlib.util.spec_from_file_location(_module_name, Path(__file__).parent / f"{_module_name}.py")
+        _module = importlib.util.module_from_spec(_spec)
+        sys.modules[_module_name] = _module
+        _spec.loader.exec_module(_module)
+    import example_index
+    import generate_postman_collection
+    import replay_flows
+
+
+# Context fields copied from the incoming request into its callback
+ECHOED_CONTEXT_KEYS = ("domain", "version", "bap_id", "bap_uri", "bpp_id", "bpp_uri", "transaction_id", "message_id")
+
+# Error object of callbacks selected by --error-rate
+INJECTED_ERROR = {"code": "30000", "message": "Error injected by mock_participant.py"}
+
+DEFAULT_PORTS = {"BPP": 3002, "BAP": 3001}
+
+ACK_BODY = json.dumps({"message": {"ack": {"status": "ACK"}}}).encode("utf-8")
+NACK_BODY = json.dumps({"message": {"ack": {"status": "NACK"}}, "error": INJECTED_ERROR}).encode("utf-8")
+HEALTH_BODY = json.dumps({"status": "ok"}).encode("utf-8")
+
+
+def build_callback_template(example: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split a callback example into its context and the pre-serialized rest of the message.
+
+    Returns:
+        {"context": example context, "rest": JSON members after the context,
+         "rest_with_error": the same with INJECTED_ERROR added}
+    """
+    rest = {key: value for key, value in example.items() if key != "context"}
+    with_error = {**rest, "error": INJECTED_ERROR}
+    return {
+        "context": example.get("context") or {},
+        "rest": json.dumps(rest, separators=(",", ":"))[1:-1],
+        "rest_with_error": json.dumps(with_error, separators=(",", ":"))[1:-1],
+    }
+
+
+def render_callback(template: Dict[str, Any], action: str, request_context: Dict[str, Any], error: bool = False) -> bytes:
+    """
+    Build the body of the on_<action> callback to a request.
+
+    The example's context is kept, except for ECHOED_CONTEXT_KEYS (copied from the
+    request), the action and the timestamp.
+    """
+    context = dict(template["context"])
+    for key in ECHOED_CONTEXT_KEYS:
+        if key in request_context:
+            context[key] = request_context[key]
+    context["action"] = action
+    context["timestamp"] = replay_flows.iso_timestamp()
+    rest = template["rest_with_error"] if error else template["rest"]
+    return ('{"context":' + json.dumps(context, separators=(",", ":")) + ("," + rest if rest else "") + "}").encode("utf-8")
+
+
+def load_callback_templates(devkit: str, index: Optional["example_index.ExampleIndex"] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load the devkit's BPP examples as callback templates.
+
+    Returns:
+        {on_action: [templates from build_callback_template]}
+    """
+    source = example_index.EXAMPLE_SOURCES[devkit]
+    examples_dir = example_index.REPO_ROOT / source["path"]
+    if index is None:
+        index = example_index.ExampleIndex(None)
+    index.scan(examples_dir, source["layout"], devkit)
+    templates = {}
+    for action, paths in index.by_action(examples_dir, "BPP").items():
+        for path in paths:
+            example = generate_postman_collection.load_example_json(path)
+            if example is not None:
+                templates.setdefault(action, []).append(build_callback_template(example))
+    return templates
+
+
+class CallbackSender:
+    """Posts callbacks over a bounded pool of keep-alive connections to one adapter."""
+
+    def __init__(self, url: str, connections: int = 64, timeout: float = 10.0):
+        self.url = url.rstrip("/")
+        self.path = urlsplit(self.url).path
+        self.timeout = timeout
+        self.idle = []
+        self.slots = asyncio.Semaphore(connections)
+
+    async def post(self, action: str, body: bytes) -> int:
+        """POST a callback to <url>/<action> and return the response status."""
+        async with self.slots:
+            connection = self.idle.pop() if self.idle else replay_flows.HTTPConnection(self.url)
+            try:
+                status, _ = await asyncio.wait_for(
+                    connection.request("POST", f"{self.path}/{action}", body, {"Content-Type": "application/json"}),
+                    self.timeout)
+            except BaseException:
+                connection.close()
+                raise
+            self.idle.append(connection)
+            return status
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        for connection in self.idle:
+            connection.close()
+        self.idle = []
+
+
+class MockParticipant:
+    """
+    Mock BPP or BAP backend: acknowledges requests and, as a BPP, sends their callbacks.
+
+    Args:
+        role: "BPP" or "BAP"
+        templates: Callback templates from load_callback_templates (BPP only)
+        sender: CallbackSender for the callbacks (BPP only)
+        delay, jitter: Seconds before each callback, plus up to jitter at random
+        nack_rate: Fraction of requests answered with NACK
+        error_rate: Fraction of callbacks sent with an error object
+    """
+
+    def __init__(self, role: str, templates: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 sender: Optional[CallbackSender] = None, delay: float = 0.0, jitter: float = 0.0,
+                 nack_rate: float = 0.0, error_rate: float = 0.0):
+        self.role = role
+        self.templates = templates or {}
+        self.sender = sender
+        self.delay = delay
+        self.jitter = jitter
+        self.nack_rate = nack_rate
+        self.error_rate = error_rate
+        self.actions = set(example_index.BAP_ACTIONS if role == "BPP" else example_index.BPP_ACTIONS)
+        self.stats = {}
+        self.turns = {}
+        self.pending = set()
+        self.connections = {}
+
+    def _action_stats(self, action: str) -> Dict[str, int]:
+        action_stats = self.stats.get(action)
+        if action_stats is None:
+            action_stats = self.stats[action] = {"received": 0, "nacked": 0, "invalid": 0, "callbacks": 0,
+                                                 "callback_errors": 0, "no_example": 0}
+        return action_stats
+
+    def handle(self, target: str, body: bytes) -> Tuple[int, bytes]:
+        """
+        Handle one POST request and return (status, response body).
+
+        As a BPP, the callback is scheduled before the ACK is returned.
+        """
+        action = target.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+        try:
+            payload = json.loads(body)
+            context = payload.get("context")
+            if not isinstance(context, dict):
+                raise ValueError("missing context")
+        except (ValueError, AttributeError):
+            self._action_stats(action if action in self.actions else "(invalid)")["invalid"] += 1
+            return 400, NACK_BODY
+        if action not in self.actions:
+            action = context.get("action") if isinstance(context.get("action"), str) else action
+        action_stats = self._action_stats(action)
+        action_stats["received"] += 1
+        if self.nack_rate and random.random() < self.nack_rate:
+            action_stats["nacked"] += 1
+            return 200, NACK_BODY
+
+        if self.role == "BPP":
+            callback_action = f"on_{action}"
+            templates = self.templates.get(callback_action)
+            if templates:
+                turn = self.turns.get(callback_action, 0)
+                self.turns[callback_action] = turn + 1
+                error = bool(self.error_rate) and random.random() < self.error_rate
+                callback = render_callback(templates[turn % len(templates)], callback_action, context, error)
+                task = asyncio.ensure_future(self._send_callback(action_stats, callback_action, callback))
+                self.pending.add(task)
+                task.add_done_callback(self.pending.discard)
+            else:
+                action_stats["no_example"] += 1
+        return 200, ACK_BODY
+
+    async def _send_callback(self, action_stats: Dict[str, int], action: str, body: bytes) -> None:
+        delay = self.delay + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            status = await self.sender.post(action, body)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            action_stats["callback_errors"] += 1
+            return
+        if 200 <= status < 300:
+            action_stats["callbacks"] += 1
+        else:
+            action_stats["callback_errors"] += 1
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve keep-alive HTTP/1.1 requests on one connection until the client or run_mock closes it."""
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                parts = request_line.split()
+                if len(parts) < 2:
+                    break
+                headers = await replay_flows.read_http_headers(reader)
+                body = await replay_flows.read_http_body(reader, headers)
+                method, target = parts[0], parts[1].decode("latin-1")
+                if method == b"POST":
+                    status, response = self.handle(target, body)
+                elif method == b"GET" and target.rstrip("/").endswith("/health"):
+                    status, response = 200, HEALTH_BODY
+                else:
+                    status, response = 404, NACK_BODY
+                close = headers.get(b"connection") == b"close"
+                writer.write(b"HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n%s\r\n%s" % (
+                    status, b"OK" if status == 200 else b"Error", len(response),
+                    b"Connection: close\r\n" if close else b"", response))
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, asyncio.CancelledError):
+            # CancelledError: the event loop is shutting down with this connection still open
+            pass
+        finally:
+            self.connections.pop(task, None)
+            writer.close()
+
+    async def close_connections(self, timeout: float = 5.0) -> None:
+        """Close every open client connection and wait for its handler to finish."""
+        tasks = list(self.connections)
+        for writer in list(self.connections.values()):
+            writer.close()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+
+def mock_report(stats: Dict[str, Dict[str, int]], elapsed: float) -> Dict[str, Any]:
+    """Turn MockParticipant.stats into a JSON-serializable report, with actions in flow order."""
+    actions = []
+    for action in sorted(stats, key=lambda a: (example_index.flow_step(a) or sys.maxsize, a)):
+        actions.append({
+            "action": action,
+            **stats[action],
+            "received_per_s": round(stats[action]["received"] / elapsed, 1) if elapsed else None,
+        })
+    received = sum(entry["received"] for entry in actions)
+    return {
+        "received": received,
+        "nacked": sum(entry["nacked"] for entry in actions),
+        "callbacks": sum(entry["callbacks"] for entry in actions),
+        "callback_errors": sum(entry["callback_errors"] for entry in actions),
+        "duration_s": round(elapsed, 3),
+        "received_per_s": round(received / elapsed, 1) if elapsed else None,
+        "actions": actions,
+    }
+
+
+def write_mock_table(report: Dict[str, Any], out) -> None:
+    """Write a mock report as a table per action, followed by one line of totals."""
+    out.write(f"{'action':<14} {'received':>9} {'req/s':>9} {'nacked':>7} {'invalid':>8} "
+              f"{'callbacks':>10} {'failed':>7} {'no example':>11}\n")
+    for entry in report["actions"]:
+        out.write(f"{entry['action']:<14} {entry['received']:>9} {entry['received_per_s']:>9} {entry['nacked']:>7} "
+                  f"{entry['invalid']:>8} {entry['callbacks']:>10} {entry['callback_errors']:>7} {entry['no_example']:>11}\n")
+    out.write(f"{report['received']} request(s), {report['nacked']} NACKed; {report['callbacks']} callback(s), "
+              f"{report['callback_errors']} failed in {report['duration_s']:.2f}s ({report['received_per_s']} requests/s)\n")
+
+
+async def run_mock(participant: MockParticipant, host: str, port: int, duration: Optional[float] = None) -> float:
+    """
+    Serve until interrupted (SIGINT/SIGTERM) or for duration seconds, then wait for pending callbacks.
+
+    Returns:
+        Seconds served
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    server = await asyncio.start_server(participant.handle_connection, host, port, backlog=1024)
+    print(f"Mock {participant.role} listening on http://{host}:{port}", file=sys.stderr)
+    started = loop.time()
+    try:
+        if duration:
+            try:
+                await asyncio.wait_for(stop.wait(), duration)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await stop.wait()
+    finally:
+        server.close()
+        # Idle keep-alive connections would otherwise stay open until the loop cancels their handlers
+        await participant.close_connections()
+        await server.wait_closed()
+    elapsed = loop.time() - started
+    if participant.pending:
+        await asyncio.wait(participant.pending, timeout=participant.delay + participant.jitter + 10)
+    if participant.sender is not None:
+        participant.sender.close()
+    return elapsed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Mock BPP/BAP backend that answers actions with on_* callbacks built from the examples"
+    )
+    parser.add_argument("--devkit", choices=sorted(example_index.EXAMPLE_SOURCES), required=True,
+                        help="Devkit whose examples to answer with")
+    parser.add_argument("--role", choices=sorted(DEFAULT_PORTS), default="BPP",
+                        help="BPP answers actions with callbacks, BAP acknowledges callbacks (default: %(default)s)")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=None, help="TCP port to listen on (default: 3002 for BPP, 3001 for BAP)")
+    parser.add_argument("--callback-url", default=None, help="Where callbacks are sent (default: the devkit's bpp_adapter_url)")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds before sending each callback (default: %(default)s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra seconds per callback (default: %(default)s)")
+    parser.add_argument("--nack-rate", type=float, default=0.0, help="Fraction of requests answered with NACK (default: %(default)s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of callbacks sent with an error (default: %(default)s)")
+    parser.add_argument("--connections", type=int, default=64, help="Keep-alive connections for callbacks (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds (default: until interrupted)")
+    parser.add_argument("--output", default=None, help="Write the report as JSON to this file")
+    parser.add_argument("--example-index", default=example_index.DEFAULT_INDEX_PATH,
+                        help="Example index file (default: %(default)s)")
+
+    args = parser.parse_args()
+    port = args.port or DEFAULT_PORTS[args.role]
+
+    async def serve():
+        templates, sender = None, None
+        if args.role == "BPP":
+            index = example_index.ExampleIndex(args.example_index)
+            templates = load_callback_templates(args.devkit, index)
+            index.save()
+            if not templates:
+                print(f"Error: no BPP examples found for {args.devkit}", file=sys.stderr)
+                sys.exit(1)
+            callback_url = args.callback_url or generate_postman_collection.DEVKIT_CONFIGS[args.devkit]["bpp_adapter_url"]
+            sender = CallbackSender(callback_url, args.connections)
+            print(f"Callbacks ({', '.join(sorted(templates))}) go to {callback_url}", file=sys.stderr)
+        participant = MockParticipant(args.role, templates, sender, args.delay, args.jitter, args.nack_rate, args.error_rate)
+        return participant, await run_mock(participant, args.host, port, args.duration)
+
+    participant, elapsed = asyncio.run(serve())
+    report = mock_report(participant.stats, elapsed)
+    write_mock_table(report, sys.stdout)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Wrote mock report: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
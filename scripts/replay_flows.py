@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Beckn Flow Replay
+
+This script replays the example flows in this repo against the local ONIX adapters of a
+devkit testnet, from many concurrent virtual users, and reports throughput and latency per
+action. It sends the same requests as the generated Postman collections (the examples, with
+their context rewritten by `replace_context_macros`), but concurrently over keep-alive
+connections instead of one at a time through Postman or newman.
+
+WHAT IT DOES
+------------
+1) Looks up the examples of the devkit and role in the example index (example_index.py)
+   and orders their actions by flow step (discover, select, init, confirm, ...)
+2) Turns each example into a request template with `replace_context_macros`, filling in
+   the devkit's collection variables (domain, bap_id, bap_uri, bpp_id, bpp_uri, version)
+3) Starts --concurrency virtual users. Each one repeatedly runs the whole flow as a new
+   transaction: every flow gets a fresh transaction_id, and every request a fresh
+   message_id and timestamp. Actions with several examples use them in turn.
+4) POSTs each request to <adapter_url>/<action> (bap_adapter_url for BAP requests,
+   bpp_adapter_url for BPP callbacks) over the virtual user's own keep-alive connection,
+   optionally paced to a total --rate of requests per second
+5) Reports requests, errors, NACKs, requests/s and latency percentiles for each action
+
+HTTP/1.1 is spoken directly over asyncio streams, so no HTTP client library is needed.
+A response is an error if its status is not 2xx or the request failed or timed out; a
+2xx response whose body contains "NACK" is counted as a NACK.
+
+CLI USAGE
+---------
+# Replay the ev-charging BAP flow with 50 virtual users for 30 seconds:
+python3 scripts/replay_flows.py --devkit ev-charging --concurrency 50 --duration 30
+
+# Replay the BPP callbacks at a fixed rate, against another adapter:
+python3 scripts/replay_flows.py --devkit ev-charging --role BPP --rate 200 \\
+  --bpp-adapter-url http://localhost:9082/bpp/caller
+
+Arguments:
+- --devkit           Devkit whose examples and variables to use (e.g. ev-charging)
+- --role             BAP (requests to bap_adapter_url) or BPP (callbacks to bpp_adapter_url)
+- --actions          Only these actions, in flow order (default: all with examples)
+- --concurrency      Virtual users (default: 10)
+- --duration         Seconds to run (default: 10, or no limit with --flows)
+- --flows            Stop after this many flows in total instead (0: no limit)
+- --rate             Total requests per second (0: as fast as possible; default: 0)
+- --timeout          Seconds to wait for each response (default: 10)
+- --bap-adapter-url  Override the devkit's bap_adapter_url
+- --bpp-adapter-url  Override the devkit's bpp_adapter_url
+- --output           Write the report as JSON
+- --example-index    Example index file (default: ~/.cache/beckn-examples/index.json)
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import ssl
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Import the example index, the Postman generator's macro handling and the benchmark's percentiles
+try:
+    # Try importing as modules (if scripts directory is in path)
+    import example_index
+    import generate_postman_collection
+    from benchmark_validate_schema import percentile
+except ImportError:
+    # If running as a script, import from same directory
+    import importlib.util
+    for _module_name in ("example_index", "generate_postman_collection", "benchmark_validate_schema"):
+        _spec = importlib.util.spec_from_file_location(_module_name, Path(__file__).parent / f"{_module_name}.py")
+        _module = importlib.util.module_from_spec(_spec)
+        sys.modules[_module_name] = _module
+        _spec.loader.exec_module(_module)
+    import example_index
+    import generate_postman_collection
+    from benchmark_validate_schema import percentile
+
+
+# Variables filled in per flow or per request; the rest are fixed when templates are built
+PER_REQUEST_MACROS = ('"{{transaction_id}}"', '"{{$guid}}"', '"{{iso_date}}"')
+
+# Adapter URL variable the requests of each replayed role are sent to
+ROLE_TARGETS = {
+    "BAP": "bap_adapter_url",
+    "BPP": "bpp_adapter_url",
+}
+
+
+async def read_http_headers(reader: asyncio.StreamReader) -> Dict[bytes, bytes]:
+    """Read HTTP header lines up to the blank line, as {lower-case name: lower-case value}."""
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.partition(b":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+
+def response_has_body(status: int, method: Optional[str] = None) -> bool:
+    """Whether a response can carry a body: not 1xx, 204 or 304, and not an answer to HEAD."""
+    return not (100 <= status < 200 or status in (204, 304) or method == "HEAD")
+
+
+async def read_http_body(reader: asyncio.StreamReader, headers: Dict[bytes, bytes], status: Optional[int] = None,
+                         method: Optional[str] = None) -> bytes:
+    """
+    Read an HTTP message body, chunked or with a Content-Length.
+
+    A request without either header has no body. A response without either header runs
+    to the end of the stream if it says Connection: close, and is empty otherwise.
+
+    Args:
+        reader: Stream positioned after the headers
+        headers: Headers from read_http_headers
+        status: Status code when reading a response (None for a request)
+        method: Method of the request a response answers (a HEAD response has no body)
+    """
+    if status is not None and not response_has_body(status, method):
+        return b""
+    if headers.get(b"transfer-encoding") == b"chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+    if b"content-length" in headers:
+        return await reader.readexactly(int(headers[b"content-length"]))
+    if status is not None and headers.get(b"connection") == b"close":
+        return await reader.read()
+    return b""
+
+
+class HTTPConnection:
+    """
+    Keep-alive HTTP/1.1 connection to one server, used by one coroutine at a time.
+
+    The connection is opened on the first request and reopened after the server closes it.
+
+    Args:
+        url: Any URL on the server (only its scheme, host and port are used)
+    """
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.host_header = parts.netloc.encode("latin-1")
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """
+        Send a request and read the whole response.
+
+        A request on a reused connection that the server had already closed is retried once
+        on a new connection.
+
+        Returns:
+            (status code, response body)
+        """
+        head = [f"{method} {path} HTTP/1.1".encode("latin-1"), b"Host: " + self.host_header,
+                b"Content-Length: " + str(len(body)).encode("ascii")]
+        for name, value in (headers or {}).items():
+            head.append(f"{name}: {value}".encode("latin-1"))
+        data = b"\r\n".join(head) + b"\r\n\r\n" + body
+
+        reused = self.writer is not None
+        while True:
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+            try:
+                self.writer.write(data)
+                await self.writer.drain()
+                status_line = await self.reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("connection closed by server")
+            except ConnectionError:
+                self.close()
+                if not reused:
+                    raise
+                reused = False
+                continue
+            try:
+                return await self._read_response(status_line, method)
+            except BaseException:
+                self.close()
+                raise
+
+    async def _read_response(self, status_line: bytes, method: str) -> Tuple[int, bytes]:
+        """Read the headers and body of a response whose status line has been read."""
+        while True:
+            try:
+                status = int(status_line.split(None, 2)[1])
+            except (IndexError, ValueError):
+                raise ConnectionError(f"malformed status line: {status_line[:80]!r}")
+            headers = await read_http_headers(self.reader)
+            if not 100 <= status < 200:
+                break
+            # Interim response (e.g. 100 Continue); the final one follows
+            status_line = await self.reader.readline()
+        body = await read_http_body(self.reader, headers, status, method)
+        # A body that is neither sized nor chunked leaves the connection in an unknown state
+        unframed = b"content-length" not in headers and b"transfer-encoding" not in headers
+        if headers.get(b"connection") == b"close" or (unframed and response_has_body(status, method)):
+            self.close()
+        return status, body
+
+    def close(self) -> None:
+        """Close the connection; the next request opens a new one."""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class RatePacer:
+    """Spaces out requests from all virtual users to at most `rate` per second (0: no limit)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Wait for this request's slot."""
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def iso_timestamp() -> str:
+    """Current UTC time in the format of JavaScript's Date.toISOString() (as in the Postman collections)."""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def build_request_template(example: Dict[str, Any], variables: Dict[str, str]) -> str:
+    """
+    Turn an example into a request body template.
+
+    The context is rewritten with replace_context_macros, as for the Postman collections,
+    and every macro except the per-flow and per-request ones (PER_REQUEST_MACROS) is filled
+    in from variables.
+    """
+    body = json.dumps(generate_postman_collection.replace_context_macros(example), separators=(",", ":"))
+    for key, value in variables.items():
+        macro = f'"{{{{{key}}}}}"'
+        if macro not in PER_REQUEST_MACROS:
+            body = body.replace(macro, json.dumps(value))
+    return body
+
+
+def render_request(template: str, transaction_id: str) -> bytes:
+    """Fill in a template's transaction_id, a new message_id and the current timestamp."""
+    return (template
+            .replace('"{{transaction_id}}"', f'"{transaction_id}"')
+            .replace('"{{$guid}}"', f'"{uuid.uuid4()}"')
+            .replace('"{{iso_date}}"', f'"{iso_timestamp()}"')
+            .encode("utf-8"))
+
+
+def build_replay_steps(devkit: str, role: str, variables: Dict[str, str], actions: Optional[List[str]] = None,
+                       index: Optional["example_index.ExampleIndex"] = None) -> List[Dict[str, Any]]:
+    """
+    Build the flow a virtual user replays: one step per action with examples, in flow order.
+
+    Args:
+        devkit: Devkit in example_index.EXAMPLE_SOURCES
+        role: "BAP" or "BPP"
+        variables: Collection variables, including the adapter URL of the role
+        actions: Optional actions to keep (default: all with examples)
+        index: Example index to look the examples up in (default: an in-memory one)
+
+    Returns:
+        [{"action", "url", "templates": [request body templates]}]
+    """
+    source = example_index.EXAMPLE_SOURCES[devkit]
+    examples_dir = example_index.REPO_ROOT / source["path"]
+    if index is None:
+        index = example_index.ExampleIndex(None)
+    index.scan(examples_dir, source["layout"], devkit)
+
+    adapter_url = variables[ROLE_TARGETS[role]].rstrip("/")
+    steps = []
+    for action, paths in sorted(index.by_action(examples_dir, role).items(),
+                                key=lambda item: (example_index.flow_step(item[0]) or 0, item[0])):
+        if actions is not None and action not in actions:
+            continue
+        templates = []
+        for path in paths:
+            example = generate_postman_collection.load_example_json(path)
+            if example is not None:
+                templates.append(build_request_template(example, variables))
+        if templates:
+            steps.append({"action": action, "url": f"{adapter_url}/{action}", "templates": templates})
+    return steps
+
+
+def new_replay_stats(steps: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Return empty per-action aggregates for replay()."""
+    return {step["action"]: {"latencies": [], "errors": 0, "nacks": 0, "statuses": {}, "failures": {}} for step in steps}
+
+
+async def replay(steps: List[Dict[str, Any]], concurrency: int = 10, duration: float = 10.0, flows: int = 0,
+                 rate: float = 0.0, timeout: float = 10.0) -> Tuple[Dict[str, Dict[str, Any]], float]:
+    """
+    Replay the flow from concurrent virtual users.
+
+    Args:
+        steps: Flow from build_replay_steps
+        concurrency: Number of virtual users, each with its own keep-alive connections
+        duration: Seconds after which no new flow is started (0: no limit)
+        flows: Total number of flows after which no new flow is started (0: no limit)
+        rate: Total requests per second (0: as fast as possible)
+        timeout: Seconds to wait for each response
+
+    Returns:
+        (per-action aggregates, elapsed seconds)
+    """
+    stats = new_replay_stats(steps)
+    pacer = RatePacer(rate)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + duration if duration else None
+    flows_started = 0
+
+    async def virtual_user(number: int) -> None:
+        nonlocal flows_started
+        connections = {}
+        iteration = number
+        try:
+            while (deadline is None or loop.time() < deadline) and (not flows or flows_started < flows):
+                flows_started += 1
+                transaction_id = str(uuid.uuid4())
+                for step in steps:
+                    url = urlsplit(step["url"])
+                    connection = connections.get(url.netloc)
+                    if connection is None:
+                        connection = connections[url.netloc] = HTTPConnection(step["url"])
+                    body = render_request(step["templates"][iteration % len(step["templates"])], transaction_id)
+                    action_stats = stats[step["action"]]
+                    await pacer.wait()
+                    sent = time.perf_counter()
+                    try:
+                        status, response = await asyncio.wait_for(
+                            connection.request("POST", url.path or "/", body, {"Content-Type": "application/json"}),
+                            timeout)
+                    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                        connection.close()
+                        action_stats["errors"] += 1
+                        kind = type(e).__name__
+                        action_stats["failures"][kind] = action_stats["failures"].get(kind, 0) + 1
+                        continue
+                    action_stats["latencies"].append(time.perf_counter() - sent)
+                    action_stats["statuses"][status] = action_stats["statuses"].get(status, 0) + 1
+                    if not 200 <= status < 300:
+                        action_stats["errors"] += 1
+                    elif b'"NACK"' in response:
+                        action_stats["nacks"] += 1
+                iteration += 1
+        finally:
+            for connection in connections.values():
+                connection.close()
+
+    await asyncio.gather(*(virtual_user(number) for number in range(concurrency)))
+    return stats, loop.time() - started
+
+
+def replay_report(stats: Dict[str, Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Turn replay() aggregates into a JSON-serializable report, with actions in flow order."""
+    actions = []
+    for action, action_stats in stats.items():
+        latencies = action_stats["latencies"]
+        requests = len(latencies) + sum(action_stats["failures"].values())
+        entry = {
+            "action": action,
+            "requests": requests,
+            "errors": action_stats["errors"],
+            "nacks": action_stats["nacks"],
+            "requests_per_s": round(requests / elapsed, 1) if elapsed else None,
+            "statuses": {str(status): count for status, count in sorted(action_stats["statuses"].items())},
+            "failures": action_stats["failures"],
+        }
+        if latencies:
+            entry.update({
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p90_ms": round(percentile(latencies, 90) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                "max_ms": round(max(latencies) * 1000, 2),
+            })
+        actions.append(entry)
+    requests = sum(entry["requests"] for entry in actions)
+    return {
+        "requests": requests,
+        "errors": sum(entry["errors"] for entry in actions),
+        "nacks": sum(entry["nacks"] for entry in actions),
+        "duration_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1) if elapsed else None,
+        "actions": actions,
+    }
+
+
+def write_replay_table(report: Dict[str, Any], out) -> None:
+    """Write a replay report as a table per action, followed by one line of totals."""
+    out.write(f"{'action':<14} {'requests':>9} {'errors':>7} {'nacks':>6} {'req/s':>9} "
+              f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}\n")
+    for entry in report["actions"]:
+        latency = "".join(f" {entry[key]:>9}" if key in entry else f" {'-':>9}" for key in ("p50_ms", "p90_ms", "p99_ms", "max_ms"))
+        out.write(f"{entry['action']:<14} {entry['requests']:>9} {entry['errors']:>7} {entry['nacks']:>6} "
+                  f"{entry['requests_per_s']:>9}{latency}\n")
+        for kind, count in entry["failures"].items():
+            out.write(f"    {count:>8} x {kind}\n")
+    out.write(f"{report['requests']} request(s), {report['errors']} error(s), {report['nacks']} NACK(s) "
+              f"in {report['duration_s']:.2f}s ({report['requests_per_s']} requests/s)\n")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Replay example flows against the local ONIX adapters and report throughput and latency"
+    )
+    parser.add_argument("--devkit", choices=sorted(example_index.EXAMPLE_SOURCES), required=True,
+                        help="Devkit whose examples and variables to use")
+    parser.add_argument("--role", choices=sorted(ROLE_TARGETS), default="BAP",
+                        help="BAP replays requests to bap_adapter_url, BPP callbacks to bpp_adapter_url (default: %(default)s)")
+    parser.add_argument("--actions", nargs="+", default=None, help="Only these actions (default: all with examples)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual users (default: %(default)s)")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run (default: 10, or no limit with --flows)")
+    parser.add_argument("--flows", type=int, default=0, help="Stop after this many flows in total (default: no limit)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Total requests per second (default: as fast as possible)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for each response (default: %(default)s)")
+    parser.add_argument("--bap-adapter-url", default=None, help="Override the devkit's bap_adapter_url")
+    parser.add_argument("--bpp-adapter-url", default=None, help="Override the devkit's bpp_adapter_url")
+    parser.add_argument("--output", default=None, help="Write the report as JSON to this file")
+    parser.add_argument("--example-index", default=example_index.DEFAULT_INDEX_PATH,
+                        help="Example index file (default: %(default)s)")
+
+    args = parser.parse_args()
+    if args.duration is None:
+        args.duration = 0.0 if args.flows else 10.0
+
+    variables = {
+        variable["key"]: variable["value"]
+        for role in ROLE_TARGETS
+        for variable in generate_postman_collection.get_collection_variables(args.devkit, role)
+    }
+    if args.bap_adapter_url:
+        variables["bap_adapter_url"] = args.bap_adapter_url
+    if args.bpp_adapter_url:
+        variables["bpp_adapter_url"] = args.bpp_adapter_url
+
+    index = example_index.ExampleIndex(args.example_index)
+    steps = build_replay_steps(args.devkit, args.role, variables, args.actions, index)
+    index.save()
+    if not steps:
+        print(f"Error: no {args.role} examples found for {args.devkit}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Replaying {' -> '.join(step['action'] for step in steps)} to {variables[ROLE_TARGETS[args.role]]} "
+          f"with {args.concurrency} virtual user(s)", file=sys.stderr)
+    stats, elapsed = asyncio.run(replay(steps, args.concurrency, args.duration, args.flows, args.rate, args.timeout))
+    report = replay_report(stats, elapsed)
+    write_replay_table(report, sys.stdout)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Wrote replay report: {args.output}")
+    sys.exit(1 if report["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Beckn Schema Code Generator
+
+This module turns JSON Schema definitions from Beckn attributes.yaml files into plain
+Python validator functions, so hot types such as beckn:Item, beckn:Offer, ChargingService
+or EnergyTradeOffer are checked by straight-line code instead of the generic jsonschema
+interpreter, which walks the schema tree for every instance.
+
+HOW IT IS USED
+--------------
+`validate_schema.py --codegen` calls `generate_validator_source(...)` once per schema,
+compiles the source with `load_validator(...)` and caches it next to the schema cache.
+A generated function only answers "is this instance valid?": when it returns True the
+object is valid, and when it returns False the object is validated again with jsonschema,
+which produces the usual error message. Results are therefore identical to the jsonschema
+path; only the time spent on valid objects changes.
+
+SUPPORTED KEYWORDS
+------------------
+type, enum, const, properties, required, additionalProperties, items, minItems, maxItems,
+minLength, maxLength, pattern, minimum, maximum, exclusiveMinimum, exclusiveMaximum,
+minProperties, maxProperties, allOf, anyOf, oneOf, not, $ref (JSON pointers, within or
+across documents) and format (not asserted, as in validate_schema.py).
+
+Any other keyword the JSON Schema dialect applies (patternProperties, if/then/else,
+uniqueItems, multipleOf, $id, ...) raises UnsupportedSchemaError, and the caller keeps
+using jsonschema for that schema. Keywords outside the dialect, such as OpenAPI's
+nullable or x-* extensions, are ignored, as jsonschema ignores them.
+"""
+
+import math
+import re
+from urllib.parse import unquote, urldefrag, urljoin
+
+# Bump when generated code changes, so cached sources are regenerated
+CODEGEN_VERSION = 1
+
+# Keywords with a translation below; "format" is an annotation unless a format checker is used
+SUPPORTED_KEYWORDS = frozenset({
+    "type", "enum", "const", "properties", "required", "additionalProperties", "items",
+    "minItems", "maxItems", "minLength", "maxLength", "pattern", "minimum", "maximum",
+    "exclusiveMinimum", "exclusiveMaximum", "minProperties", "maxProperties",
+    "allOf", "anyOf", "oneOf", "not", "$ref", "format",
+})
+
+# Keywords that change how references resolve; never translated
+_SCOPE_KEYWORDS = frozenset({"$id", "$schema", "$dynamicAnchor", "$recursiveAnchor"})
+
+# Keywords whose subschemas must be generated as functions (they need loops or lookups)
+_STATEMENT_KEYWORDS = frozenset({"properties", "required", "additionalProperties", "items"})
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool) or isinstance({v}, float) and {v}.is_integer())",
+}
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses a keyword or reference the generator does not translate."""
+
+
+class _Generator:
+    def __init__(self, get_document, dialect_keywords):
+        self.get_document = get_document
+        self.dialect_keywords = frozenset(dialect_keywords)
+        self.constants = []
+        self.constant_names = {}
+        self.functions = {}
+        self.pending = []
+        self.bodies = []
+
+    def constant(self, source):
+        name = self.constant_names.get(source)
+        if name is None:
+            name = self.constant_names[source] = f"_c{len(self.constant_names)}"
+            self.constants.append(f"{name} = {source}")
+        return name
+
+    def function_for(self, key, schema, base_uri):
+        name = self.functions.get(key)
+        if name is None:
+            name = self.functions[key] = f"_v{len(self.functions)}"
+            self.pending.append((name, schema, base_uri))
+        return name
+
+    def resolve(self, ref, base_uri):
+        uri, fragment = urldefrag(urljoin(base_uri, ref))
+        if fragment and not fragment.startswith("/"):
+            raise UnsupportedSchemaError(f"$ref to an anchor: {ref}")
+        document = self.get_document(uri)
+        if document is None:
+            raise UnsupportedSchemaError(f"$ref to an unknown document: {ref}")
+        schema = document
+        for segment in unquote(fragment).split("/")[1:]:
+            segment = segment.replace("~1", "/").replace("~0", "~")
+            try:
+                schema = schema[int(segment)] if isinstance(schema, list) else schema[segment]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise UnsupportedSchemaError(f"$ref to a missing location: {ref}") from None
+        return (uri, fragment), schema, uri
+
+    def generate(self, schema, base_uri):
+        entry = self.function_for(("root",), schema, base_uri)
+        while self.pending:
+            name, schema, base_uri = self.pending.pop()
+            self.bodies.append(self.function(name, schema, base_uri))
+        return entry
+
+    def check_keywords(self, schema):
+        for keyword in schema:
+            if keyword in _SCOPE_KEYWORDS:
+                raise UnsupportedSchemaError(f"unsupported keyword: {keyword}")
+            if keyword in self.dialect_keywords and keyword not in SUPPORTED_KEYWORDS:
+                raise UnsupportedSchemaError(f"unsupported keyword: {keyword}")
+
+    def expression(self, schema, var, base_uri):
+        # A boolean expression for "var is valid under schema"
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"schema is not an object: {schema!r}")
+        self.check_keywords(schema)
+        if _STATEMENT_KEYWORDS.intersection(schema):
+            name = self.function_for(("inline", id(schema)), schema, base_uri)
+            return f"{name}({var})"
+        conditions = self.conditions(schema, var, base_uri)
+        return " and ".join(f"({condition})" for condition in conditions) if conditions else "True"
+
+    def function(self, name, schema, base_uri):
+        lines = [f"def {name}(x):"]
+        if schema is True or schema is False:
+            lines.append(f"    return {schema}")
+            return "\n".join(lines)
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"schema is not an object: {schema!r}")
+        self.check_keywords(schema)
+        for condition in self.conditions(schema, "x", base_uri):
+            lines.append(f"    if not ({condition}):")
+            lines.append("        return False")
+        lines.extend(self.object_statements(schema, base_uri))
+        lines.extend(self.array_statements(schema, base_uri))
+        lines.append("    return True")
+        return "\n".join(lines)
+
+    def object_statements(self, schema, base_uri):
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional = schema.get("additionalProperties", True)
+        if not isinstance(properties, dict) or not isinstance(required, list):
+            raise UnsupportedSchemaError("malformed properties or required")
+        if not properties and not required and additional is True:
+            return []
+        lines = ["    if isinstance(x, dict):"]
+        for prop in required:
+            lines.append(f"        if {prop!r} not in x:")
+            lines.append("            return False")
+        for prop, subschema in properties.items():
+            check = self.expression(subschema, "_t", base_uri)
+            if check == "True":
+                continue
+            lines.append(f"        if {prop!r} in x:")
+            lines.append(f"            _t = x[{prop!r}]")
+            lines.append(f"            if not ({check}):")
+            lines.append("                return False")
+        if additional is not True:
+            known = self.constant(f"frozenset({sorted(properties)!r})")
+            check = self.expression(additional, "_t", base_uri)
+            if check == "False":
+                lines.append(f"        if not {known}.issuperset(x):")
+                lines.append("            return False")
+            elif check != "True":
+                lines.append("        for _k, _t in x.items():")
+                lines.append(f"            if _k not in {known} and not ({check}):")
+                lines.append("                return False")
+        return lines
+
+    def array_statements(self, schema, base_uri):
+        if "items" not in schema:
+            return []
+        check = self.expression(schema["items"], "_t", base_uri)
+        if check == "True":
+            return []
+        if check == "False":
+            return ["    if isinstance(x, list) and x:", "        return False"]
+        return [
+            "    if isinstance(x, list):",
+            "        for _t in x:",
+            f"            if not ({check}):",
+            "                return False",
+        ]
+
+    def conditions(self, schema, var, base_uri):
+        conditions = []
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            checks = []
+            for type_name in types:
+                if type_name not in _TYPE_CHECKS:
+                    raise UnsupportedSchemaError(f"unknown type: {type_name!r}")
+                checks.append(_TYPE_CHECKS[type_name].format(v=var))
+            conditions.append(" or ".join(checks) if checks else "False")
+        if "enum" in schema:
+            if not isinstance(schema["enum"], list):
+                raise UnsupportedSchemaError("enum is not an array")
+            conditions.append(self.membership(schema["enum"], var))
+        if "const" in schema:
+            conditions.append(self.membership([schema["const"]], var))
+        for keyword, operator, type_check in (
+            ("minLength", ">=", "isinstance({v}, str)"),
+            ("maxLength", "<=", "isinstance({v}, str)"),
+            ("minItems", ">=", "isinstance({v}, list)"),
+            ("maxItems", "<=", "isinstance({v}, list)"),
+            ("minProperties", ">=", "isinstance({v}, dict)"),
+            ("maxProperties", "<=", "isinstance({v}, dict)"),
+        ):
+            if keyword in schema:
+                conditions.append(f"not {type_check.format(v=var)} or len({var}) {operator} {self.number(schema[keyword])}")
+        for keyword, operator in (
+            ("minimum", ">="), ("maximum", "<="), ("exclusiveMinimum", ">"), ("exclusiveMaximum", "<"),
+        ):
+            if keyword in schema:
+                conditions.append(f"not {_TYPE_CHECKS['number'].format(v=var)} or {var} {operator} {self.number(schema[keyword])}")
+        if "pattern" in schema:
+            pattern = schema["pattern"]
+            try:
+                re.compile(pattern)
+            except (re.error, TypeError):
+                raise UnsupportedSchemaError(f"pattern not supported by Python re: {pattern!r}") from None
+            search = self.constant(f"re.compile({pattern!r}).search")
+            conditions.append(f"not isinstance({var}, str) or {search}({var}) is not None")
+        if "$ref" in schema:
+            key, target, target_base = self.resolve(schema["$ref"], base_uri)
+            conditions.append(f"{self.function_for(key, target, target_base)}({var})")
+        for subschema in self.subschemas(schema, "allOf"):
+            conditions.append(self.expression(subschema, var, base_uri))
+        if "anyOf" in schema:
+            options = [self.expression(s, var, base_uri) for s in self.subschemas(schema, "anyOf")]
+            conditions.append(" or ".join(f"({option})" for option in options))
+        if "oneOf" in schema:
+            options = [self.expression(s, var, base_uri) for s in self.subschemas(schema, "oneOf")]
+            conditions.append(" + ".join(f"(1 if {option} else 0)" for option in options) + " == 1")
+        if "not" in schema:
+            conditions.append(f"not ({self.expression(schema['not'], var, base_uri)})")
+        return conditions
+
+    def subschemas(self, schema, keyword):
+        subschemas = schema.get(keyword, [])
+        if not isinstance(subschemas, list) or (keyword != "allOf" and not subschemas):
+            raise UnsupportedSchemaError(f"malformed {keyword}")
+        return subschemas
+
+    def number(self, value):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise UnsupportedSchemaError(f"not a finite number: {value!r}")
+        return repr(value)
+
+    def membership(self, values, var):
+        # Mirrors jsonschema's equal(): strings compare as strings, booleans only equal
+        # booleans, and 1 == 1.0; arrays and objects are not translated
+        checks = []
+        strings = [value for value in values if isinstance(value, str)]
+        numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        if strings:
+            checks.append(f"isinstance({var}, str) and {var} in {self.constant(f'frozenset({sorted(set(strings))!r})')}")
+        if numbers:
+            literals = sorted({self.number(value) for value in numbers})
+            checks.append(f"{_TYPE_CHECKS['number'].format(v=var)} and {var} in {self.constant('frozenset({' + ', '.join(literals) + '})')}")
+        for singleton in (None, True, False):
+            if any(value is singleton for value in values):
+                checks.append(f"{var} is {singleton}")
+        if len(strings) + len(numbers) + sum(1 for value in values if value is None or isinstance(value, bool)) != len(values):
+            raise UnsupportedSchemaError("enum/const with array or object values")
+        return " or ".join(f"({check})" for check in checks) if checks else "False"
+
+
+def generate_validator_source(schema, base_uri, get_document, dialect_keywords):
+    """
+    Generate Python source for a function that checks instances against a schema.
+
+    Args:
+        schema: Root schema (a dict or boolean), e.g. {"$ref": ".../attributes.yaml#/components/schemas/Item"}
+        base_uri: URI that relative $refs in the schema resolve against
+        get_document: Callable returning the parsed schema document for a URI, or None
+        dialect_keywords: Keywords the JSON Schema dialect applies (e.g.
+            Draft202012Validator.VALIDATORS); any of them without a translation is unsupported
+
+    Returns:
+        str: Module source defining validate(instance) -> bool
+
+    Raises:
+        UnsupportedSchemaError: If the schema cannot be translated
+    """
+    generator = _Generator(get_document, dialect_keywords)
+    entry = generator.generate(schema, base_uri)
+    return "\n".join([
+        f"# Generated by schema_codegen.py (version {CODEGEN_VERSION}); do not edit",
+        "import re",
+        "from numbers import Number as _Number",
+        "",
+        *generator.constants,
+        "",
+        *(body + "\n" for body in reversed(generator.bodies)),
+        f"validate = {entry}",
+        "",
+    ])
+
+
+def load_validator(source, filename="<schema_codegen>"):
+    """
+    Compile generated source and return its validate(instance) -> bool function.
+    """
+    namespace = {}
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["validate"]
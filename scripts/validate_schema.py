@@ -14,10 +14,16 @@ HOW IT WORKS:
 
 2. On-Demand Loading: Schemas are loaded on-demand from GitHub URLs when first encountered.
    The @context URL (e.g., .../EvChargingOffer/v1/context.jsonld) is converted to the
-   corresponding attributes.yaml URL for schema loading.
+   corresponding attributes.yaml URL for schema loading. Parsed schemas are kept in a local
+   content-addressed cache (default: ~/.cache/beckn-schemas) and revalidated with ETag once
+   their TTL expires; --offline serves schemas from that cache without touching the network.
 
 3. Schema Caching: Loaded schemas are cached in a Registry and attribute_schemas_map to avoid
-   redundant network requests.
+   redundant network requests. Compiled validators are cached per (attributes_url, object_name),
+   so each schema is checked against its meta-schema once per process rather than once per object.
+   With --codegen, each schema is also translated to plain Python checks that accept valid
+   objects without jsonschema; objects they reject (and schemas using keywords the generator
+   does not support) are validated by jsonschema, so error messages are unchanged.
 
 4. Reference Resolution: Uses the referencing library to resolve $ref JSON pointers within
    and across schema files. Core objects use $ref to the full schema document to ensure
@@ -36,6 +42,8 @@ ARCHITECTURE:
   domain-specific attributes.yaml files (e.g., EvChargingOffer/v1/attributes.yaml)
 - JSON-LD Support: Automatically allows @context and @type properties even when schemas
   have additionalProperties: false
+- Embedding: BecknValidator owns a schema store and can be shared by many threads, e.g.
+  `BecknValidator().validate(message)` in an ingestion service (see the class docstring)
 
 USAGE EXAMPLES:
 ---------------
@@ -45,9 +53,48 @@ python3 scripts/validate_schema.py examples/ev-charging/v2/03_select/time-based-
 # Validate multiple files:
 python3 scripts/validate_schema.py examples/ev-charging/v2/**/*.json
 
+# Validate many files in parallel with 8 worker processes (output stays in argument order):
+python3 scripts/validate_schema.py --jobs 8 examples/**/*.json testnet/**/*.postman_collection.json
+
+# Validate a very large on_discover catalog incrementally, with bounded memory (requires ijson):
+python3 scripts/validate_schema.py --stream cds-on-discover-dump.json
+
 # Validate only core Beckn objects (skip domain-specific attributes):
 python3 scripts/validate_schema.py --core-only examples/ev-charging/v2/03_select/time-based-ev-charging-slot-select.json
 
+# Validate without network access, using schemas cached by an earlier run:
+python3 scripts/validate_schema.py --offline examples/ev-charging/v2/**/*.json
+
+# Emit one JSON record per validated object (or --format junit for CI, --format text for
+# the per-object progress lines):
+python3 scripts/validate_schema.py --format jsonl --output results.jsonl examples/**/*.json
+
+# Run a local validation service (sidecar) that keeps schemas warm between requests:
+python3 scripts/validate_schema.py serve --port 8090 --preload examples/ev-charging/v2/*/*.json
+curl -s --data @examples/ev-charging/v2/03_select/time-based-ev-charging-slot-select.json http://127.0.0.1:8090/validate
+
+# Bundle every schema the examples reference into one file, then validate from it without
+# parsing YAML (useful for short CI steps and pre-commit hooks):
+python3 scripts/validate_schema.py bundle --output beckn-schemas.bundle.json examples testnet
+python3 scripts/validate_schema.py --bundle beckn-schemas.bundle.json examples/ev-charging/v2/*/*.json
+
+# Pre-commit / CI: only re-validate files changed since the last run ('objects' goes further
+# and re-validates just the changed @context objects inside a large catalog):
+python3 scripts/validate_schema.py --incremental examples/**/*.json testnet/**/*.postman_collection.json
+python3 scripts/validate_schema.py --incremental objects cds-on-discover-dump.json
+
+# Validate with Python code generated from each schema (see schema_codegen.py); valid objects
+# skip jsonschema, and the generated code is cached under <cache-dir>/codegen:
+python3 scripts/validate_schema.py --codegen cds-on-discover-dump.json
+
+# Validate a day of recorded traffic (NDJSON of context+message envelopes, gzip is fine) on all
+# CPUs, with counts and the most frequent errors per context.domain and context.action:
+python3 scripts/validate_schema.py traffic --output traffic-report.json onix-traffic-2025-01-31.ndjson.gz
+
+# Find out where a slow run spends its time: per-phase and per-type timings, bytes fetched
+# and cache hits/misses, ranked on stderr and optionally saved as JSON:
+python3 scripts/validate_schema.py --profile --profile-output profile.json examples/**/*.json
+
 # Validate Postman collection:
 python3 scripts/validate_schema.py testnet/ev-charging-devkit/postman/ev-charging:BAP-DEG.postman_collection.json
 
@@ -88,20 +135,447 @@ DEPENDENCIES:
 - referencing: JSON Schema reference resolution
 - requests: HTTP requests for schema loading
 - yaml: YAML parsing for schema files
+- ijson (optional): incremental JSON parsing for --stream
 """
 
+import io
+import sys
+import gzip
 import json
+import os
 import re
-import copy
+import stat
+import time
+import hashlib
+import datetime
+import tempfile
+import threading
+import contextlib
+import socketserver
+import http.server
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
 import yaml
 from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
 
+# Optional: only needed for --stream
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Generated validators for --codegen live in a sibling module
+try:
+    # Try importing as module (if scripts directory is in path)
+    import schema_codegen
+except ImportError:
+    # If running as a script, import from same directory
+    import importlib.util
+    _schema_codegen_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema_codegen.py")
+    _spec = importlib.util.spec_from_file_location("schema_codegen", _schema_codegen_path)
+    schema_codegen = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(schema_codegen)
+
+# Compiled validators keyed by (_schema_content_key(attributes_url), object_name).
+# Values are (registry, validator) so a validator can be rebound when the registry grows.
+_compiled_validators = {}
+
+# Keys whose values never need traversing: @context/@type values are URLs or inline contexts
+NON_JSONLD_KEYS = frozenset({"@context", "@type"})
+
+# JSON-LD-relaxed attribute schemas: {schema content key: {schema_key: schema}}, built at load time
+_jsonld_schemas = {}
+
+# Schema documents by content: the same attributes.yaml is often published on several branches
+# (e.g. refs/heads/main and refs/heads/draft). _schema_documents maps sha256 -> (schema_data,
+# self_contained) and _schema_aliases maps each attributes.yaml URL to its sha256, so identical
+# documents are parsed, relaxed and compiled once however many URLs point at them.
+_schema_documents = {}
+_schema_aliases = {}
+
+# On-disk schema cache settings. Override with configure_schema_cache().
+# The default TTL matches the cacheTTL of the ONIX schemaValidator config in testnet/.
+DEFAULT_CACHE_DIR = os.environ.get(
+    "BECKN_SCHEMA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "beckn-schemas")
+)
+DEFAULT_CACHE_TTL = 3600
+_schema_cache_config = {
+    "enabled": True,
+    "cache_dir": DEFAULT_CACHE_DIR,
+    "ttl": DEFAULT_CACHE_TTL,
+    "offline": False,
+}
+
+# Schemas are fetched over one pooled session; prefetch_schemas uses this many threads
+DEFAULT_PREFETCH_WORKERS = 8
+_http_session = None
+
+# Seconds a BecknValidator waits before fetching a schema that failed to load again
+DEFAULT_FAILED_LOAD_RETRY = 30
+
+# Fetch the on-demand loaders use on this thread instead of load_schema_from_url (see _fetching_with)
+_thread_fetch = threading.local()
+
+# Per-object progress output; the CLI turns it off for every --format except text
+_report_config = {"verbose": True}
+
+# Generated fast-path checks (--codegen), keyed like _compiled_validators; None where unsupported
+_codegen_config = {"enabled": False}
+_generated_validators = {}
+_document_digests = {}
+
+def configure_codegen(enabled=None):
+    """
+    Turn generated validators on or off (see schema_codegen.py).
+    
+    Args:
+        enabled: If True, valid objects are recognised by Python code generated from their
+            schema, and only objects it rejects are validated with jsonschema
+    """
+    if enabled is not None:
+        _codegen_config["enabled"] = enabled
+
+# Timings and counters for --profile: {"phases": {phase: [calls, seconds]},
+# "types": {(schema_url, type): [objects, seconds, invalid]}, "counters": {name: value}}.
+# None unless enable_profiling() was called, so with profiling off each instrumented
+# site costs a single `is not None` check.
+_profile = None
+_profile_lock = threading.Lock()
+_NOT_PROFILED = contextlib.nullcontext()
+
+def enable_profiling(enabled=True):
+    """
+    Start collecting --profile timings and counters in this process, discarding earlier ones.
+    
+    Args:
+        enabled: If False, stop collecting
+    
+    Returns:
+        dict: The new (empty) profile, or None if disabled
+    """
+    global _profile
+    _profile = {"phases": {}, "types": {}, "counters": {}} if enabled else None
+    return _profile
+
+class _PhaseTimer:
+    __slots__ = ("phase", "started")
+    
+    def __init__(self, phase):
+        self.phase = phase
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+    
+    def __exit__(self, *exc_info):
+        _profile_phase(self.phase, time.perf_counter() - self.started)
+        return False
+
+def _profiled(phase):
+    """Return a context manager timing a --profile phase (a shared no-op when profiling is off)."""
+    return _NOT_PROFILED if _profile is None else _PhaseTimer(phase)
+
+def _profile_phase(phase, seconds):
+    with _profile_lock:
+        stats = _profile["phases"].setdefault(phase, [0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+
+def _profile_count(name, amount=1):
+    if _profile is not None:
+        with _profile_lock:
+            _profile["counters"][name] = _profile["counters"].get(name, 0) + amount
+
+def _profile_object(schema_url, label, seconds, invalid):
+    with _profile_lock:
+        stats = _profile["types"].setdefault((schema_url, label), [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += invalid
+
+def merge_profile(profile):
+    """Add timings and counters from another process's profile (see enable_profiling) to this one."""
+    if _profile is None or not profile:
+        return
+    with _profile_lock:
+        for section in ("phases", "types"):
+            for key, values in profile[section].items():
+                stats = _profile[section].setdefault(key, [0] * len(values))
+                for i, value in enumerate(values):
+                    stats[i] += value
+        for name, value in profile["counters"].items():
+            _profile["counters"][name] = _profile["counters"].get(name, 0) + value
+
+def profile_report(profile, elapsed=None):
+    """
+    Turn a profile into a JSON-serializable report, phases and types ranked by total time.
+    
+    Per-type times cover validating the objects, including compiling their validator on
+    first use, so they overlap the "validator compile" and "codegen" phases.
+    
+    Args:
+        profile: Profile from enable_profiling
+        elapsed: Optional wall time of the whole run in seconds
+    
+    Returns:
+        dict: {"elapsed_s", "phases": [...], "types": [...], "counters": {...}}
+    """
+    phases = [
+        {"phase": phase, "calls": calls, "seconds": round(seconds, 6)}
+        for phase, (calls, seconds) in profile["phases"].items()
+    ]
+    types = [
+        {"schema_url": schema_url, "type": label, "objects": count, "invalid": invalid,
+         "seconds": round(seconds, 6), "mean_us": round(seconds / count * 1e6, 1) if count else None}
+        for (schema_url, label), (count, seconds, invalid) in profile["types"].items()
+    ]
+    validated = sum(seconds for count, seconds, invalid in profile["types"].values())
+    if profile["types"]:
+        phases.append({"phase": "validate (all types)", "calls": sum(t["objects"] for t in types),
+                       "seconds": round(validated, 6)})
+    return {
+        "elapsed_s": round(elapsed, 6) if elapsed is not None else None,
+        "phases": sorted(phases, key=lambda p: -p["seconds"]),
+        "types": sorted(types, key=lambda t: -t["seconds"]),
+        "counters": dict(sorted(profile["counters"].items())),
+    }
+
+def write_profile_table(report, out, limit=20):
+    """
+    Write a profile report as ranked tables of phases, the slowest types, and counters.
+    
+    Args:
+        report: Report from profile_report
+        out: Text stream to write to
+        limit: Number of types to list
+    """
+    total = report["elapsed_s"]
+    out.write(f"\nProfile{f' ({total:.3f}s wall)' if total is not None else ''}\n")
+    out.write(f"  {'phase':<28} {'calls':>9} {'seconds':>10} {'share':>7}\n")
+    for phase in report["phases"]:
+        share = f"{phase['seconds'] / total * 100:.1f}%" if total else ""
+        out.write(f"  {phase['phase']:<28} {phase['calls']:>9} {phase['seconds']:>10.4f} {share:>7}\n")
+    if report["types"]:
+        out.write(f"\n  {'type':<28} {'objects':>9} {'seconds':>10} {'mean us':>9} {'invalid':>8}  schema\n")
+        for t in report["types"][:limit]:
+            out.write(f"  {t['type']:<28} {t['objects']:>9} {t['seconds']:>10.4f} {t['mean_us']:>9} {t['invalid']:>8}  "
+                      f"{t['schema_url']}\n")
+        if len(report["types"]) > limit:
+            out.write(f"  ... {len(report['types']) - limit} more type(s) in the JSON report\n")
+    if report["counters"]:
+        out.write("\n")
+        for name, value in report["counters"].items():
+            out.write(f"  {name:<28} {value:>9}\n")
+
+def configure_reporting(verbose=None):
+    """
+    Configure console output.
+    
+    Args:
+        verbose: If True, print a line for every file, schema load and validated object.
+            If False, only warnings are printed, to stderr, so stdout stays machine-readable.
+    """
+    if verbose is not None:
+        _report_config["verbose"] = verbose
+
+def _log(message):
+    if _report_config["verbose"]:
+        print(message)
+
+def _warn(message):
+    print(message, file=sys.stdout if _report_config["verbose"] else sys.stderr)
+
+class SchemaNotCachedError(Exception):
+    """Raised in offline mode when a schema URL has no entry in the local cache."""
+
+def configure_schema_cache(cache_dir=None, ttl=None, offline=None, enabled=None):
+    """
+    Configure the on-disk schema cache used by load_schema_from_url.
+    
+    Args:
+        cache_dir: Directory holding cached schemas (default: BECKN_SCHEMA_CACHE_DIR or ~/.cache/beckn-schemas)
+        ttl: Seconds a cached schema is used before it is revalidated with the server
+        offline: If True, only serve schemas from the cache and never touch the network
+        enabled: If False, bypass the cache and always fetch from the network
+    """
+    if cache_dir is not None:
+        _schema_cache_config["cache_dir"] = cache_dir
+    if ttl is not None:
+        _schema_cache_config["ttl"] = ttl
+    if offline is not None:
+        _schema_cache_config["offline"] = offline
+    if enabled is not None:
+        _schema_cache_config["enabled"] = enabled
+
+def _json_default(value):
+    # YAML can produce dates/timestamps, which have no JSON equivalent
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _output_file_mode(path):
+    """Permissions for a file written for the user: those of the file it replaces, else 0666 less the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def _write_atomic(path, text, shared=False):
+    # Write via a temp file so concurrent readers never see a partial file. The temp file is
+    # created 0600, which suits the cache; shared files (bundles, reports) get _output_file_mode
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        if shared:
+            os.chmod(tmp_path, _output_file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _cache_entry_path(url):
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(_schema_cache_config["cache_dir"], "urls", f"{url_hash}.json")
+
+def _cache_object_path(content_hash):
+    return os.path.join(_schema_cache_config["cache_dir"], "objects", f"{content_hash}.json")
+
+def _read_cache_entry(url):
+    """Return cache metadata for a URL, or None if it is missing or unreadable."""
+    try:
+        with open(_cache_entry_path(url), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry.get("url") != url or not os.path.exists(_cache_object_path(entry["sha256"])):
+            return None
+        return entry
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _read_cached_schema(entry):
+    shared = _schema_documents.get(entry["sha256"])
+    if shared is not None:
+        _profile_count("schema documents shared")
+        _schema_aliases[entry["url"]] = entry["sha256"]
+        return shared[0]
+    with _profiled("schema cache read"), open(_cache_object_path(entry["sha256"]), "r", encoding="utf-8") as f:
+        return _intern_schema(entry["url"], json.load(f), entry["sha256"])
+
+def _schema_content_hash(schema_data):
+    # Same serialization as the on-disk cache, so hashes match its object names
+    return hashlib.sha256(json.dumps(schema_data, default=_json_default).encode("utf-8")).hexdigest()
+
+def _is_self_contained(schema_data):
+    """
+    Return True if a schema document resolves the same whatever URL it is loaded from.
+    
+    That holds when every $ref is a local JSON pointer or an absolute URL and no $id
+    changes the base URI; relative refs would point to different branches.
+    """
+    stack = [schema_data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get("$id"), str):
+                return False
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not ref.startswith("#") and "://" not in ref:
+                return False
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return True
+
+def _intern_schema(url, schema_data, content_hash=None):
+    """
+    Return the shared copy of a schema document, recording url as an alias of its content.
+    
+    Args:
+        url: attributes.yaml URL the document was loaded from
+        schema_data: Parsed document
+        content_hash: sha256 of the document as stored in the schema cache, if known
+    
+    Returns:
+        dict: The first copy of this content that was loaded (possibly schema_data itself)
+    """
+    if content_hash is None:
+        content_hash = _schema_content_hash(schema_data)
+    shared = _schema_documents.get(content_hash)
+    if shared is None:
+        shared = _schema_documents.setdefault(content_hash, (schema_data, _is_self_contained(schema_data)))
+    else:
+        _profile_count("schema documents shared")
+    _schema_aliases[url] = content_hash
+    return shared[0]
+
+def _schema_content_key(attributes_url):
+    """
+    Return the key validators for a schema document are cached under.
+    
+    URLs whose documents are identical and self-contained share their content hash as
+    key, so their schemas are compiled once; any other document is keyed by its URL.
+    """
+    content_hash = _schema_aliases.get(attributes_url)
+    if content_hash is not None and _schema_documents[content_hash][1]:
+        return content_hash
+    return attributes_url
+
+def _store_cached_schema(url, serialized, etag=None, last_modified=None):
+    """
+    Store a serialized schema under its content hash and point the URL entry at it.
+    
+    Returns:
+        dict: The new cache entry for the URL
+    """
+    content_hash = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    object_path = _cache_object_path(content_hash)
+    if not os.path.exists(object_path):
+        _write_atomic(object_path, serialized)
+    entry = {
+        "url": url,
+        "sha256": content_hash,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+    }
+    _write_atomic(_cache_entry_path(url), json.dumps(entry))
+    return entry
+
+def _get_http_session():
+    """Return the shared, connection-pooled HTTP session used for schema fetches."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=DEFAULT_PREFETCH_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+def _fetch_schema_from_url(url):
+    """Fetch and parse a YAML schema file over HTTP, without the on-disk cache."""
+    with _profiled("schema fetch"):
+        response = _get_http_session().get(url)
+    _profile_count("bytes fetched", len(response.content))
+    response.raise_for_status()
+    with _profiled("yaml parse"):
+        return _intern_schema(url, yaml.safe_load(response.text))
+
 def load_schema_from_url(url):
     """
-    Load a YAML schema file from a URL.
+    Load a YAML schema file from a URL, using the local schema cache.
+    
+    A cached schema younger than the configured TTL is returned without any network access.
+    Older entries are revalidated with If-None-Match/If-Modified-Since, and if the server
+    cannot be reached the stale copy is used. In offline mode only the cache is consulted.
     
     Args:
         url: URL to the attributes.yaml schema file
@@ -112,10 +586,63 @@ def load_schema_from_url(url):
     Raises:
         requests.HTTPError: If the HTTP request fails
         yaml.YAMLError: If YAML parsing fails
+        SchemaNotCachedError: If offline and the schema is not in the cache
     """
-    response = requests.get(url)
+    if not _schema_cache_config["enabled"]:
+        return _fetch_schema_from_url(url)
+    
+    entry = _read_cache_entry(url)
+    if _schema_cache_config["offline"]:
+        if entry is None:
+            _profile_count("schema cache misses")
+            raise SchemaNotCachedError(f"{url} is not in the schema cache (offline mode)")
+        _profile_count("schema cache hits")
+        return _read_cached_schema(entry)
+    if entry is not None and time.time() - entry["fetched_at"] < _schema_cache_config["ttl"]:
+        _profile_count("schema cache hits")
+        return _read_cached_schema(entry)
+    _profile_count("schema cache misses" if entry is None else "schema cache revalidations")
+    
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        with _profiled("schema fetch"):
+            response = _get_http_session().get(url, headers=headers)
+    except requests.RequestException as e:
+        if entry is None:
+            raise
+        _warn(f"  Warning: Could not revalidate {url} ({e}), using cached copy")
+        return _read_cached_schema(entry)
+    
+    if response.status_code == 304 and entry is not None:
+        # Not modified: restart the TTL without rewriting the cached object
+        entry["fetched_at"] = time.time()
+        try:
+            _write_atomic(_cache_entry_path(url), json.dumps(entry))
+        except OSError as e:
+            _warn(f"  Warning: Could not update schema cache for {url}: {e}")
+        return _read_cached_schema(entry)
+    _profile_count("bytes fetched", len(response.content))
     response.raise_for_status()
-    return yaml.safe_load(response.text)
+    
+    # Round-trip through JSON so fresh and cached schemas are identical
+    with _profiled("yaml parse"):
+        serialized = json.dumps(yaml.safe_load(response.text), default=_json_default)
+    content_hash = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    try:
+        _store_cached_schema(url, serialized, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    except OSError as e:
+        _warn(f"  Warning: Could not write schema cache for {url}: {e}")
+    shared = _schema_documents.get(content_hash)
+    if shared is not None:
+        _profile_count("schema documents shared")
+        _schema_aliases[url] = content_hash
+        return shared[0]
+    return _intern_schema(url, json.loads(serialized), content_hash)
 
 def extract_schema_info_from_url(url):
     """
@@ -165,7 +692,41 @@ def is_core_context_url(context_url):
     """
     return '/schema/core/' in context_url
 
-def load_core_schema_for_context_url(context_url, registry_list):
+def register_schemas(registry_list, schemas):
+    """
+    Add fetched schemas to the registry in one bulk step and crawl it.
+    
+    Building the Registry once for all resources avoids creating an intermediate immutable
+    Registry per schema, and crawling up front means $ref lookups during validation never
+    have to crawl the registry again.
+    
+    Args:
+        registry_list: List containing referencing Registry (mutated in place)
+        schemas: Dict mapping attributes.yaml URLs to schema data
+    """
+    if not schemas:
+        return
+    with _profiled("registry build"):
+        registry_list[0] = registry_list[0].with_resources(
+            (url, Resource.from_contents(schema_data, DRAFT202012)) for url, schema_data in schemas.items()
+        ).crawl()
+
+@contextlib.contextmanager
+def _fetching_with(fetch):
+    """Make the schema loaders on this thread fetch with fetch instead of load_schema_from_url."""
+    previous = getattr(_thread_fetch, "fetch", None)
+    _thread_fetch.fetch = fetch
+    try:
+        yield
+    finally:
+        _thread_fetch.fetch = previous
+
+def _load_schema(url):
+    # load_schema_from_url unless a caller such as BecknValidator installed its own fetch
+    fetch = getattr(_thread_fetch, "fetch", None)
+    return (fetch or load_schema_from_url)(url)
+
+def load_core_schema_for_context_url(context_url, registry_list, schema_data=None):
     """
     Load core attributes schema for a given @context URL.
     
@@ -175,6 +736,8 @@ def load_core_schema_for_context_url(context_url, registry_list):
     Args:
         context_url: The @context URL from the JSON (e.g., .../core/v2/context.jsonld)
         registry_list: List containing referencing Registry (mutated in place)
+        schema_data: Already fetched schema (e.g., by prefetch_schemas); fetched if None.
+            It is only registered if register_schemas has not already added it.
     
     Returns:
         dict: Schema data if successful, None if loading fails
@@ -183,25 +746,28 @@ def load_core_schema_for_context_url(context_url, registry_list):
     attributes_url = get_attributes_url_from_context_url(context_url)
     
     # Check if already loaded in registry
-    try:
-        resource = registry.get(attributes_url)
-        if resource is not None:
-            return resource.contents
-    except (KeyError, AttributeError):
-        pass
+    if schema_data is None:
+        try:
+            resource = registry.get(attributes_url)
+            if resource is not None:
+                return resource.contents
+        except (KeyError, AttributeError):
+            pass
     
     # Load from the branch specified in context_url
     try:
-        schema_data = load_schema_from_url(attributes_url)
-        registry_list[0] = registry.with_resource(attributes_url, Resource.from_contents(schema_data, DRAFT202012))
+        if schema_data is None:
+            schema_data = _load_schema(attributes_url)
+        if attributes_url not in registry:
+            register_schemas(registry_list, {attributes_url: schema_data})
         branch = extract_branch_from_context_url(context_url)
-        print(f"  Loaded core attributes schema (branch: {branch})")
+        _log(f"  Loaded core attributes schema (branch: {branch})")
         return schema_data
     except Exception as e:
-        print(f"  Warning: Failed to load core attributes schema from {attributes_url}: {e}")
+        _warn(f"  Warning: Failed to load core attributes schema from {attributes_url}: {e}")
         return None
 
-def load_schema_for_context_url(context_url, attribute_schemas_map, registry_list=None):
+def load_schema_for_context_url(context_url, attribute_schemas_map, registry_list=None, schema_data=None):
     """
     Load schema for a given @context URL from the branch specified in the URL.
     
@@ -209,6 +775,7 @@ def load_schema_for_context_url(context_url, attribute_schemas_map, registry_lis
         context_url: The @context URL from the JSON
         attribute_schemas_map: Existing map to add to (may be modified)
         registry_list: List containing referencing Registry (mutated in place, optional)
+        schema_data: Already fetched schema (e.g., by prefetch_schemas); fetched if None
     
     Returns:
         tuple: (schema_name, schema_data, schema_url) or None if failed
@@ -232,50 +799,325 @@ def load_schema_for_context_url(context_url, attribute_schemas_map, registry_lis
     
     # Load the schema from the branch specified in context_url
     try:
-        schema_data = load_schema_from_url(attributes_url)
+        if schema_data is None:
+            schema_data = _load_schema(attributes_url)
         attribute_schemas_map[context_url] = (schema_name, schema_data, attributes_url)
-        if registry_list is not None:
-            registry = registry_list[0]
-            registry_list[0] = registry.with_resource(attributes_url, Resource.from_contents(schema_data, DRAFT202012))
-        print(f"  Loaded: {schema_name}/{version} (branch: {branch})")
+        _prepare_jsonld_schemas(attributes_url, schema_data)
+        if registry_list is not None and attributes_url not in registry_list[0]:
+            register_schemas(registry_list, {attributes_url: schema_data})
+        _log(f"  Loaded: {schema_name}/{version} (branch: {branch})")
         return (schema_name, schema_data, attributes_url)
     except Exception as e:
-        print(f"  Warning: Failed to load {schema_name}/{version} from {attributes_url}: {e}")
+        _warn(f"  Warning: Failed to load {schema_name}/{version} from {attributes_url}: {e}")
+        return None
+
+
+def _with_jsonld_properties(schema_def):
+    """
+    Return a variant of an attribute schema that accepts JSON-LD @context and @type.
+    
+    Domain schemas often set additionalProperties: false, which would otherwise reject
+    the @context and @type keys every JSON-LD object carries. Only the top-level dict and
+    its properties are copied; nested subschemas are shared with the original.
+    """
+    if schema_def.get("additionalProperties") is not False:
+        return schema_def
+    return {
+        **schema_def,
+        "properties": {
+            **schema_def.get("properties", {}),
+            "@context": {"type": "string"},
+            "@type": {"type": "string"},
+        },
+    }
+
+def _prepare_jsonld_schemas(attributes_url, schema_data):
+    """
+    Build the JSON-LD-relaxed variant of every schema in an attributes.yaml file once.
+    
+    Called when the schema is loaded, so validating an attribute object never copies
+    its schema. Documents shared by several URLs (see _schema_content_key) are prepared once.
+    """
+    key = _schema_content_key(attributes_url)
+    if key != attributes_url and key in _jsonld_schemas:
+        return
+    schemas = schema_data.get("components", {}).get("schemas", {})
+    _jsonld_schemas[key] = {
+        schema_key: _with_jsonld_properties(schema_def)
+        for schema_key, schema_def in schemas.items()
+        if isinstance(schema_def, dict)
+    }
+
+def _get_jsonld_schema(attributes_url, schema_key, schema_def):
+    # Falls back to relaxing on first use for maps populated outside load_schema_for_context_url
+    prepared = _jsonld_schemas.setdefault(_schema_content_key(attributes_url), {})
+    jsonld_schema = prepared.get(schema_key)
+    if jsonld_schema is None:
+        jsonld_schema = prepared[schema_key] = _with_jsonld_properties(schema_def)
+    return jsonld_schema
+
+def get_compiled_validator(attributes_url, object_name, registry, schema_def=None):
+    """
+    Return a cached, compiled validator for a schema in an attributes.yaml file.
+    
+    The schema is checked against its meta-schema and compiled only on the first request
+    for a given (attributes_url, object_name); later calls reuse the same validator. When
+    the registry has changed since, the validator is rebound to the new registry. URLs
+    serving the same self-contained document share one validator (see _schema_content_key).
+    
+    The pointer into components/schemas is resolved here, once, and the validator is rooted
+    at the attributes.yaml document, so validating an object never starts with a $ref lookup
+    and internal "#/components/schemas/..." references resolve against the full document.
+    
+    Args:
+        attributes_url: URL of the attributes.yaml file holding the schema
+        object_name: Schema name under components/schemas (e.g., "Order", "ChargingOffer")
+        registry: referencing Registry used for $ref resolution
+        schema_def: JSON-LD-relaxed attribute schema (see _get_jsonld_schema). If None, the
+            core object schema is looked up in the full document held by the registry.
+    
+    Returns:
+        jsonschema validator instance bound to registry
+    
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+        referencing.exceptions.Unresolvable: If the core schema cannot be found in the registry
+    """
+    key = (_schema_content_key(attributes_url), object_name)
+    cached = _compiled_validators.get(key)
+    if cached is not None and cached[0] is registry:
+        return cached[1]
+    
+    with _profiled("validator compile"):
+        if schema_def is None:
+            schema = {"$ref": f"{attributes_url}#/components/schemas/{object_name}"}
+        else:
+            schema = schema_def
+        cls = validator_for(schema)
+        if cached is None:
+            cls.check_schema(schema)
+        
+        if schema_def is None:
+            resolved = registry.resolver().lookup(schema["$ref"])
+            validator = cls(resolved.contents, registry=registry, _resolver=resolved.resolver)
+        elif attributes_url in registry:
+            validator = cls(schema, registry=registry, _resolver=registry.resolver(base_uri=attributes_url))
+        else:
+            validator = cls(schema, registry=registry)
+    _compiled_validators[key] = (registry, validator)
+    return validator
+
+def _document_digest(uri, contents):
+    cached = _document_digests.get(uri)
+    if cached is None or cached[0] is not contents:
+        serialized = json.dumps(contents, sort_keys=True, default=_json_default)
+        cached = _document_digests[uri] = (contents, hashlib.sha256(serialized.encode("utf-8")).hexdigest())
+    return cached[1]
+
+def _generate_validator_source(attributes_url, object_name, schema, registry, cls):
+    """
+    Return generated source for a schema, from the codegen cache when still current.
+    
+    Cache entries live in <cache_dir>/codegen and record a digest of every schema document
+    the source was generated from, so a schema update regenerates it.
+    """
+    def get_document(uri):
+        resource = registry.get(uri)
+        if resource is None:
+            return None
+        used[uri] = resource.contents
+        return resource.contents
+    
+    used = {}
+    cache_path = None
+    if _schema_cache_config["enabled"]:
+        key = json.dumps([schema_codegen.CODEGEN_VERSION, attributes_url, object_name, schema],
+                         sort_keys=True, default=_json_default)
+        cache_path = os.path.join(_schema_cache_config["cache_dir"], "codegen",
+                                  f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if all(get_document(uri) is not None and _document_digest(uri, used[uri]) == digest
+                   for uri, digest in entry["documents"].items()):
+                _profile_count("codegen cache hits")
+                return entry["source"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        _profile_count("codegen cache misses")
+    
+    used = {}
+    source = schema_codegen.generate_validator_source(schema, attributes_url, get_document, cls.VALIDATORS)
+    if cache_path is not None:
+        documents = {uri: _document_digest(uri, contents) for uri, contents in used.items()}
+        try:
+            _write_atomic(cache_path, json.dumps({"source": source, "documents": documents}))
+        except OSError as e:
+            _warn(f"  Warning: Could not cache generated validator for {object_name}: {e}")
+    return source
+
+def get_generated_validator(attributes_url, object_name, registry, schema_def=None):
+    """
+    Return a generated check for a schema, or None if codegen is off or cannot translate it.
+    
+    The check returns True only for instances jsonschema would also accept; anything it
+    rejects must still be validated with the compiled validator, which reports the error.
+    
+    Args:
+        attributes_url: URL of the attributes.yaml file holding the schema
+        object_name: Schema name under components/schemas
+        registry: referencing Registry holding the schema documents
+        schema_def: JSON-LD-relaxed attribute schema, or None for a core object (as in
+            get_compiled_validator)
+    
+    Returns:
+        callable: check(instance) -> bool, or None
+    """
+    if not _codegen_config["enabled"]:
         return None
+    key = (_schema_content_key(attributes_url), object_name)
+    if key in _generated_validators:
+        return _generated_validators[key]
+    
+    if schema_def is None:
+        schema = {"$ref": f"{attributes_url}#/components/schemas/{object_name}"}
+    else:
+        schema = schema_def
+    check = None
+    try:
+        with _profiled("codegen"):
+            source = _generate_validator_source(attributes_url, object_name, schema, registry, validator_for(schema))
+            check = schema_codegen.load_validator(source, f"<generated validator for {object_name}>")
+    except schema_codegen.UnsupportedSchemaError as e:
+        _log(f"  Codegen: {object_name} is validated with jsonschema only ({e})")
+    _generated_validators[key] = check
+    return check
+
+def _is_under_skipped_path(error_path, skip_paths):
+    error_path = tuple(error_path)
+    return any(error_path[:i] in skip_paths for i in range(1, len(error_path) + 1))
+
+def _validate_with(validator, instance, skip_paths=None, fast_check=None):
+    """
+    Validate an instance with a compiled validator, raising the best-matching error.
+    
+    Mirrors jsonschema.validate() without re-checking the schema on every call.
+    
+    Args:
+        validator: Compiled validator from get_compiled_validator
+        instance: Object to validate
+        skip_paths: Optional set of path tuples relative to instance; errors at or below
+            these paths are ignored (used for stubbed children in streaming mode)
+        fast_check: Optional generated check from get_generated_validator; instances it
+            accepts are valid without running the compiled validator
+    """
+    if fast_check is not None and not skip_paths:
+        try:
+            if fast_check(instance):
+                return
+        except Exception:
+            # Never trust a failing generated check; jsonschema decides
+            pass
+    errors = validator.iter_errors(instance)
+    if skip_paths:
+        errors = (e for e in errors if not _is_under_skipped_path(e.absolute_path, skip_paths))
+    error = best_match(errors)
+    if error is not None:
+        raise error
 
+def _find_attribute_schema(schemas, schema_type):
+    """
+    Find the schema for an attribute @type, trying an exact match before a case-insensitive one.
+    
+    Returns:
+        tuple: (schema_key, schema_def) or None if no schema matches
+    """
+    if schema_type in schemas:
+        return schema_type, schemas[schema_type]
+    for schema_key, schema_def in schemas.items():
+        if schema_key.lower() == schema_type.lower():
+            return schema_key, schema_def
+    return None
 
-def _validate_attribute_object(data, schema_def, schema_type, schema_name, path, errors, registry_list):
+def _validate_attribute_object(data, schema_def, schema_type, schema_name, schema_url, path_segments, errors, registry_list, skip_paths=None, records=None):
     """
     Validate a domain-specific attribute object against its schema.
     
-    Modifies the schema to allow @context and @type properties even when
-    additionalProperties is False, as these are required for JSON-LD.
+    Uses a cached validator for the schema variant prepared at load time, which allows
+    @context and @type properties even when additionalProperties is False, as these are
+    required for JSON-LD.
     
     Args:
         data: Object data to validate
         schema_def: Schema definition from attributes.yaml
         schema_type: Type name for logging (e.g., "ChargingOffer")
         schema_name: Schema name for logging (e.g., "EvChargingOffer")
-        path: JSON path for error reporting
+        schema_url: URL of the attributes.yaml file the schema came from
+        path_segments: Tuple of keys and list indices leading to the object
         errors: List to append validation errors to
         registry_list: Registry list for reference resolution
+        skip_paths: Optional set of relative path tuples whose errors are ignored
+        records: Optional list to append a result record to (see _report_result)
     """
-    print(f"  Validating {schema_type} (from {schema_name}) at {path or 'root'}...")
-    
-    validation_schema = copy.deepcopy(schema_def)
-    if validation_schema.get("additionalProperties") is False:
-        if "properties" not in validation_schema:
-            validation_schema["properties"] = {}
-        validation_schema["properties"]["@context"] = {"type": "string"}
-        validation_schema["properties"]["@type"] = {"type": "string"}
+    path = None
+    if _report_config["verbose"]:
+        path = _render_path(path_segments)
+        print(f"  Validating {schema_type} (from {schema_name}) at {path or 'root'}...")
     
+    started = time.perf_counter()
+    error = None
     try:
-        validate(instance=data, schema=validation_schema, registry=registry_list[0])
-        print(f"  {schema_type} at {path or 'root'} is VALID.")
+        jsonld_schema = _get_jsonld_schema(schema_url, schema_type, schema_def)
+        validator = get_compiled_validator(schema_url, schema_type, registry_list[0], jsonld_schema)
+        _validate_with(validator, data, skip_paths,
+                       get_generated_validator(schema_url, schema_type, registry_list[0], jsonld_schema))
     except ValidationError as e:
-        print(f"  {schema_type} at {path or 'root'} is INVALID: {e.message}")
-        print(f"  Path: {e.json_path}")
-        errors.append(f"{path} ({schema_type}): {e.message}")
+        error = e
+    _report_result(schema_type, path_segments, path, error, errors, records, data.get("@type"), schema_url, started, qualify=True)
+
+def _report_result(label, path_segments, path, error, errors, records, obj_type, schema_url, started, qualify=False):
+    """
+    Record the outcome of validating one object.
+    
+    The error (if any) is appended to errors; per-object lines are printed only in verbose
+    mode, and a structured record is appended only when records is a list. The path is
+    rendered only when one of those needs it.
+    
+    Args:
+        label: Schema name shown in output (e.g., "Order", "ChargingOffer")
+        path_segments: Tuple of keys and list indices leading to the object
+        path: Rendered path, or None if not rendered yet
+        error: ValidationError, or None if the object is valid
+        errors: List to append validation errors to
+        records: Optional list to append a result record to
+        obj_type: The object's @type
+        schema_url: URL of the attributes.yaml file the schema came from
+        started: time.perf_counter() value from before validation
+        qualify: If True, include the label in the error message
+    """
+    if _profile is not None:
+        _profile_object(schema_url, label, time.perf_counter() - started, error is not None)
+    if path is None and (error is not None or records is not None):
+        path = _render_path(path_segments)
+    if error is not None:
+        errors.append(f"{path} ({label}): {error.message}" if qualify else f"{path}: {error.message}")
+    if _report_config["verbose"]:
+        if error is None:
+            print(f"  {label} at {path or 'root'} is VALID.")
+        else:
+            print(f"  {label} at {path or 'root'} is INVALID: {error.message}")
+            print(f"  Path: {error.json_path}")
+    if records is not None:
+        records.append({
+            "file": None,
+            "path": path,
+            "type": obj_type,
+            "schema_url": schema_url,
+            "valid": error is None,
+            "error": error.message if error is not None else None,
+            "error_path": error.json_path if error is not None else None,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
 
 def get_schema_store():
     """
@@ -291,11 +1133,117 @@ def get_schema_store():
     attribute_schemas_map = {}
     return [registry], None, attribute_schemas_map
 
-def validate_payload(payload, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False):
+def _resolve_jsonld_target(context_url, obj_type, registry_list, attribute_schemas_map, core_only=False):
+    """
+    Find the schema that objects with a given @context and @type are validated against.
+    
+    Loads the schema on demand. Core Beckn objects (beckn:Order, etc.) resolve to core
+    attributes.yaml; other types to the domain attributes.yaml named by @context.
+    
+    Returns:
+        tuple: ("core", object_name, attributes_url, schema_def) or
+            ("attribute", schema_key, schema_def, schema_name, schema_url), or False if no
+            schema applies
+    """
+    # Handle core Beckn objects (e.g., beckn:Order, beckn:Offer)
+    if obj_type and obj_type.startswith("beckn:"):
+        if is_core_context_url(context_url):
+            attributes_url = get_attributes_url_from_context_url(context_url)
+            if attributes_url not in registry_list[0]:
+                load_core_schema_for_context_url(context_url, registry_list)
+            
+            try:
+                resource = registry_list[0].get(attributes_url)
+                if resource is not None:
+                    core_attributes = resource.contents
+                    object_name = obj_type.split(":")[-1]
+                    
+                    if "components" in core_attributes and "schemas" in core_attributes["components"]:
+                        schemas = core_attributes["components"]["schemas"]
+                        if object_name in schemas:
+                            return ("core", object_name, attributes_url, schemas[object_name])
+            except (KeyError, AttributeError):
+                pass
+    
+    # Handle non-core domain-specific attribute objects
+    else:
+        if core_only:
+            # Skip domain-specific attribute validation when --core-only flag is set
+            pass
+        else:
+            if context_url not in attribute_schemas_map:
+                load_schema_for_context_url(context_url, attribute_schemas_map, registry_list)
+            
+            if context_url in attribute_schemas_map:
+                schema_name, schema_data, schema_url = attribute_schemas_map[context_url]
+                schema_type = obj_type.split(":")[-1] if ":" in obj_type else obj_type
+                
+                if "components" in schema_data and "schemas" in schema_data["components"]:
+                    schemas = schema_data["components"]["schemas"]
+                    
+                    match = _find_attribute_schema(schemas, schema_type)
+                    if match is not None:
+                        schema_key, schema_def = match
+                        return ("attribute", schema_key, schema_def, schema_name, schema_url)
+    return False
+
+def _validate_jsonld_object(data, path_segments, errors, registry_list, attribute_schemas_map, core_only=False, skip_paths=None, records=None, target=None):
+    """
+    Validate a single object carrying @context and @type against its schema.
+    
+    Args:
+        data: Object with @context and @type
+        path_segments: Tuple of keys and list indices leading to the object
+        errors: List to append validation errors to
+        registry_list: List containing referencing Registry with all loaded schemas
+        attribute_schemas_map: Dict mapping @context URLs to (schema_name, schema_data, schema_url)
+        core_only: If True, skip domain-specific attribute objects
+        skip_paths: Set of relative path tuples whose errors are ignored (see _validate_with)
+        records: Optional list to append a result record to (see _report_result)
+        target: Result of _resolve_jsonld_target for this object's @context and @type, when
+            already resolved for a group of siblings; resolved here if None
+    
+    Returns:
+        bool: True if a schema was found and the object was validated
+    """
+    if target is None:
+        target = _resolve_jsonld_target(data.get("@context"), data.get("@type"), registry_list, attribute_schemas_map, core_only)
+    if not target:
+        return False
+    
+    if target[0] == "attribute":
+        _, schema_key, schema_def, schema_name, schema_url = target
+        _validate_attribute_object(data, schema_def, schema_key, schema_name, schema_url, path_segments, errors, registry_list, skip_paths, records)
+        return True
+    
+    _, object_name, attributes_url, schema_def = target
+    path = None
+    if _report_config["verbose"]:
+        path = _render_path(path_segments)
+        print(f"  Validating {object_name} at {path or 'root'}...")
+    started = time.perf_counter()
+    error = None
+    try:
+        # Resolved against the full document so internal JSON pointers resolve
+        validator = get_compiled_validator(attributes_url, object_name, registry_list[0])
+        _validate_with(validator, data, skip_paths, get_generated_validator(attributes_url, object_name, registry_list[0]))
+    except ValidationError as e:
+        error = e
+    except Exception as e:
+        # Fallback to direct fragment validation if $ref resolution fails
+        _warn(f"  Warning: $ref resolution failed, trying direct validation: {e}")
+        try:
+            validate(instance=data, schema=schema_def, registry=registry_list[0])
+        except ValidationError as ve:
+            error = ve
+    _report_result(object_name, path_segments, path, error, errors, records, data.get("@type"), attributes_url, started)
+    return True
+
+def validate_payload(payload, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False, skip_keys=None, records=None):
     """
     Validate JSON payload against Beckn protocol schemas.
     
-    Recursively traverses the payload, identifies objects with @context and @type,
+    Traverses the payload, identifies objects with @context and @type,
     loads schemas on-demand, and validates each object against its corresponding schema.
     Supports both core Beckn objects (beckn:Order, etc.) and domain-specific attribute
     objects (ChargingOffer, etc.).
@@ -306,152 +1254,1891 @@ def validate_payload(payload, registry_list, attributes_schema, attribute_schema
         attributes_schema: Unused, kept for compatibility (None)
         attribute_schemas_map: Dict mapping @context URLs to (schema_name, schema_data, schema_url)
         core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        skip_keys: Optional keys whose values are known to hold no @context objects
+            (e.g., {"context"} for the Beckn envelope); they are not traversed
+        records: Optional list to append one result record per validated object to
     
     Returns:
         list: List of validation error messages (empty if validation passes)
     """
     errors = []
+    skip_keys = NON_JSONLD_KEYS | frozenset(skip_keys or ())
     
-    def find_and_validate_objects(data, path=""):
+    # Depth-first walk with an explicit stack, in the same order as a recursive walk.
+    # Paths are (parent_path, segment) pairs, only flattened for objects being validated.
+    # Only containers are pushed; exact type checks are safe since payloads come from
+    # json/ijson, which build plain dicts and lists. The third item is the schema target
+    # shared by a homogeneous array's elements (see _homogeneous_target), or None.
+    stack = [(payload, None, None)] if isinstance(payload, (dict, list)) else []
+    pop, push = stack.pop, stack.append
+    while stack:
+        data, path, target = pop()
         if isinstance(data, dict):
             # Check for objects with @context and @type
             if "@context" in data and "@type" in data and attribute_schemas_map is not None:
-                context_url = data.get("@context")
-                obj_type = data.get("@type")
-                
-                # Handle core Beckn objects (e.g., beckn:Order, beckn:Offer)
-                if obj_type and obj_type.startswith("beckn:"):
-                    if is_core_context_url(context_url):
-                        attributes_url = get_attributes_url_from_context_url(context_url)
-                        if attributes_url not in registry_list[0]:
-                            load_core_schema_for_context_url(context_url, registry_list)
-                        
-                        try:
-                            resource = registry_list[0].get(attributes_url)
-                            if resource is not None:
-                                core_attributes = resource.contents
-                                object_name = obj_type.split(":")[-1]
-                                
-                                if "components" in core_attributes and "schemas" in core_attributes["components"]:
-                                    schemas = core_attributes["components"]["schemas"]
-                                    if object_name in schemas:
-                                        print(f"  Validating {object_name} at {path or 'root'}...")
-                                        try:
-                                            # Use $ref to full document to allow internal JSON pointer resolution
-                                            schema_to_validate = {
-                                                "$ref": f"{attributes_url}#/components/schemas/{object_name}"
-                                            }
-                                            validate(instance=data, schema=schema_to_validate, registry=registry_list[0])
-                                            print(f"  {object_name} at {path or 'root'} is VALID.")
-                                        except ValidationError as e:
-                                            print(f"  {object_name} at {path or 'root'} is INVALID: {e.message}")
-                                            print(f"  Path: {e.json_path}")
-                                            errors.append(f"{path}: {e.message}")
-                                        except Exception as e:
-                                            # Fallback to direct fragment validation if $ref resolution fails
-                                            print(f"  Warning: $ref resolution failed, trying direct validation: {e}")
-                                            try:
-                                                validate(instance=data, schema=schemas[object_name], registry=registry_list[0])
-                                                print(f"  {object_name} at {path or 'root'} is VALID.")
-                                            except ValidationError as ve:
-                                                print(f"  {object_name} at {path or 'root'} is INVALID: {ve.message}")
-                                                print(f"  Path: {ve.json_path}")
-                                                errors.append(f"{path}: {ve.message}")
-                        except (KeyError, AttributeError):
-                            pass
-                
-                # Handle non-core domain-specific attribute objects
-                else:
-                    if core_only:
-                        # Skip domain-specific attribute validation when --core-only flag is set
-                        pass
-                    else:
-                        if context_url not in attribute_schemas_map:
-                            load_schema_for_context_url(context_url, attribute_schemas_map, registry_list)
-                        
-                        if context_url in attribute_schemas_map:
-                            schema_name, schema_data, schema_url = attribute_schemas_map[context_url]
-                            schema_type = obj_type.split(":")[-1] if ":" in obj_type else obj_type
-                            
-                            if "components" in schema_data and "schemas" in schema_data["components"]:
-                                schemas = schema_data["components"]["schemas"]
-                                
-                                # Try exact match first
-                                if schema_type in schemas:
-                                    _validate_attribute_object(data, schemas[schema_type], schema_type, schema_name, path, errors, registry_list)
-                                else:
-                                    # Try case-insensitive match
-                                    for schema_key, schema_def in schemas.items():
-                                        if schema_key.lower() == schema_type.lower():
-                                            _validate_attribute_object(data, schema_def, schema_key, schema_name, path, errors, registry_list)
-                                            break
+                _validate_jsonld_object(data, _path_segments(path), errors, registry_list, attribute_schemas_map, core_only,
+                                        records=records, target=target)
             
-            # Recursively check children
-            for key, value in data.items():
-                find_and_validate_objects(value, f"{path}/{key}" if path else key)
-        elif isinstance(data, list):
-            for idx, item in enumerate(data):
-                find_and_validate_objects(item, f"{path}[{idx}]")
-
-    find_and_validate_objects(payload)
+            for key, value in reversed(data.items()):
+                value_type = type(value)
+                if (value_type is dict or value_type is list) and key not in skip_keys:
+                    push((value, (path, key), None))
+        else:
+            target = None
+            if len(data) > 1 and attribute_schemas_map is not None:
+                target = _homogeneous_target(data, registry_list, attribute_schemas_map, core_only)
+            for idx in range(len(data) - 1, -1, -1):
+                value = data[idx]
+                value_type = type(value)
+                if value_type is dict:
+                    push((value, (path, idx), target))
+                elif value_type is list:
+                    push((value, (path, idx), None))
     return errors
 
-def process_file(filepath, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False):
+def _homogeneous_target(items, registry_list, attribute_schemas_map, core_only=False):
     """
-    Process and validate a JSON file or Postman collection.
+    Resolve the schema once for an array whose elements share the same @context and @type.
     
-    Supports two file types:
-    1. Regular JSON files: Validated directly
-    2. Postman collections: Extracts JSON bodies from request items and validates them
+    Long arrays such as beckn:items and beckn:offers in on_discover catalogs are usually
+    homogeneous, so the URL parsing, schema lookup and case-insensitive type match are done
+    once per array instead of once per element.
     
-    Args:
-        filepath: Path to JSON file or Postman collection
-        registry_list: List containing referencing Registry
-        attributes_schema: Unused, kept for compatibility (None)
-        attribute_schemas_map: Dict mapping @context URLs to schema info
-        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+    Returns:
+        The shared _resolve_jsonld_target result, or None if the elements differ (each is
+        then resolved on its own)
     """
-    print(f"Processing {filepath}...")
-    try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        is_postman = "info" in data and "_postman_id" in data.get("info", {})
-        
-        if is_postman:
-            print("  Identified as Postman collection.")
-            _traverse_postman_items(data.get("item", []), registry_list, attributes_schema, attribute_schemas_map, core_only)
+    first = items[0]
+    if type(first) is not dict:
+        return None
+    context_url = first.get("@context")
+    obj_type = first.get("@type")
+    if not isinstance(context_url, str) or not isinstance(obj_type, str):
+        return None
+    for item in items:
+        if type(item) is not dict or item.get("@context") != context_url or item.get("@type") != obj_type:
+            return None
+    return _resolve_jsonld_target(context_url, obj_type, registry_list, attribute_schemas_map, core_only)
+
+def _path_segments(path):
+    # Flatten a (parent_path, segment) chain into a tuple of segments
+    segments = []
+    while path is not None:
+        path, segment = path
+        segments.append(segment)
+    return tuple(reversed(segments))
+
+def _render_path(segments):
+    # Keys joined with "/", list indices as "[i]", e.g. message/catalogs[0]/beckn:items[3]
+    path = ""
+    for segment in segments:
+        if isinstance(segment, int):
+            path += f"[{segment}]"
         else:
-            validate_payload(data, registry_list, attributes_schema, attribute_schemas_map, core_only)
-    except Exception as e:
-        print(f"  Error processing {filepath}: {e}")
+            path = f"{path}/{segment}" if path else segment
+    return path
 
-def _traverse_postman_items(items, registry_list, attributes_schema, attribute_schemas_map, core_only=False):
+def stream_validate_file(filepath, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False, records=None):
     """
-    Recursively traverse Postman collection items and validate JSON request bodies.
+    Validate a JSON file incrementally from parser events, without loading it whole.
+    
+    Objects are rebuilt from ijson events. When an object with @context and @type closes,
+    it is validated and then replaced in its parent by a stub holding just @context and
+    @type, so memory stays bounded by the largest single JSON-LD object rather than the
+    whole message. A parent is validated with its JSON-LD children stubbed out, and errors
+    inside those children are ignored there because each child reports its own errors.
+    Objects are therefore reported innermost first, and each error is reported once.
+    
+    Postman collections have no JSON-LD objects at the top level, so they are built in full
+    and their request bodies validated as in process_file.
     
     Args:
-        items: List of Postman collection items (may contain nested items)
+        filepath: Path to JSON file or Postman collection
         registry_list: List containing referencing Registry
         attributes_schema: Unused, kept for compatibility (None)
         attribute_schemas_map: Dict mapping @context URLs to schema info
         core_only: If True, only validate core Beckn objects, skip domain-specific attributes
-    """
-    for item in items:
-        if "item" in item:
-            _traverse_postman_items(item["item"], registry_list, attributes_schema, attribute_schemas_map, core_only)
-        if "request" in item and "body" in item["request"]:
+        records: Optional list to append one result record per validated object to
+    
+    Returns:
+        list: List of validation error messages (empty if validation passes)
+    
+    Raises:
+        RuntimeError: If the optional ijson package is not installed
+    """
+    if ijson is None:
+        raise RuntimeError("streaming validation requires the ijson package (pip install ijson)")
+    
+    errors = []
+    # Each frame: [container, segment in parent, pending map key, paths of stubbed JSON-LD children]
+    stack = []
+    root = None
+    
+    def attach(value):
+        nonlocal root
+        if not stack:
+            root = value
+        elif isinstance(stack[-1][0], dict):
+            stack[-1][0][stack[-1][2]] = value
+        else:
+            stack[-1][0].append(value)
+    
+    def next_segment():
+        if not stack:
+            return None
+        container = stack[-1][0]
+        return stack[-1][2] if isinstance(container, dict) else len(container)
+    
+    with open(filepath, 'rb') as f:
+        for _, event, value in ijson.parse(f, use_float=True):
+            if event == "map_key":
+                stack[-1][2] = value
+            elif event == "start_map":
+                stack.append([{}, next_segment(), None, set()])
+            elif event == "start_array":
+                stack.append([[], next_segment(), None, set()])
+            elif event in ("end_map", "end_array"):
+                container, segment, _, stubbed = stack.pop()
+                parent_stubbed = stack[-1][3] if stack else None
+                if (event == "end_map" and "@context" in container and "@type" in container
+                        and attribute_schemas_map is not None):
+                    path_segments = tuple(frame[1] for frame in stack[1:]) + ((segment,) if stack else ())
+                    if _validate_jsonld_object(container, path_segments, errors, registry_list, attribute_schemas_map,
+                                               core_only, skip_paths=stubbed, records=records):
+                        container = {"@context": container["@context"], "@type": container["@type"]}
+                        if parent_stubbed is not None:
+                            parent_stubbed.add((segment,))
+                        stubbed = None
+                if stubbed and parent_stubbed is not None:
+                    parent_stubbed.update((segment,) + child for child in stubbed)
+                attach(container)
+            else:
+                attach(value)
+    
+    if _is_postman_collection(root):
+        _log("  Identified as Postman collection.")
+        errors.extend(_traverse_postman_items(root.get("item", []), registry_list, attributes_schema, attribute_schemas_map, core_only, records))
+    return errors
+
+def _is_postman_collection(data):
+    return isinstance(data, dict) and "info" in data and "_postman_id" in data.get("info", {})
+
+def _iter_postman_bodies(items):
+    """
+    Recursively yield parsed JSON request bodies from Postman collection items.
+    
+    Bodies that are not raw JSON are skipped.
+    """
+    for _, json_body in _iter_postman_requests(items):
+        yield json_body
+
+def _iter_postman_requests(items, folders=()):
+    # (item name, parsed raw JSON body) pairs; names include their folders, e.g. "EV / on_discover / Catalog"
+    for item in items:
+        name = folders + (str(item.get("name", "")),)
+        if "item" in item:
+            yield from _iter_postman_requests(item["item"], name)
+        if "request" in item and "body" in item["request"]:
             body = item["request"]["body"]
             if body.get("mode") == "raw":
                 try:
-                    json_body = json.loads(body["raw"])
-                    validate_payload(json_body, registry_list, attributes_schema, attribute_schemas_map, core_only)
+                    yield " / ".join(name), json.loads(body["raw"])
                 except json.JSONDecodeError:
                     pass
 
+# Envelope fields that differ between otherwise identical example requests and are never
+# validated (the Beckn context is not a JSON-LD object); ignored when comparing bodies
+VOLATILE_CONTEXT_KEYS = frozenset({"message_id", "transaction_id", "timestamp"})
+
+def postman_body_digest(json_body):
+    """
+    Hash a request body for deduplication, ignoring key order and volatile context fields.
+    
+    Two bodies with the same digest produce the same validation errors and records.
+    """
+    context = json_body.get("context") if isinstance(json_body, dict) else None
+    if isinstance(context, dict) and "@context" not in context and "@type" not in context:
+        json_body = {**json_body, "context": {
+            key: value for key, value in context.items()
+            if key not in VOLATILE_CONTEXT_KEYS or isinstance(value, (dict, list))
+        }}
+    serialized = json.dumps(json_body, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+def process_file(filepath, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False, stream=False, records=None, jobs=1, body_results=None):
+    """
+    Process and validate a JSON file or Postman collection.
+    
+    Supports two file types:
+    1. Regular JSON files: Validated directly
+    2. Postman collections: Extracts JSON bodies from request items and validates them
+    
+    Args:
+        filepath: Path to JSON file or Postman collection
+        registry_list: List containing referencing Registry
+        attributes_schema: Unused, kept for compatibility (None)
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        stream: If True, validate incrementally with stream_validate_file
+        records: Optional list to append result records to, each tagged with filepath
+        jobs: Worker processes for the distinct request bodies of a Postman collection
+        body_results: Optional dict shared between collections so request bodies repeated
+            across them are validated once (see _traverse_postman_items)
+    
+    Returns:
+        list: Validation error messages, plus a processing error if the file could not be read
+    """
+    _log(f"Processing {filepath}...")
+    file_records = [] if records is not None else None
+    try:
+        if stream:
+            errors = stream_validate_file(filepath, registry_list, attributes_schema, attribute_schemas_map, core_only, file_records)
+        else:
+            with _profiled("input parse"), open(filepath, 'r') as f:
+                data = json.load(f)
+            
+            if _is_postman_collection(data):
+                _log("  Identified as Postman collection.")
+                errors = _traverse_postman_items(data.get("item", []), registry_list, attributes_schema, attribute_schemas_map, core_only, file_records,
+                                                 jobs, body_results)
+            else:
+                errors = validate_payload(data, registry_list, attributes_schema, attribute_schemas_map, core_only, records=file_records)
+    except Exception as e:
+        _warn(f"  Error processing {filepath}: {e}")
+        errors = [f"{filepath}: {e}"]
+        if file_records is not None:
+            file_records.append({
+                "file": None, "path": None, "type": None, "schema_url": None, "valid": False,
+                "error": str(e), "error_path": None, "duration_ms": None,
+            })
+    if file_records is not None:
+        for record in file_records:
+            record["file"] = filepath
+        records.extend(file_records)
+    return errors
+
+def _traverse_postman_items(items, registry_list, attributes_schema, attribute_schemas_map, core_only=False, records=None, jobs=1, body_results=None):
+    """
+    Recursively traverse Postman collection items and validate JSON request bodies.
+    
+    Generated collections repeat the same example under several folders (and across the
+    BAP and BPP collections), so bodies are grouped by postman_body_digest and each distinct
+    body is validated once, by worker processes when jobs > 1. Its errors and records are
+    then reported for every item carrying it: errors are prefixed with the item name, and
+    records carry it as "item".
+    
+    Args:
+        items: List of Postman collection items (may contain nested items)
+        registry_list: List containing referencing Registry
+        attributes_schema: Unused, kept for compatibility (None)
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        records: Optional list to append one result record per validated object to
+        jobs: Number of worker processes for the distinct bodies (1 validates in this process)
+        body_results: Optional {digest: (errors, records)} of bodies already validated, e.g.
+            in another collection; new results are added to it
+    
+    Returns:
+        list: Validation error messages across all request bodies
+    """
+    if body_results is None:
+        body_results = {}
+    requests_ = [(name, json_body, postman_body_digest(json_body)) for name, json_body in _iter_postman_requests(items)]
+    pending = {}
+    for name, json_body, digest in requests_:
+        if digest not in body_results and digest not in pending:
+            pending[digest] = json_body
+    
+    if jobs > 1 and len(pending) > 1:
+        warm_schema_refs(set().union(*(collect_schema_refs(body) for body in pending.values())),
+                         registry_list, attribute_schemas_map, core_only)
+        with _start_worker_pool(min(jobs, len(pending)), registry_list, attributes_schema, attribute_schemas_map,
+                                core_only, collect_records=True) as pool:
+            chunksize = max(1, len(pending) // (jobs * 4))
+            for digest, (body_errors, body_records, profile) in zip(
+                    pending, pool.imap(_validate_body_in_worker, pending.values(), chunksize)):
+                merge_profile(profile)
+                body_results[digest] = (body_errors, body_records)
+    
+    errors = []
+    for name, json_body, digest in requests_:
+        if digest in pending:
+            _log(f"  Request: {name}")
+            json_body = pending.pop(digest)
+            if digest not in body_results:
+                body_records = []
+                body_errors = validate_payload(json_body, registry_list, attributes_schema, attribute_schemas_map,
+                                               core_only, records=body_records)
+                body_results[digest] = (body_errors, body_records)
+        else:
+            _log(f"  Request: {name} (same body as an earlier request, not validated again)")
+        body_errors, body_records = body_results[digest]
+        errors.extend(f"{name}: {error}" for error in body_errors)
+        if records is not None:
+            records.extend({**record, "item": name} for record in body_records)
+    return errors
+
+def _validate_body_in_worker(json_body):
+    # One distinct Postman request body; output is discarded since duplicates are logged by the parent
+    registry_list, attributes_schema, attribute_schemas_map = _worker_state["store"]
+    records = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        errors = validate_payload(json_body, registry_list, attributes_schema, attribute_schemas_map,
+                                  _worker_state["core_only"], records=records)
+    profile = _profile
+    if profile is not None:
+        enable_profiling()
+    return errors, records, profile
+
+def collect_schema_refs(payload):
+    """
+    Collect the distinct (@context, @type) pairs of JSON-LD objects in a payload.
+    
+    URLs listed in the envelope's context.schema_context are included with a @type of None.
+    
+    Returns:
+        set: {(context_url, obj_type)} for every object carrying string @context and @type
+    """
+    refs = set()
+    context = payload.get("context") if isinstance(payload, dict) else None
+    schema_context = context.get("schema_context") if isinstance(context, dict) else None
+    if isinstance(schema_context, list):
+        refs.update((url, None) for url in schema_context if isinstance(url, str))
+    
+    stack = [payload]
+    while stack:
+        data = stack.pop()
+        if isinstance(data, dict):
+            context_url = data.get("@context")
+            obj_type = data.get("@type")
+            if isinstance(context_url, str) and isinstance(obj_type, str):
+                refs.add((context_url, obj_type))
+            stack.extend(data.values())
+        elif isinstance(data, list):
+            stack.extend(data)
+    return refs
+
+def _stream_collect_schema_refs(filepath):
+    """
+    Collect schema refs like collect_schema_refs, from ijson events instead of a loaded document.
+    
+    Postman collections keep their payloads in raw string bodies, so they are loaded in full.
+    """
+    refs = set()
+    # One [@context, @type] pair per open object
+    frames = []
+    with open(filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == "start_map":
+                frames.append([None, None])
+            elif event == "end_map":
+                context_url, obj_type = frames.pop()
+                if context_url is not None and obj_type is not None:
+                    refs.add((context_url, obj_type))
+            elif event == "string":
+                if prefix == "@context" or prefix.endswith(".@context"):
+                    frames[-1][0] = value
+                elif prefix == "@type" or prefix.endswith(".@type"):
+                    frames[-1][1] = value
+                elif prefix == "context.schema_context.item":
+                    refs.add((value, None))
+                elif prefix == "info._postman_id":
+                    return _collect_file_schema_refs(filepath)
+    return refs
+
+def _collect_file_schema_refs(filepath, stream=False):
+    # Unreadable files are skipped here; process_file reports them later
+    try:
+        if stream:
+            return _stream_collect_schema_refs(filepath)
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+    except Exception:
+        return set()
+    return _collect_data_schema_refs(data)
+
+def _collect_data_schema_refs(data):
+    # Refs of a parsed file: a payload, or every request body of a Postman collection
+    if _is_postman_collection(data):
+        refs = set()
+        for json_body in _iter_postman_bodies(data.get("item", [])):
+            refs |= collect_schema_refs(json_body)
+        return refs
+    return collect_schema_refs(data)
+
+def _plan_schema_loads(refs, registry_list, attribute_schemas_map, core_only=False):
+    """
+    Work out which schemas a set of refs still needs, as prefetch_schemas would load them.
+    
+    Returns:
+        tuple: (core_contexts, attribute_contexts, urls) where urls are the sorted
+            attributes.yaml URLs to fetch
+    """
+    core_contexts, attribute_contexts = set(), set()
+    for context_url, obj_type in refs:
+        if obj_type is None:
+            # schema_context entry: no @type to go by, so classify by URL
+            if is_core_context_url(context_url):
+                core_contexts.add(context_url)
+            elif not core_only:
+                attribute_contexts.add(context_url)
+        elif obj_type.startswith("beckn:"):
+            if is_core_context_url(context_url):
+                core_contexts.add(context_url)
+        elif not core_only:
+            attribute_contexts.add(context_url)
+    
+    # Same preconditions the loaders check before fetching
+    core_contexts = {
+        c for c in core_contexts if get_attributes_url_from_context_url(c) not in registry_list[0]
+    }
+    attribute_contexts = {
+        c for c in attribute_contexts
+        if c not in attribute_schemas_map and extract_branch_from_context_url(c)
+        and extract_schema_info_from_url(get_attributes_url_from_context_url(c))[0]
+    }
+    urls = sorted({get_attributes_url_from_context_url(c) for c in core_contexts | attribute_contexts})
+    return core_contexts, attribute_contexts, urls
+
+def missing_schema_urls(refs, registry_list, attribute_schemas_map, core_only=False):
+    """
+    Return the attributes.yaml URLs that refs need but the store does not hold.
+    
+    After warm_schema_refs these are the schemas that failed to load: objects of their
+    types are skipped by validate_payload rather than reported invalid.
+    
+    Args:
+        refs: Set of (context_url, obj_type) pairs from collect_schema_refs
+        registry_list: List containing referencing Registry
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, ignore domain-specific attribute schemas
+    
+    Returns:
+        list: Sorted attributes.yaml URLs
+    """
+    return _plan_schema_loads(refs, registry_list, attribute_schemas_map, core_only)[2]
+
+def prefetch_schemas(refs, registry_list, attribute_schemas_map, core_only=False, max_workers=DEFAULT_PREFETCH_WORKERS, fetch=None):
+    """
+    Fetch every schema needed for the given refs concurrently, then add them to the store.
+    
+    Each distinct attributes.yaml is fetched once over the pooled HTTP session, so a cold
+    start costs about one round-trip rather than one per schema. All fetched schemas are
+    added to the registry in a single crawled build, then passed in sorted order through
+    the regular loaders, which report each load.
+    Fetch failures are left to the lazy loaders to retry and report.
+    
+    Args:
+        refs: Set of (context_url, obj_type) pairs from collect_schema_refs
+        registry_list: List containing referencing Registry (mutated in place)
+        attribute_schemas_map: Dict mapping @context URLs to schema info (mutated in place)
+        core_only: If True, skip domain-specific attribute schemas
+        max_workers: Number of concurrent fetches
+        fetch: Function loading one attributes.yaml URL (default: load_schema_from_url)
+    """
+    core_contexts, attribute_contexts, urls = _plan_schema_loads(refs, registry_list, attribute_schemas_map, core_only)
+    if not urls:
+        return
+    
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        futures = {url: pool.submit(fetch or load_schema_from_url, url) for url in urls}
+        for url, future in futures.items():
+            try:
+                fetched[url] = future.result()
+            except Exception:
+                pass
+    
+    # One Registry build for everything fetched; the loaders below then only report and map
+    register_schemas(registry_list, fetched)
+    
+    for context_url in sorted(core_contexts):
+        schema_data = fetched.get(get_attributes_url_from_context_url(context_url))
+        if schema_data is not None:
+            load_core_schema_for_context_url(context_url, registry_list, schema_data)
+    for context_url in sorted(attribute_contexts):
+        schema_data = fetched.get(get_attributes_url_from_context_url(context_url))
+        if schema_data is not None:
+            load_schema_for_context_url(context_url, attribute_schemas_map, registry_list, schema_data)
+
+def warm_schema_store(files, registry_list, attribute_schemas_map, core_only=False, stream=False):
+    """
+    Load and compile every schema referenced by the given files ahead of validation.
+    
+    Scans the files for @context/@type pairs and context.schema_context URLs, fetches all
+    schemas concurrently with prefetch_schemas, then compiles a validator for each
+    referenced type against the final registry so later validation only hits caches.
+    
+    Args:
+        files: JSON files or Postman collections to scan
+        registry_list: List containing referencing Registry (mutated in place)
+        attribute_schemas_map: Dict mapping @context URLs to schema info (mutated in place)
+        core_only: If True, skip domain-specific attribute schemas
+        stream: If True, scan files incrementally instead of loading them whole
+    """
+    refs = set()
+    with _profiled("schema ref scan"):
+        for filepath in files:
+            refs |= _collect_file_schema_refs(filepath, stream and ijson is not None)
+    warm_schema_refs(refs, registry_list, attribute_schemas_map, core_only)
+
+def warm_schema_refs(refs, registry_list, attribute_schemas_map, core_only=False, fetch=None):
+    """
+    Load and compile the schemas for a set of (@context, @type) refs.
+    
+    Args:
+        refs: Set of (context_url, obj_type) pairs from collect_schema_refs
+        registry_list: List containing referencing Registry (mutated in place)
+        attribute_schemas_map: Dict mapping @context URLs to schema info (mutated in place)
+        core_only: If True, skip domain-specific attribute schemas
+        fetch: Function loading one attributes.yaml URL (see prefetch_schemas)
+    """
+    prefetch_schemas(refs, registry_list, attribute_schemas_map, core_only, fetch=fetch)
+    
+    targets = []
+    for context_url, obj_type in sorted(refs, key=lambda ref: (ref[0], ref[1] or "")):
+        if obj_type is None:
+            continue
+        if obj_type.startswith("beckn:"):
+            if not is_core_context_url(context_url):
+                continue
+            attributes_url = get_attributes_url_from_context_url(context_url)
+            if attributes_url not in registry_list[0]:
+                load_core_schema_for_context_url(context_url, registry_list)
+            if attributes_url in registry_list[0]:
+                schemas = registry_list[0].get(attributes_url).contents.get("components", {}).get("schemas", {})
+                object_name = obj_type.split(":")[-1]
+                if object_name in schemas:
+                    targets.append((attributes_url, object_name, None))
+        elif not core_only:
+            if context_url not in attribute_schemas_map:
+                load_schema_for_context_url(context_url, attribute_schemas_map, registry_list)
+            if context_url in attribute_schemas_map:
+                _, schema_data, schema_url = attribute_schemas_map[context_url]
+                schema_type = obj_type.split(":")[-1] if ":" in obj_type else obj_type
+                match = _find_attribute_schema(schema_data.get("components", {}).get("schemas", {}), schema_type)
+                if match is not None:
+                    targets.append((schema_url, match[0], _get_jsonld_schema(schema_url, *match)))
+    
+    for attributes_url, object_name, schema_def in targets:
+        try:
+            get_compiled_validator(attributes_url, object_name, registry_list[0], schema_def)
+            get_generated_validator(attributes_url, object_name, registry_list[0], schema_def)
+        except Exception as e:
+            # Left for validate_payload to report when the object is validated
+            _warn(f"  Warning: Could not compile {object_name} from {attributes_url}: {e}")
+
+def export_schema_bundle(registry_list, attribute_schemas_map):
+    """
+    Export loaded schemas as plain data that can be pickled or serialized.
+    
+    A Registry itself cannot be pickled, so worker processes rebuild it from this bundle.
+    
+    Each distinct document is included once, with an alias table from URLs to content.
+    
+    Returns:
+        dict: {"documents": {sha256: schema}, "resources": {url: sha256},
+            "contexts": {context_url: [schema_name, url]}}
+    """
+    registry = registry_list[0]
+    documents, resources = {}, {}
+    for uri in registry:
+        contents = registry[uri].contents
+        content_hash = _schema_aliases.get(uri)
+        if content_hash is None or _schema_documents[content_hash][0] is not contents:
+            content_hash = _schema_content_hash(contents)
+        documents[content_hash] = contents
+        resources[uri] = content_hash
+    return {
+        "documents": documents,
+        "resources": resources,
+        "contexts": {
+            context_url: [schema_name, schema_url]
+            for context_url, (schema_name, _, schema_url) in sorted(attribute_schemas_map.items())
+        },
+    }
+
+def import_schema_bundle(bundle):
+    """
+    Build a schema store from a bundle produced by export_schema_bundle.
+    
+    Returns:
+        tuple: (registry_list, attributes_schema, attribute_schemas_map), as get_schema_store()
+    """
+    documents = bundle["documents"]
+    resources = {
+        url: _intern_schema(url, documents[content_hash], content_hash)
+        for url, content_hash in bundle["resources"].items()
+    }
+    registry_list = [Registry()]
+    register_schemas(registry_list, resources)
+    attribute_schemas_map = {}
+    for context_url, (schema_name, schema_url) in bundle["contexts"].items():
+        attribute_schemas_map[context_url] = (schema_name, resources[schema_url], schema_url)
+        _prepare_jsonld_schemas(schema_url, resources[schema_url])
+    return registry_list, None, attribute_schemas_map
+
+SCHEMA_BUNDLE_FORMAT = "beckn-schema-bundle/2"
+# Version 1 stored every URL's document in full under "resources"; it is still read
+_SCHEMA_BUNDLE_FORMAT_V1 = "beckn-schema-bundle/1"
+
+def write_schema_bundle(path, registry_list, attribute_schemas_map):
+    """
+    Write the loaded schemas to a single JSON file that load_schema_bundle can read back.
+    
+    Schemas are stored already parsed, so loading the file skips YAML parsing, the
+    schema cache and the network. Each distinct attributes.yaml is stored once under
+    its sha256 in "documents"; "resources" maps every URL to its document, and the
+    "contexts" index maps domain @context URLs to (schema_name, attributes_url).
+    
+    Args:
+        path: File to write
+        registry_list: List containing referencing Registry
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+    
+    Returns:
+        dict: The bundle document that was written
+    """
+    document = {
+        "format": SCHEMA_BUNDLE_FORMAT,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        **export_schema_bundle(registry_list, attribute_schemas_map),
+    }
+    text = json.dumps(document, default=_json_default, separators=(",", ":"))
+    _write_atomic(os.path.abspath(path), text, shared=True)
+    return document
+
+def load_schema_bundle(path):
+    """
+    Build a schema store from a file written by write_schema_bundle (`validate_schema.py bundle`).
+    
+    Schemas the bundle does not contain are still loaded on demand from the cache or network.
+    
+    Returns:
+        tuple: (registry_list, attributes_schema, attribute_schemas_map), as get_schema_store()
+    
+    Raises:
+        ValueError: If the file is not a schema bundle
+    """
+    with _profiled("bundle read"), open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or document.get("format") not in (SCHEMA_BUNDLE_FORMAT, _SCHEMA_BUNDLE_FORMAT_V1):
+        raise ValueError(f"{path} is not a schema bundle (expected format {SCHEMA_BUNDLE_FORMAT})")
+    if document["format"] == _SCHEMA_BUNDLE_FORMAT_V1:
+        hashes = {url: _schema_content_hash(contents) for url, contents in document["resources"].items()}
+        document["documents"] = {hashes[url]: contents for url, contents in document["resources"].items()}
+        document["resources"] = hashes
+    return import_schema_bundle(document)
+
+# Per-process state for --jobs workers, set by _init_worker (or inherited on fork)
+_worker_state = {}
+
+def _init_worker(bundle, core_only, stream, collect_records, cache_config, report_config, codegen_config, profile=False):
+    global _http_session
+    # Never share pooled sockets with the parent after fork
+    _http_session = None
+    # Each worker reports only its own timings, which the parent merges
+    enable_profiling(profile)
+    _schema_cache_config.update(cache_config)
+    _report_config.update(report_config)
+    _codegen_config.update(codegen_config)
+    _worker_state["collect_records"] = collect_records
+    if bundle is not None:
+        _worker_state["store"] = import_schema_bundle(bundle)
+    _worker_state["core_only"] = core_only
+    _worker_state["stream"] = stream
+    _worker_state["body_results"] = {}
+
+def _process_file_in_worker(filepath):
+    # Capture output so the parent can print it in argument order
+    registry_list, attributes_schema, attribute_schemas_map = _worker_state["store"]
+    output = io.StringIO()
+    records = [] if _worker_state["collect_records"] else None
+    with contextlib.redirect_stdout(output):
+        errors = process_file(filepath, registry_list, attributes_schema, attribute_schemas_map,
+                              _worker_state["core_only"], _worker_state["stream"], records,
+                              body_results=_worker_state["body_results"])
+    profile = _profile
+    if profile is not None:
+        enable_profiling()
+    return output.getvalue(), errors, records, profile
+
+def _start_worker_pool(processes, registry_list, attributes_schema, attribute_schemas_map, core_only=False, stream=False, collect_records=False):
+    """
+    Start a pool of worker processes that share the warm schema store.
+    
+    The store is inherited directly where the fork start method is available, otherwise
+    it is sent to each worker as a serialized bundle. Cache, reporting, codegen and
+    profiling settings are copied from this process.
+    
+    Returns:
+        multiprocessing.pool.Pool
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("fork")
+        _worker_state["store"] = (registry_list, attributes_schema, attribute_schemas_map)
+        bundle = None
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        bundle = export_schema_bundle(registry_list, attribute_schemas_map)
+    return ctx.Pool(processes, initializer=_init_worker,
+                    initargs=(bundle, core_only, stream, collect_records,
+                              dict(_schema_cache_config), dict(_report_config), dict(_codegen_config),
+                              _profile is not None))
+
+def process_files(files, registry_list, attributes_schema, attribute_schemas_map=None, core_only=False, jobs=1, stream=False, prefetch=True, records=None):
+    """
+    Validate several files, optionally spread across worker processes.
+    
+    Unless prefetch is False, all referenced schemas are fetched concurrently and compiled
+    before validation starts (see warm_schema_store). With jobs > 1 the warm schema store is
+    shared with the workers: inherited directly where the fork start method is available,
+    otherwise sent as a serialized bundle. Each file's output is printed in argument order.
+    
+    Args:
+        files: JSON files or Postman collections to validate
+        registry_list: List containing referencing Registry
+        attributes_schema: Unused, kept for compatibility (None)
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        jobs: Number of worker processes (1 validates in this process)
+        stream: If True, validate each file incrementally with stream_validate_file
+        prefetch: If False, load schemas lazily as objects are found (single process only)
+        records: Optional list to append result records to, in argument order
+    
+    Returns:
+        dict: {filepath: [error messages]} in argument order
+    """
+    if attribute_schemas_map is None:
+        attribute_schemas_map = {}
+    results = {}
+    parallel = jobs > 1 and len(files) > 1
+    if prefetch or parallel:
+        warm_schema_store(files, registry_list, attribute_schemas_map, core_only, stream)
+    if not parallel:
+        body_results = {}
+        for filepath in files:
+            results[filepath] = process_file(filepath, registry_list, attributes_schema, attribute_schemas_map, core_only, stream, records,
+                                             jobs, body_results)
+        return results
+    
+    with _start_worker_pool(min(jobs, len(files)), registry_list, attributes_schema, attribute_schemas_map,
+                            core_only, stream, records is not None) as pool:
+        for filepath, (output, errors, file_records, profile) in zip(files, pool.imap(_process_file_in_worker, files)):
+            sys.stdout.write(output)
+            merge_profile(profile)
+            results[filepath] = errors
+            if records is not None:
+                records.extend(file_records)
+    sys.stdout.flush()
+    return results
+
+# Manifest of earlier results for --incremental; bump the version when validation semantics change
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_NAME = "validation-manifest.json"
+
+def load_manifest(path):
+    """
+    Load the manifest written by save_manifest, or return an empty one.
+    
+    A missing, unreadable or outdated manifest is not an error: every file is then
+    validated and the manifest rebuilt.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "files": {}}
+
+def save_manifest(path, manifest):
+    _write_atomic(os.path.abspath(path), json.dumps(manifest, default=_json_default, separators=(",", ":")))
+
+def _schema_digest(refs, registry_list, core_only, memo):
+    # Hash of the schemas a file references, so a schema change re-validates only its users
+    urls = sorted({
+        get_attributes_url_from_context_url(context_url)
+        for context_url, _ in refs
+        if isinstance(context_url, str) and (not core_only or is_core_context_url(context_url))
+    })
+    digest = hashlib.sha256(f"core_only={core_only}".encode("utf-8"))
+    for url in urls:
+        if url not in memo:
+            resource = registry_list[0].get(url)
+            if resource is None:
+                memo[url] = "missing"
+            else:
+                serialized = json.dumps(resource.contents, sort_keys=True, default=_json_default)
+                memo[url] = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        digest.update(f"\n{url} {memo[url]}".encode("utf-8"))
+    return digest.hexdigest()
+
+def _combine_digests(digest, parts):
+    # Digest of an object's own digest together with (relative path, digest) pairs
+    parts = list(parts)
+    if not parts:
+        return digest
+    combined = hashlib.sha256(digest.encode("utf-8"))
+    for path, part in parts:
+        combined.update(f"\n{json.dumps(path)} {part}".encode("utf-8"))
+    return combined.hexdigest()
+
+def _collect_jsonld_subtrees(payload):
+    """
+    List the JSON-LD objects in a payload, each with a digest of its own content.
+    
+    An object's own content is the object with every nested JSON-LD object replaced by a
+    stub holding just @context and @type, as in stream_validate_file, so a change inside
+    one catalog item changes the digest of that item only. Each object also gets a digest
+    of its full content, for use by a parent that validates it as part of itself (see
+    validate_payload_incremental).
+    
+    Returns:
+        list: (path_segments, object, digest, children, full_digest) tuples, innermost
+            objects first, where children lists (relative path, index in this list) for
+            each stubbed child
+    """
+    subtrees = []
+    
+    def visit(value, segments):
+        # Returns value with JSON-LD objects below it stubbed, and [(relative path, subtree index)]
+        stubs = []
+        if type(value) is dict:
+            stubbed = {}
+            for key, child in value.items():
+                if key in NON_JSONLD_KEYS or type(child) not in (dict, list):
+                    stubbed[key] = child
+                    continue
+                stubbed[key], child_stubs = visit(child, segments + (key,))
+                stubs.extend(((key,) + path, index) for path, index in child_stubs)
+            if "@context" in value and "@type" in value:
+                serialized = json.dumps(stubbed, separators=(",", ":"), default=_json_default)
+                digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+                full_digest = _combine_digests(digest, ((path, subtrees[index][4]) for path, index in stubs))
+                subtrees.append((segments, value, digest, stubs, full_digest))
+                return {"@context": value["@context"], "@type": value["@type"]}, [((), len(subtrees) - 1)]
+            return stubbed, stubs
+        stubbed = []
+        for idx, child in enumerate(value):
+            if type(child) not in (dict, list):
+                stubbed.append(child)
+                continue
+            child_stubbed, child_stubs = visit(child, segments + (idx,))
+            stubbed.append(child_stubbed)
+            stubs.extend(((idx,) + path, index) for path, index in child_stubs)
+        return stubbed, stubs
+    
+    if isinstance(payload, (dict, list)):
+        visit(payload, ())
+    return subtrees
+
+def validate_payload_incremental(payload, registry_list, attribute_schemas_map, core_only=False, previous=None, records=None):
+    """
+    Validate only the JSON-LD objects whose own content changed since an earlier run.
+    
+    Each object is validated with its JSON-LD children stubbed out (see stream_validate_file),
+    so its result depends only on its own content and the schemas. Children that are not
+    validated on their own (no schema applies, or core_only) are validated as part of their
+    parent instead, so their full content counts towards the parent's digest. Results for
+    objects whose path and digest match `previous` are reused; the rest are validated.
+    `previous` must come from a run against the same schemas and core_only setting. Objects are reported
+    innermost first, and each error once, as with --stream.
+    
+    Args:
+        payload: JSON payload to validate
+        registry_list: List containing referencing Registry with all loaded schemas
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        previous: Per-object results returned by an earlier call for the same file
+        records: Optional list to append one result record per object to
+    
+    Returns:
+        tuple: (errors, objects) where objects maps each object's path to its result,
+            to pass as `previous` next time
+    """
+    previous = previous or {}
+    errors = []
+    objects = {}
+    validated = []
+    reused = 0
+    subtrees = _collect_jsonld_subtrees(payload)
+    for path_segments, data, digest, children, _ in subtrees:
+        path = _render_path(path_segments)
+        digest = _combine_digests(digest, ((child_path, subtrees[index][4]) for child_path, index in children
+                                           if not validated[index]))
+        entry = previous.get(path)
+        if entry is not None and entry["digest"] == digest:
+            reused += 1
+        else:
+            skip_paths = {child_path for child_path, index in children if validated[index]}
+            object_errors, object_records = [], []
+            found = _validate_jsonld_object(data, path_segments, object_errors, registry_list, attribute_schemas_map,
+                                            core_only, skip_paths=skip_paths, records=object_records)
+            entry = {"digest": digest, "validated": found, "errors": object_errors, "records": object_records}
+        validated.append(entry["validated"])
+        objects[path] = entry
+        errors.extend(entry["errors"])
+        if records is not None:
+            records.extend(dict(record) for record in entry["records"])
+    if reused:
+        _log(f"  {reused} unchanged object(s) skipped")
+    return errors, objects
+
+def process_files_incremental(files, registry_list, attributes_schema, attribute_schemas_map, manifest, mode="files", core_only=False, jobs=1, stream=False, records=None):
+    """
+    Validate only files (or, in "objects" mode, JSON-LD objects) changed since the last run.
+    
+    A file is skipped when its content hash and the hash of the schemas it references both
+    match its manifest entry; its previous errors and records are reported again. The
+    manifest is updated in place; save it with save_manifest.
+    
+    In "objects" mode, changed JSON files are validated with validate_payload_incremental,
+    in this process. Postman collections and --stream files are always validated whole.
+    
+    Args:
+        files: JSON files or Postman collections to validate
+        registry_list: List containing referencing Registry
+        attributes_schema: Unused, kept for compatibility (None)
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        manifest: Manifest from load_manifest (mutated in place)
+        mode: "files" or "objects"
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        jobs: Number of worker processes for changed files ("files" mode)
+        stream: If True, validate changed files incrementally with stream_validate_file
+        records: Optional list to append result records to, in argument order
+    
+    Returns:
+        dict: {filepath: [error messages]} in argument order
+    """
+    entries = manifest.setdefault("files", {})
+    keys, hashes, refs_by_file, payloads = {}, {}, {}, {}
+    reused_refs = set()
+    for filepath in files:
+        key = keys[filepath] = os.path.abspath(filepath)
+        try:
+            with open(filepath, 'rb') as f:
+                content = f.read()
+        except OSError:
+            # Not cached; process_file reports the error
+            entries.pop(key, None)
+            continue
+        hashes[filepath] = hashlib.sha256(content).hexdigest()
+        entry = entries.get(key)
+        if entry is not None and entry.get("sha256") == hashes[filepath] and entry.get("mode") == mode:
+            # Same content as last time: reuse its refs instead of parsing it again
+            refs_by_file[filepath] = {tuple(ref) for ref in entry["refs"]}
+            reused_refs.add(filepath)
+        elif stream and ijson is not None:
+            refs_by_file[filepath] = _collect_file_schema_refs(filepath, stream=True)
+        else:
+            try:
+                data = json.loads(content)
+            except ValueError:
+                refs_by_file[filepath] = set()
+                continue
+            refs_by_file[filepath] = _collect_data_schema_refs(data)
+            if mode == "objects":
+                payloads[filepath] = data
+    warm_schema_refs(set().union(*refs_by_file.values()), registry_list, attribute_schemas_map, core_only)
+    
+    digest_memo = {}
+    changed, unchanged = [], {}
+    for filepath in files:
+        if filepath not in hashes:
+            changed.append((filepath, None))
+            continue
+        refs = refs_by_file[filepath]
+        state = {
+            "sha256": hashes[filepath],
+            "mode": mode,
+            "schemas": _schema_digest(refs, registry_list, core_only, digest_memo),
+            "refs": sorted(([context_url, obj_type] for context_url, obj_type in refs), key=lambda ref: (ref[0], ref[1] or "")),
+        }
+        entry = entries.get(keys[filepath])
+        if entry is not None and all(entry.get(name) == state[name] for name in ("sha256", "mode", "schemas")):
+            unchanged[filepath] = entry
+        else:
+            changed.append((filepath, state))
+    
+    file_records = {filepath: [] for filepath in files}
+    results = {}
+    whole_files = []
+    for filepath, state in changed:
+        entry = entries.get(keys[filepath], {})
+        # Per-object results only hold for the schemas (and core_only) they were produced with
+        previous = entry.get("objects") if state is not None and entry.get("schemas") == state["schemas"] else None
+        data = payloads.pop(filepath, None)
+        if data is None and filepath in reused_refs and mode == "objects" and not (stream and ijson is not None):
+            # Only its schemas changed: parse it now, so its entry keeps per-object results
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = None
+        if data is None or _is_postman_collection(data):
+            whole_files.append(filepath)
+            continue
+        _log(f"Processing {filepath}...")
+        results[filepath], state["objects"] = validate_payload_incremental(
+            data, registry_list, attribute_schemas_map, core_only, previous, file_records[filepath])
+        for record in file_records[filepath]:
+            record["file"] = filepath
+    
+    if whole_files:
+        whole_records = []
+        results.update(process_files(whole_files, registry_list, attributes_schema, attribute_schemas_map, core_only,
+                                     jobs, stream, prefetch=False, records=whole_records))
+        for record in whole_records:
+            file_records[record["file"]].append(record)
+    
+    for filepath, state in changed:
+        if state is not None and "objects" not in state:
+            # In "objects" mode the per-object entries already hold the errors and records
+            state.update(errors=results[filepath], records=file_records[filepath])
+        if state is not None:
+            entries[keys[filepath]] = state
+    
+    ordered = {}
+    for filepath in files:
+        entry = unchanged.get(filepath)
+        if entry is not None:
+            _log(f"Skipping {filepath} (unchanged since last validation)")
+            if "objects" in entry:
+                objects = entry["objects"].values()
+                ordered[filepath] = [error for obj in objects for error in obj["errors"]]
+                file_records[filepath] = [{**record, "file": filepath} for obj in objects for record in obj["records"]]
+            else:
+                ordered[filepath] = list(entry["errors"])
+                file_records[filepath] = [{**record, "file": filepath} for record in entry["records"]]
+        else:
+            ordered[filepath] = results[filepath]
+        if records is not None:
+            records.extend(file_records[filepath])
+    return ordered
+
+# Recorded traffic (`validate_schema.py traffic`): one Beckn envelope per line, optionally gzipped
+DEFAULT_TRAFFIC_CHUNK_LINES = 1000
+# Lines per file scanned for schema refs before validation starts; rarer schemas load on demand
+TRAFFIC_SAMPLE_LINES = 1000
+# Distinct error messages kept per (domain, action); further ones are only counted
+MAX_TRAFFIC_ERROR_KINDS = 50
+_OTHER_TRAFFIC_ERRORS = "(other errors)"
+
+def open_traffic_file(filepath):
+    """Open an NDJSON file as text, decompressing it if it is gzipped (by content, not name)."""
+    with open(filepath, 'rb') as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return gzip.open(filepath, 'rt', encoding='utf-8')
+    return open(filepath, 'r', encoding='utf-8')
+
+def iter_traffic_chunks(filepath, chunk_lines=DEFAULT_TRAFFIC_CHUNK_LINES):
+    """
+    Read an NDJSON file in chunks of raw lines, so memory is bounded by the chunk size.
+    
+    Blank lines are skipped; line numbers are kept for reporting.
+    
+    Yields:
+        list: [(line_number, line)] with at most chunk_lines entries
+    """
+    chunk = []
+    with open_traffic_file(filepath) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            chunk.append((line_number, line))
+            if len(chunk) >= chunk_lines:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+def _collect_traffic_schema_refs(filepath, sample_lines=TRAFFIC_SAMPLE_LINES):
+    # Refs from the first sample_lines messages; unreadable files are reported when validated
+    refs = set()
+    try:
+        with open_traffic_file(filepath) as f:
+            for line_number, line in enumerate(f, 1):
+                if line_number > sample_lines:
+                    break
+                try:
+                    refs |= collect_schema_refs(json.loads(line))
+                except ValueError:
+                    pass
+    except (OSError, EOFError, UnicodeDecodeError):
+        pass
+    return refs
+
+def _traffic_route(stats, envelope):
+    # Aggregation bucket for an envelope: its context.domain and context.action
+    context = envelope.get("context") if isinstance(envelope, dict) else None
+    if not isinstance(context, dict):
+        context = {}
+    domain, action = str(context.get("domain", "-")), str(context.get("action", "-"))
+    route = stats["routes"].get((domain, action))
+    if route is None:
+        route = stats["routes"][(domain, action)] = {
+            "domain": domain, "action": action, "messages": 0, "invalid_messages": 0,
+            "objects": 0, "invalid_objects": 0, "errors": {},
+        }
+    return route
+
+def _count_traffic_error(route, message, count, location):
+    errors = route["errors"]
+    if message not in errors and len(errors) >= MAX_TRAFFIC_ERROR_KINDS:
+        message = _OTHER_TRAFFIC_ERRORS
+    entry = errors.get(message)
+    if entry is None:
+        errors[message] = [count, location]
+    else:
+        entry[0] += count
+
+def new_traffic_stats():
+    """Return empty aggregates for validate_traffic_chunk and merge_traffic_stats."""
+    return {"messages": 0, "unparsable": 0, "routes": {}}
+
+def validate_traffic_chunk(filepath, chunk, registry_list, attribute_schemas_map, core_only=False):
+    """
+    Parse and validate a chunk of NDJSON lines, aggregating results by domain and action.
+    
+    Args:
+        filepath: File the lines came from (for error locations)
+        chunk: [(line_number, line)] from iter_traffic_chunks
+        registry_list: List containing referencing Registry
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+    
+    Returns:
+        dict: Aggregates (see new_traffic_stats); each route holds message and object counts
+            and {error message: [count, first location]}
+    """
+    stats = new_traffic_stats()
+    for line_number, line in chunk:
+        stats["messages"] += 1
+        try:
+            envelope = json.loads(line)
+        except ValueError as e:
+            stats["unparsable"] += 1
+            route = _traffic_route(stats, None)
+            route["messages"] += 1
+            route["invalid_messages"] += 1
+            _count_traffic_error(route, f"unparsable JSON: {e.msg}", 1, f"{filepath}:{line_number}")
+            continue
+        records = []
+        validate_payload(envelope, registry_list, None, attribute_schemas_map, core_only, records=records)
+        route = _traffic_route(stats, envelope)
+        route["messages"] += 1
+        route["objects"] += len(records)
+        invalid = [record for record in records if not record["valid"]]
+        if invalid:
+            route["invalid_messages"] += 1
+            route["invalid_objects"] += len(invalid)
+            for record in invalid:
+                _count_traffic_error(route, f"{record['type']}: {record['error']}", 1,
+                                     f"{filepath}:{line_number} {record['path'] or 'root'}")
+    return stats
+
+def merge_traffic_stats(total, stats):
+    """Add the aggregates of stats to total (both from new_traffic_stats), in place."""
+    total["messages"] += stats["messages"]
+    total["unparsable"] += stats["unparsable"]
+    for key, route in stats["routes"].items():
+        target = total["routes"].get(key)
+        if target is None:
+            target = total["routes"][key] = {**route, "errors": {}}
+        else:
+            for name in ("messages", "invalid_messages", "objects", "invalid_objects"):
+                target[name] += route[name]
+        for message, (count, location) in route["errors"].items():
+            _count_traffic_error(target, message, count, location)
+    return total
+
+def _validate_traffic_chunk_in_worker(task):
+    filepath, chunk = task
+    registry_list, _, attribute_schemas_map = _worker_state["store"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = validate_traffic_chunk(filepath, chunk, registry_list, attribute_schemas_map, _worker_state["core_only"])
+    profile = _profile
+    if profile is not None:
+        enable_profiling()
+    return stats, profile
+
+def validate_traffic(files, registry_list, attribute_schemas_map, core_only=False, jobs=1, chunk_lines=DEFAULT_TRAFFIC_CHUNK_LINES):
+    """
+    Validate recorded Beckn traffic: NDJSON files of context+message envelopes, optionally gzipped.
+    
+    Files are read in chunks of lines and each chunk is parsed and validated as a unit, by
+    worker processes when jobs > 1. At most two chunks per worker are in flight, so memory
+    stays bounded however large the files are. Schemas referenced by the first lines of
+    each file are loaded up front (see TRAFFIC_SAMPLE_LINES), others on first use.
+    
+    Args:
+        files: NDJSON files (plain or gzip-compressed)
+        registry_list: List containing referencing Registry
+        attribute_schemas_map: Dict mapping @context URLs to schema info
+        core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+        jobs: Number of worker processes (1 validates in this process)
+        chunk_lines: Lines per chunk
+    
+    Returns:
+        dict: Aggregates by (domain, action), as from validate_traffic_chunk, plus
+            "file_errors": {filepath: message} for files that could not be read
+    """
+    refs = set()
+    with _profiled("schema ref scan"):
+        for filepath in files:
+            refs |= _collect_traffic_schema_refs(filepath)
+    warm_schema_refs(refs, registry_list, attribute_schemas_map, core_only)
+    
+    total = new_traffic_stats()
+    total["file_errors"] = {}
+    
+    def tasks():
+        for filepath in files:
+            _log(f"Processing {filepath}...")
+            try:
+                for chunk in iter_traffic_chunks(filepath, chunk_lines):
+                    yield filepath, chunk
+            except (OSError, EOFError, UnicodeDecodeError) as e:
+                _warn(f"  Error reading {filepath}: {e}")
+                total["file_errors"][filepath] = str(e)
+    
+    if jobs <= 1:
+        for filepath, chunk in tasks():
+            merge_traffic_stats(total, validate_traffic_chunk(filepath, chunk, registry_list, attribute_schemas_map, core_only))
+        return total
+    
+    # Bounded submission: Pool.imap would read the whole input ahead of the workers
+    with _start_worker_pool(jobs, registry_list, None, attribute_schemas_map, core_only) as pool:
+        pending = deque()
+        for task in tasks():
+            pending.append(pool.apply_async(_validate_traffic_chunk_in_worker, (task,)))
+            while len(pending) >= 2 * jobs or (pending and pending[0].ready()):
+                stats, profile = pending.popleft().get()
+                merge_traffic_stats(total, stats)
+                merge_profile(profile)
+        while pending:
+            stats, profile = pending.popleft().get()
+            merge_traffic_stats(total, stats)
+            merge_profile(profile)
+    return total
+
+def traffic_report(stats, elapsed=None):
+    """
+    Turn validate_traffic aggregates into a JSON-serializable report.
+    
+    Routes are sorted by domain and action; each route's errors are listed most frequent first.
+    """
+    routes = []
+    for key in sorted(stats["routes"]):
+        route = stats["routes"][key]
+        errors = sorted(route["errors"].items(), key=lambda item: -item[1][0])
+        routes.append({
+            **{name: value for name, value in route.items() if name != "errors"},
+            "errors": [{"message": message, "count": count, "first_seen": location}
+                       for message, (count, location) in errors],
+        })
+    report = {
+        "messages": stats["messages"],
+        "invalid_messages": sum(route["invalid_messages"] for route in routes),
+        "unparsable": stats["unparsable"],
+        "objects": sum(route["objects"] for route in routes),
+        "invalid_objects": sum(route["invalid_objects"] for route in routes),
+        "file_errors": stats.get("file_errors", {}),
+        "routes": routes,
+    }
+    if elapsed is not None:
+        report["duration_s"] = round(elapsed, 3)
+        report["messages_per_s"] = round(stats["messages"] / elapsed, 1) if elapsed else None
+    return report
+
+def write_traffic_table(report, out, top_errors=5):
+    """Write a traffic report as a table per (domain, action), with its most frequent errors."""
+    out.write(f"{'domain':<28} {'action':<16} {'messages':>10} {'invalid':>9} {'objects':>10} {'invalid':>9}\n")
+    for route in report["routes"]:
+        out.write(f"{route['domain']:<28} {route['action']:<16} {route['messages']:>10} {route['invalid_messages']:>9} "
+                  f"{route['objects']:>10} {route['invalid_objects']:>9}\n")
+        for error in route["errors"][:top_errors]:
+            out.write(f"    {error['count']:>8} x {error['message']}  (first: {error['first_seen']})\n")
+    for filepath, message in report["file_errors"].items():
+        out.write(f"ERROR {filepath}: {message}\n")
+    line = (f"{report['messages']} message(s), {report['invalid_messages']} invalid "
+            f"({report['unparsable']} unparsable); {report['objects']} object(s), {report['invalid_objects']} invalid")
+    if "duration_s" in report:
+        line += f" in {report['duration_s']:.2f}s ({report['messages_per_s']} messages/s)"
+    out.write(line + "\n")
+
+def summarize_results(results, records, elapsed=None):
+    """
+    Count files and validated objects.
+    
+    Args:
+        results: {filepath: [error messages]} from process_files
+        records: Result records from process_files
+        elapsed: Optional wall time in seconds
+    
+    Returns:
+        dict: Counts of files, failed files, objects, valid and invalid objects
+    """
+    objects = [r for r in records if r["path"] is not None]
+    invalid = sum(1 for r in objects if not r["valid"])
+    summary = {
+        "files": len(results),
+        "files_failed": sum(1 for errors in results.values() if errors),
+        "objects": len(objects),
+        "valid": len(objects) - invalid,
+        "invalid": invalid,
+        "file_errors": len(records) - len(objects),
+    }
+    if elapsed is not None:
+        summary["duration_s"] = round(elapsed, 3)
+    return summary
+
+def write_summary(results, records, out, elapsed=None):
+    """Write errors grouped by failing file, followed by one line of counts."""
+    lines = []
+    for filepath, errors in results.items():
+        if errors:
+            lines.append(f"FAIL {filepath}")
+            lines.extend(f"  {error}" for error in errors)
+    summary = summarize_results(results, records, elapsed)
+    line = (f"{summary['files']} file(s), {summary['files_failed']} failed; "
+            f"{summary['objects']} object(s), {summary['valid']} valid, {summary['invalid']} invalid")
+    if elapsed is not None:
+        line += f" in {elapsed:.2f}s"
+    lines.append(line)
+    out.write("\n".join(lines) + "\n")
+
+def write_jsonl(results, records, out, elapsed=None):
+    """Write one JSON line per result record, then a final {"summary": {...}} line."""
+    lines = [json.dumps(record) for record in records]
+    lines.append(json.dumps({"summary": summarize_results(results, records, elapsed)}))
+    out.write("\n".join(lines) + "\n")
+
+def write_junit(results, records, out, elapsed=None):
+    """Write a JUnit XML report with one test suite per file and one test case per object."""
+    import xml.etree.ElementTree as ET
+    
+    by_file = {filepath: [] for filepath in results}
+    for record in records:
+        by_file.setdefault(record["file"], []).append(record)
+    
+    summary = summarize_results(results, records, elapsed)
+    suites = ET.Element("testsuites", name="validate_schema", tests=str(len(records)),
+                        failures=str(summary["invalid"]), errors=str(summary["file_errors"]))
+    if elapsed is not None:
+        suites.set("time", f"{elapsed:.3f}")
+    for filepath, file_records in by_file.items():
+        suite = ET.SubElement(suites, "testsuite", name=filepath, tests=str(len(file_records)),
+                              failures=str(sum(1 for r in file_records if not r["valid"] and r["path"] is not None)),
+                              errors=str(sum(1 for r in file_records if r["path"] is None)))
+        for record in file_records:
+            if record["path"] is None:
+                case = ET.SubElement(suite, "testcase", classname=filepath, name="process")
+                ET.SubElement(case, "error", message=record["error"])
+                continue
+            name = f"{record['type']} at {record['path'] or 'root'}"
+            if record.get("item"):
+                name = f"{record['item']}: {name}"
+            case = ET.SubElement(suite, "testcase", classname=filepath, name=name,
+                                 time=f"{record['duration_ms'] / 1000:.6f}")
+            if not record["valid"]:
+                failure = ET.SubElement(case, "failure", message=record["error"])
+                failure.text = record["error_path"]
+    out.write(ET.tostring(suites, encoding="unicode") + "\n")
+
+REPORT_WRITERS = {
+    "summary": write_summary,
+    "jsonl": write_jsonl,
+    "junit": write_junit,
+}
+
+def _add_schema_cache_arguments(parser):
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for the local schema cache (default: %(default)s, or $BECKN_SCHEMA_CACHE_DIR)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help="Seconds before a cached schema is revalidated with the server (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="Never access the network; load schemas only from the local cache"
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help="Bypass the local schema cache and always fetch schemas from the network"
+    )
+
+def _add_schema_arguments(parser):
+    _add_schema_cache_arguments(parser)
+    parser.add_argument(
+        "--bundle",
+        default=None,
+        help="Schema bundle written by `validate_schema.py bundle`; schemas it lacks are still loaded on demand"
+    )
+
+def _load_store_from_args(parser, args):
+    if args.bundle is None:
+        return get_schema_store()
+    try:
+        return load_schema_bundle(args.bundle)
+    except (OSError, ValueError, KeyError) as e:
+        parser.error(f"cannot load schema bundle {args.bundle}: {e}")
+
+def _configure_schema_cache_from_args(parser, args):
+    if args.offline and not args.use_cache:
+        parser.error("--offline requires the schema cache; do not combine it with --no-cache")
+    configure_schema_cache(cache_dir=args.cache_dir, ttl=args.cache_ttl, offline=args.offline, enabled=args.use_cache)
+
+class BecknValidator:
+    """
+    Thread-safe Beckn message validator that owns its schema store.
+    
+    Meant for embedding in long-running, multi-threaded services (and used by
+    `validate_schema.py serve`):
+    
+        validator = BecknValidator()
+        result = validator.validate(message)   # from any number of threads
+    
+    Schemas for refs not seen before are fetched outside any lock, once per URL however many
+    threads need it at the same time (single flight), then published: registered and compiled
+    under a short lock into a new registry and a new @context map that replace the old ones.
+    Validation reads the registry and map current when it starts and never takes a lock, so
+    concurrent calls do not contend on the hot path once the schemas they need are warm.
+    A failed load is remembered for retry_failed_after seconds: until then every request
+    for that schema fails at once instead of going back to the network.
+    
+    The on-disk schema cache and compiled validators are shared process-wide (see
+    configure_schema_cache and get_compiled_validator), so several instances reuse them.
+    """
+    
+    def __init__(self, core_only=False, store=None, retry_failed_after=DEFAULT_FAILED_LOAD_RETRY):
+        """
+        Args:
+            core_only: If True, only validate core Beckn objects, skip domain-specific attributes
+            store: Optional (registry_list, attributes_schema, attribute_schemas_map) to start
+                from, e.g. from load_schema_bundle; a new empty store by default
+            retry_failed_after: Seconds before a schema that failed to load is fetched again
+        """
+        registry_list, _, attribute_schemas_map = store or get_schema_store()
+        self.core_only = core_only
+        self._registry = registry_list[0]
+        self._attribute_schemas_map = dict(attribute_schemas_map)
+        self._known_refs = frozenset()
+        self._publish_lock = threading.Lock()
+        self._flight_lock = threading.Lock()
+        self._in_flight = {}
+        self._failed = {}
+        self.retry_failed_after = retry_failed_after
+    
+    @property
+    def registry(self):
+        """The current referencing Registry (replaced, never mutated, as schemas are added)."""
+        return self._registry
+    
+    @property
+    def registry_list(self):
+        # Snapshot in the form the module-level functions take
+        return [self._registry]
+    
+    @property
+    def attribute_schemas_map(self):
+        return self._attribute_schemas_map
+    
+    def _fetch(self, url):
+        # Single flight: the first thread to ask for a URL loads it, others wait for its result
+        with self._flight_lock:
+            failed = self._failed.get(url)
+            if failed is not None and time.monotonic() - failed[0] < self.retry_failed_after:
+                raise failed[1]
+            future = self._in_flight.get(url)
+            owner = future is None
+            if owner:
+                future = self._in_flight[url] = Future()
+        if owner:
+            try:
+                future.set_result(load_schema_from_url(url))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._flight_lock:
+                    # Published schemas live in the registry; failures are retried once they expire
+                    del self._in_flight[url]
+                    if future.exception() is None:
+                        self._failed.pop(url, None)
+                    else:
+                        self._failed[url] = (time.monotonic(), future.exception())
+        return future.result()
+    
+    def _fetch_failed(self, url):
+        # Fetch for validate: warm has just tried every missing schema, so only report its failure
+        with self._flight_lock:
+            failed = self._failed.get(url)
+        if failed is None:
+            raise LookupError(f"{url} was not loaded by warm")
+        raise failed[1]
+    
+    def warm(self, refs):
+        """
+        Load and compile schemas for any refs not already warm.
+        
+        Args:
+            refs: Set of (context_url, obj_type) pairs from collect_schema_refs
+        """
+        if refs <= self._known_refs:
+            return
+        missing = refs - self._known_refs
+        
+        # Fetch without holding the publish lock, so threads needing different schemas overlap
+        _, _, urls = _plan_schema_loads(missing, [self._registry], self._attribute_schemas_map, self.core_only)
+        fetched, errors = {}, {}
+        if urls:
+            with ThreadPoolExecutor(max_workers=min(DEFAULT_PREFETCH_WORKERS, len(urls))) as pool:
+                futures = {url: pool.submit(self._fetch, url) for url in urls}
+                for url, future in futures.items():
+                    try:
+                        fetched[url] = future.result()
+                    except Exception as e:
+                        # Left for the loaders to report, without fetching again
+                        errors[url] = e
+        
+        with self._publish_lock:
+            missing = refs - self._known_refs
+            if not missing:
+                return
+            registry_list = [self._registry]
+            attribute_schemas_map = dict(self._attribute_schemas_map)
+            def fetch(url):
+                if url in errors:
+                    raise errors[url]
+                return fetched[url] if url in fetched else self._fetch(url)
+            with _fetching_with(fetch):
+                warm_schema_refs(missing, registry_list, attribute_schemas_map, self.core_only, fetch=fetch)
+            # Refs whose schema failed to load stay cold, so a later warm retries them via _fetch
+            _, _, failed_urls = _plan_schema_loads(missing, registry_list, attribute_schemas_map, self.core_only)
+            failed_urls = set(failed_urls)
+            loaded = {ref for ref in missing if get_attributes_url_from_context_url(ref[0]) not in failed_urls}
+            self._attribute_schemas_map = attribute_schemas_map
+            self._registry = registry_list[0]
+            self._known_refs = self._known_refs | loaded
+    
+    def _schema_errors(self, refs):
+        # Schemas refs need that failed to load: objects of those types cannot be validated
+        if refs <= self._known_refs:
+            return []
+        schema_errors = []
+        for url in missing_schema_urls(refs - self._known_refs, [self._registry], self._attribute_schemas_map,
+                                       self.core_only):
+            with self._flight_lock:
+                failed = self._failed.get(url)
+            schema_errors.append({
+                "schema_url": url,
+                "reason": "schema_unavailable",
+                "error": str(failed[1]) if failed is not None else "not loaded",
+            })
+        return schema_errors
+    
+    def validate(self, payload):
+        """
+        Validate one Beckn message.
+        
+        A message whose schemas could not all be loaded is not valid: its objects of those
+        types were not checked, and schema_errors lists the schemas that failed.
+        
+        Returns:
+            dict: {"valid", "errors", "schema_errors", "objects", "duration_ms"} where objects
+                holds one result record per validated object
+        """
+        started = time.perf_counter()
+        refs = collect_schema_refs(payload)
+        self.warm(refs)
+        records = []
+        with _fetching_with(self._fetch_failed):
+            errors = validate_payload(payload, [self._registry], None, self._attribute_schemas_map,
+                                      self.core_only, records=records)
+        schema_errors = self._schema_errors(refs)
+        for record in records:
+            del record["file"]
+        return {
+            "valid": not errors and not schema_errors,
+            "errors": errors,
+            "schema_errors": schema_errors,
+            "objects": records,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+class _ValidationRequestHandler(http.server.BaseHTTPRequestHandler):
+    # POST /validate with a Beckn message body; GET /health for liveness checks
+    server_version = "BecknSchemaValidator/1.0"
+    protocol_version = "HTTP/1.1"
+    
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "schemas": len(list(self.server.service.registry))})
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+    
+    def do_POST(self):
+        if self.path != "/validate":
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {"error": f"invalid JSON body: {e}"})
+            return
+        try:
+            self._send_json(200, self.server.service.validate(payload))
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+    
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "unix"
+    
+    def log_message(self, format, *args):
+        _log(f"  {self.address_string()} {format % args}")
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+def make_validation_server(service, host="127.0.0.1", port=8090, unix_socket=None):
+    """
+    Create an HTTP server exposing a BecknValidator.
+    
+    Args:
+        service: BecknValidator to serve
+        host: Interface to bind for TCP
+        port: TCP port (ignored if unix_socket is set)
+        unix_socket: Optional Unix socket path to listen on instead of TCP
+    
+    Returns:
+        Threading HTTP server with a serve_forever() method
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _ThreadingUnixHTTPServer(unix_socket, _ValidationRequestHandler)
+    else:
+        server = http.server.ThreadingHTTPServer((host, port), _ValidationRequestHandler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+def serve_main(argv):
+    """Entry point for `validate_schema.py serve`."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="validate_schema.py serve",
+        description="Run a local validation service that keeps Beckn schemas warm between requests",
+        epilog="Example: curl -s --data @examples/ev-charging/v2/03_select/time-based-ev-charging-slot-select.json "
+               "http://127.0.0.1:8090/validate"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8090, help="TCP port to listen on (default: %(default)s)")
+    parser.add_argument("--unix-socket", default=None, help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument(
+        "--preload",
+        nargs="*",
+        default=[],
+        help="JSON files or Postman collections whose schemas are loaded before serving"
+    )
+    parser.add_argument(
+        "--core-only",
+        action="store_true",
+        default=False,
+        help="Only validate core Beckn objects (beckn:Order, beckn:Offer, etc.), skip domain-specific attribute objects"
+    )
+    parser.add_argument("--verbose", action="store_true", default=False, help="Log schema loads and requests")
+    parser.add_argument(
+        "--codegen",
+        action="store_true",
+        default=False,
+        help="Accept valid objects with Python code generated from their schemas (see schema_codegen.py)"
+    )
+    _add_schema_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    _configure_schema_cache_from_args(parser, args)
+    configure_reporting(verbose=args.verbose)
+    configure_codegen(enabled=args.codegen)
+    
+    service = BecknValidator(core_only=args.core_only, store=_load_store_from_args(parser, args))
+    if args.preload:
+        refs = set()
+        for filepath in args.preload:
+            refs |= _collect_file_schema_refs(filepath)
+        service.warm(refs)
+    
+    server = make_validation_server(service, args.host, args.port, args.unix_socket)
+    where = args.unix_socket or f"http://{args.host}:{server.server_port}"
+    print(f"Serving Beckn schema validation on {where} (POST /validate, GET /health)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix_socket and os.path.exists(args.unix_socket):
+            os.unlink(args.unix_socket)
+
+def _expand_input_paths(paths):
+    # Directories expand to the JSON files below them, in sorted order
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(dirpath, name)
+                for dirpath, _, names in os.walk(path)
+                for name in names if name.endswith(".json")
+            ))
+        else:
+            files.append(path)
+    return files
+
+def bundle_main(argv):
+    """Entry point for `validate_schema.py bundle`."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="validate_schema.py bundle",
+        description="Write every schema referenced by the given examples to one file that loads in milliseconds",
+        epilog="Example: python3 scripts/validate_schema.py bundle --output beckn-schemas.bundle.json examples testnet"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=["examples"],
+        help="JSON files, Postman collections or directories to scan for schema refs (default: examples)"
+    )
+    parser.add_argument(
+        "--output",
+        default="beckn-schemas.bundle.json",
+        help="Bundle file to write (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--core-only",
+        action="store_true",
+        default=False,
+        help="Only bundle core Beckn schemas, skip domain-specific attribute schemas"
+    )
+    parser.add_argument("--verbose", action="store_true", default=False, help="Log each schema as it is loaded")
+    _add_schema_cache_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    _configure_schema_cache_from_args(parser, args)
+    configure_reporting(verbose=args.verbose)
+    
+    files = _expand_input_paths(args.paths)
+    registry_list, _, attribute_schemas_map = get_schema_store()
+    warm_schema_store(files, registry_list, attribute_schemas_map, args.core_only)
+    if not len(registry_list[0]):
+        print(f"Error: no schemas could be loaded for {len(files)} file(s)", file=sys.stderr)
+        sys.exit(1)
+    document = write_schema_bundle(args.output, registry_list, attribute_schemas_map)
+    size_kb = os.path.getsize(args.output) / 1024
+    print(f"✓ Wrote schema bundle: {args.output} ({len(document['resources'])} schemas, "
+          f"{len(document['contexts'])} domain contexts, {size_kb:.0f} KB, from {len(files)} files)")
+
+def traffic_main(argv):
+    """Entry point for `validate_schema.py traffic`."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="validate_schema.py traffic",
+        description="Validate recorded Beckn traffic (NDJSON, one context+message envelope per line, "
+                    "optionally gzipped) and aggregate results by context.domain and context.action"
+    )
+    parser.add_argument("files", nargs="+", help="NDJSON files (.ndjson, .jsonl, or gzip-compressed)")
+    parser.add_argument(
+        "--core-only",
+        action="store_true",
+        default=False,
+        help="Only validate core Beckn objects (beckn:Order, beckn:Offer, etc.), skip domain-specific attribute objects"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes; 0 uses all CPUs (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--chunk-lines",
+        type=int,
+        default=DEFAULT_TRAFFIC_CHUNK_LINES,
+        help="Messages per unit of work sent to a worker (default: %(default)s)"
+    )
+    parser.add_argument("--output", default=None, help="Also write the aggregated report as JSON to this file")
+    parser.add_argument(
+        "--codegen",
+        action="store_true",
+        default=False,
+        help="Accept valid objects with Python code generated from their schemas (see schema_codegen.py)"
+    )
+    parser.add_argument("--profile", action="store_true", default=False, help="Print a --profile report to stderr")
+    parser.add_argument("--verbose", action="store_true", default=False, help="Log schema loads and files")
+    _add_schema_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    if args.chunk_lines < 1:
+        parser.error("--chunk-lines must be at least 1")
+    _configure_schema_cache_from_args(parser, args)
+    configure_reporting(verbose=args.verbose)
+    configure_codegen(enabled=args.codegen)
+    profile = enable_profiling() if args.profile else None
+    registry_list, _, attribute_schemas_map = _load_store_from_args(parser, args)
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    started = time.perf_counter()
+    stats = validate_traffic(args.files, registry_list, attribute_schemas_map, args.core_only, jobs, args.chunk_lines)
+    elapsed = time.perf_counter() - started
+    report = traffic_report(stats, elapsed)
+    write_traffic_table(report, sys.stdout)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as out:
+            json.dump(report, out, indent=2)
+    if profile is not None:
+        write_profile_table(profile_report(profile, elapsed), sys.stderr)
+    sys.exit(1 if report["invalid_messages"] or report["file_errors"] else 0)
+
 if __name__ == "__main__":
     import argparse
     
+    if sys.argv[1:2] == ["serve"]:
+        serve_main(sys.argv[2:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["bundle"]:
+        bundle_main(sys.argv[2:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["traffic"]:
+        traffic_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
         description="Validate JSON files against Beckn protocol schemas",
         epilog="Example: python3 scripts/validate_schema.py examples/ev-charging/v2/**/*.json"
@@ -463,9 +3150,105 @@ if __name__ == "__main__":
         default=False,
         help="Only validate core Beckn objects (beckn:Order, beckn:Offer, etc.), skip domain-specific attribute objects"
     )
+    _add_schema_arguments(parser)
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Validate files incrementally with bounded memory, for very large payloads (requires ijson)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["summary", "jsonl", "junit", "text"],
+        default="summary",
+        help="Output format: 'summary' (failing files and counts), 'jsonl' (one record per object), "
+             "'junit' (XML report), or 'text' (a line for every object) (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Write the summary/jsonl/junit report to this file instead of stdout"
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        dest="prefetch",
+        action="store_false",
+        default=True,
+        help="Load schemas lazily as objects are found instead of fetching them all concurrently up front"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes; 0 uses all CPUs (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const="files",
+        choices=["files", "objects"],
+        default=None,
+        help="Skip files whose content and schemas are unchanged since the last run; 'objects' also "
+             "re-validates only the changed @context objects within a changed file (default mode: files)"
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help=f"Manifest of earlier results for --incremental (default: {DEFAULT_MANIFEST_NAME} in the cache directory)"
+    )
+    parser.add_argument(
+        "--codegen",
+        action="store_true",
+        default=False,
+        help="Accept valid objects with Python code generated from their schemas, falling back to "
+             "jsonschema for anything else (see schema_codegen.py)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Print time spent per phase (fetch, YAML parse, registry build, ...) and per schema type, "
+             "with bytes fetched and cache hit/miss counts, to stderr"
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Also write the --profile report as JSON to this file (implies --profile)"
+    )
     
     args = parser.parse_args()
-    registry, attributes_schema, attribute_schemas_map = get_schema_store()
+    _configure_schema_cache_from_args(parser, args)
+    configure_reporting(verbose=args.format == "text")
+    configure_codegen(enabled=args.codegen)
+    profile = enable_profiling() if args.profile or args.profile_output else None
+    profile_started = time.perf_counter()
+    registry, attributes_schema, attribute_schemas_map = _load_store_from_args(parser, args)
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    records = None if args.format == "text" else []
+    started = time.perf_counter()
+    if args.incremental:
+        manifest_path = args.manifest or os.path.join(args.cache_dir, DEFAULT_MANIFEST_NAME)
+        manifest = load_manifest(manifest_path)
+        results = process_files_incremental(args.files, registry, attributes_schema, attribute_schemas_map, manifest,
+                                            mode=args.incremental, core_only=args.core_only, jobs=jobs,
+                                            stream=args.stream, records=records)
+        save_manifest(manifest_path, manifest)
+    else:
+        results = process_files(args.files, registry, attributes_schema, attribute_schemas_map, core_only=args.core_only,
+                                jobs=jobs, stream=args.stream, prefetch=args.prefetch, records=records)
     
-    for file in args.files:
-        process_file(file, registry, attributes_schema, attribute_schemas_map, core_only=args.core_only)
+    if records is not None:
+        elapsed = time.perf_counter() - started
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as out:
+                REPORT_WRITERS[args.format](results, records, out, elapsed)
+        else:
+            REPORT_WRITERS[args.format](results, records, sys.stdout, elapsed)
+    if profile is not None:
+        report = profile_report(profile, time.perf_counter() - profile_started)
+        write_profile_table(report, sys.stderr)
+        if args.profile_output:
+            with open(args.profile_output, 'w', encoding='utf-8') as out:
+                json.dump(report, out, indent=2)
+    sys.exit(1 if any(results.values()) else 0)
@@ -0,0 +1,132 @@
+"""Tests for BecknValidator, the validator behind `validate_schema.py serve`."""
+
+import importlib.util
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("validate_schema", SCRIPTS_DIR / "validate_schema.py")
+validate_schema = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_schema)
+
+SCHEMA_BASE = "https://raw.githubusercontent.com/beckn/protocol-specifications-new/refs/heads/main/schema"
+CORE_CONTEXT = f"{SCHEMA_BASE}/core/v2/context.jsonld"
+OFFER_CONTEXT = f"{SCHEMA_BASE}/EvChargingOffer/v1/context.jsonld"
+CORE_URL = validate_schema.get_attributes_url_from_context_url(CORE_CONTEXT)
+OFFER_URL = validate_schema.get_attributes_url_from_context_url(OFFER_CONTEXT)
+
+SCHEMAS = {
+    CORE_URL: {"components": {"schemas": {"Order": {"type": "object", "required": ["beckn:id"]}}}},
+    OFFER_URL: {"components": {"schemas": {"ChargingOffer": {"type": "object"}}}},
+}
+
+
+def message(order_id="order-1"):
+    return {
+        "context": {"action": "select"},
+        "message": {
+            "order": {"@context": CORE_CONTEXT, "@type": "beckn:Order", "beckn:id": order_id},
+            "offer": {"@context": OFFER_CONTEXT, "@type": "ChargingOffer", "tariffModel": "PER_KWH"},
+        },
+    }
+
+
+@pytest.fixture
+def loads(monkeypatch, tmp_path):
+    """Stub schema loader serving SCHEMAS; URLs in loads["down"] fail. Returns the call log too."""
+    validate_schema.configure_schema_cache(cache_dir=str(tmp_path / "schemas"), offline=True)
+    validate_schema.configure_reporting(verbose=False)
+    state = {"calls": [], "down": set()}
+
+    def load_schema_from_url(url):
+        state["calls"].append(url)
+        # Long enough for concurrent callers to arrive while the load is in flight
+        time.sleep(state.get("latency", 0))
+        if url in state["down"]:
+            raise validate_schema.SchemaNotCachedError(f"{url} is not in the schema cache (offline mode)")
+        return validate_schema._intern_schema(url, SCHEMAS[url])
+
+    monkeypatch.setattr(validate_schema, "load_schema_from_url", load_schema_from_url)
+    return state
+
+
+def test_valid_message(loads):
+    result = validate_schema.BecknValidator().validate(message())
+    assert result["valid"] and result["schema_errors"] == []
+    assert len(result["objects"]) == 2
+
+
+def test_unavailable_schema_makes_message_invalid(loads):
+    loads["down"].add(OFFER_URL)
+    result = validate_schema.BecknValidator().validate(message())
+    assert not result["valid"]
+    assert result["errors"] == []
+    assert [(e["schema_url"], e["reason"]) for e in result["schema_errors"]] == [(OFFER_URL, "schema_unavailable")]
+    assert "offline mode" in result["schema_errors"][0]["error"]
+
+
+def test_serve_reports_unavailable_schema(loads):
+    loads["down"].add(OFFER_URL)
+    server = validate_schema.make_validation_server(validate_schema.BecknValidator(), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        request = urllib.request.Request(f"http://127.0.0.1:{server.server_port}/validate",
+                                         data=json.dumps(message()).encode("utf-8"), method="POST")
+        with urllib.request.urlopen(request, timeout=10) as response:
+            body = json.loads(response.read())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert body["valid"] is False
+    assert body["schema_errors"][0]["reason"] == "schema_unavailable"
+
+
+def test_concurrent_validations_load_each_schema_once(loads):
+    loads["latency"] = 0.05
+    validator = validate_schema.BecknValidator()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: validator.validate(message(f"order-{i}")), range(16)))
+    assert all(result["valid"] for result in results)
+    assert sorted(loads["calls"]) == sorted([CORE_URL, OFFER_URL])
+
+
+def test_failed_load_is_cached(loads):
+    loads["down"].add(OFFER_URL)
+    loads["latency"] = 0.05
+    validator = validate_schema.BecknValidator()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: validator.validate(message()), range(16)))
+    for _ in range(5):
+        results.append(validator.validate(message()))
+    assert not any(result["valid"] for result in results)
+    assert loads["calls"].count(OFFER_URL) == 1
+
+    # Once the failure expires the schema is loaded again
+    loads["down"].clear()
+    validator.retry_failed_after = 0
+    assert validator.validate(message())["valid"]
+    assert loads["calls"].count(OFFER_URL) == 2
+    assert validator.validate(message())["valid"]
+    assert loads["calls"].count(OFFER_URL) == 2
+
+
+def test_validation_of_warm_schemas_takes_no_lock(loads):
+    validator = validate_schema.BecknValidator()
+    validator.warm(validate_schema.collect_schema_refs(message()))
+    calls = len(loads["calls"])
+
+    # A held publish lock (another thread adding schemas) must not block warm validations
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        with validator._publish_lock:
+            futures = [pool.submit(validator.validate, message(f"order-{i}")) for i in range(8)]
+            done, _ = wait(futures, timeout=10)
+        assert len(done) == len(futures)
+    assert all(future.result()["valid"] for future in futures)
+    assert len(loads["calls"]) == calls
@@ -0,0 +1,40 @@
+"""Tests for generate_postman_collection.py output writing."""
+
+import importlib.util
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("generate_postman_collection", SCRIPTS_DIR / "generate_postman_collection.py")
+generate_postman_collection = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_postman_collection)
+
+
+@pytest.fixture
+def umask_022():
+    previous = os.umask(0o022)
+    yield
+    os.umask(previous)
+
+
+def mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_new_collection_gets_umask_permissions(tmp_path, umask_022):
+    path = tmp_path / "out" / "ev-charging:BAP-DEG.postman_collection.json"
+    assert generate_postman_collection.write_if_changed(path, "{}")
+    assert mode(path) == 0o644
+
+
+def test_rewritten_collection_keeps_its_permissions(tmp_path, umask_022):
+    path = tmp_path / "ev-charging:BAP-DEG.postman_collection.json"
+    path.write_text("{}", encoding="utf-8")
+    path.chmod(0o664)
+    assert generate_postman_collection.write_if_changed(path, '{"item": []}')
+    assert path.read_text(encoding="utf-8") == '{"item": []}'
+    assert mode(path) == 0o664
+    assert not generate_postman_collection.write_if_changed(path, '{"item": []}')
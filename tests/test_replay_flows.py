@@ -0,0 +1,78 @@
+"""Tests for the flow replay tool (replay_flows.py): request building and the report."""
+
+import datetime
+import importlib.util
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("replay_flows", SCRIPTS_DIR / "replay_flows.py")
+replay_flows = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(replay_flows)
+
+ADAPTER_URL = "http://127.0.0.1:9999/bap/caller"
+
+
+@pytest.fixture(scope="module")
+def steps():
+    variables = {
+        variable["key"]: variable["value"]
+        for role in replay_flows.ROLE_TARGETS
+        for variable in replay_flows.generate_postman_collection.get_collection_variables("ev-charging", role)
+    }
+    variables["bap_adapter_url"] = ADAPTER_URL + "/"
+    return replay_flows.build_replay_steps("ev-charging", "BAP", variables,
+                                           index=replay_flows.example_index.ExampleIndex(None))
+
+
+def test_steps_follow_the_flow(steps):
+    actions = [step["action"] for step in steps]
+    assert actions[:4] == ["discover", "select", "init", "confirm"]
+    steps_in_flow = [replay_flows.example_index.flow_step(action) for action in actions]
+    assert steps_in_flow == sorted(steps_in_flow)
+    assert all(step["url"] == f"{ADAPTER_URL}/{step['action']}" and step["templates"] for step in steps)
+
+
+def test_requests_get_fresh_ids_per_virtual_user(steps):
+    template = steps[0]["templates"][0]
+    assert '"{{transaction_id}}"' in template and '"{{$guid}}"' in template
+    assert "{{bap_id}}" not in template
+
+    first_user, second_user = str(uuid.uuid4()), str(uuid.uuid4())
+    bodies = [json.loads(replay_flows.render_request(template, transaction_id))
+              for transaction_id in (first_user, first_user, second_user)]
+    contexts = [body["context"] for body in bodies]
+    assert [context["transaction_id"] for context in contexts] == [first_user, first_user, second_user]
+    message_ids = [context["message_id"] for context in contexts]
+    assert len(set(message_ids)) == 3 and all(uuid.UUID(message_id) for message_id in message_ids)
+    for context in contexts:
+        assert datetime.datetime.fromisoformat(context["timestamp"].replace("Z", "+00:00")).tzinfo is not None
+    assert all("{{" not in json.dumps(body) for body in bodies)
+
+
+def test_report_rates_and_percentiles():
+    stats = replay_flows.new_replay_stats([{"action": "select"}, {"action": "init"}])
+    # 100 responses of 1..100 ms, 4 of them errors or NACKs, and 2 requests that timed out
+    stats["select"].update(latencies=[ms / 1000 for ms in range(100, 0, -1)], errors=3, nacks=1,
+                           statuses={500: 1, 200: 99}, failures={"TimeoutError": 2})
+    report = replay_flows.replay_report(stats, elapsed=2.0)
+
+    select, init = report["actions"]
+    assert select["requests"] == 102 and select["requests_per_s"] == 51.0
+    assert (select["p50_ms"], select["p90_ms"], select["p99_ms"], select["max_ms"]) == (50.0, 90.0, 99.0, 100.0)
+    assert select["statuses"] == {"200": 99, "500": 1}
+    assert init["requests"] == 0 and "p50_ms" not in init
+    assert (report["requests"], report["errors"], report["nacks"], report["requests_per_s"]) == (102, 3, 1, 51.0)
+
+
+@pytest.mark.parametrize("values, pct, expected", [
+    ([5.0], 99, 5.0),
+    ([3.0, 1.0, 2.0], 50, 2.0),
+    ([1.0, 2.0, 3.0, 4.0], 0, 1.0),
+    ([1.0, 2.0, 3.0, 4.0], 100, 4.0),
+])
+def test_percentile(values, pct, expected):
+    assert replay_flows.percentile(values, pct) == expected
@@ -0,0 +1,99 @@
+"""Generated validators (schema_codegen.py, `--codegen`) must agree with jsonschema."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("validate_schema", SCRIPTS_DIR / "validate_schema.py")
+validate_schema = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_schema)
+
+SCHEMA_URL = "https://example.org/schema/Codegen/v1/attributes.yaml"
+
+SCHEMAS = {
+    "Integer": {"type": "integer"},
+    "Boolean": {"type": "boolean"},
+    "Number": {"type": "number"},
+    "Currency": {"type": "string", "pattern": "[A-Z]{3}"},
+    "ExactCurrency": {"type": "string", "pattern": "^[A-Z]{3}$"},
+    "OneOf": {"oneOf": [{"type": "integer"}, {"type": "number"}]},
+    "Closed": {"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": False},
+    "IntegerExtras": {"type": "object", "properties": {"a": {"type": "string"}},
+                      "additionalProperties": {"type": "integer"}},
+    "Price": {"type": "object", "properties": {"value": {"type": "number"}}, "required": ["value"]},
+    "Offer": {"type": "object", "properties": {"price": {"$ref": "#/components/schemas/Price"}}, "required": ["price"]},
+    "Unique": {"type": "array", "uniqueItems": True},
+}
+
+# (schema name, instance, valid according to jsonschema)
+CASES = [
+    ("Integer", 1, True),
+    ("Integer", True, False),
+    ("Integer", 1.0, True),
+    ("Integer", 1.5, False),
+    ("Integer", "1", False),
+    ("Boolean", True, True),
+    ("Boolean", 1, False),
+    ("Boolean", 0, False),
+    ("Number", False, False),
+    ("Number", 2.5, True),
+    ("Currency", "INR", True),
+    ("Currency", "price in INR", True),
+    ("Currency", "inr", False),
+    ("ExactCurrency", "INR", True),
+    ("ExactCurrency", "INRX", False),
+    ("OneOf", 1, False),
+    ("OneOf", 1.0, False),
+    ("OneOf", 1.5, True),
+    ("OneOf", "1", False),
+    ("Closed", {"a": "x"}, True),
+    ("Closed", {"a": "x", "b": 1}, False),
+    ("Closed", {"a": 1}, False),
+    ("IntegerExtras", {"a": "x", "b": 1}, True),
+    ("IntegerExtras", {"a": "x", "b": "y"}, False),
+    ("Offer", {"price": {"value": 10}}, True),
+    ("Offer", {"price": {"value": "10"}}, False),
+    ("Offer", {"price": {}}, False),
+    ("Offer", {}, False),
+]
+
+
+@pytest.fixture(scope="module")
+def registry(tmp_path_factory):
+    validate_schema.configure_schema_cache(cache_dir=str(tmp_path_factory.mktemp("schemas")), offline=True)
+    validate_schema.configure_reporting(verbose=False)
+    validate_schema.configure_codegen(enabled=True)
+    document = validate_schema._intern_schema(SCHEMA_URL, {"components": {"schemas": SCHEMAS}})
+    registry_list = [validate_schema.Registry()]
+    validate_schema.register_schemas(registry_list, {SCHEMA_URL: document})
+    yield registry_list[0]
+    validate_schema.configure_codegen(enabled=False)
+
+
+def reported_error(validator, instance, fast_check=None):
+    """(message, path) of the error _validate_with raises, or None if the instance is valid."""
+    try:
+        validate_schema._validate_with(validator, instance, fast_check=fast_check)
+    except validate_schema.ValidationError as e:
+        return e.message, list(e.absolute_path)
+    return None
+
+
+@pytest.mark.parametrize("name, instance, valid", CASES)
+def test_generated_validator_agrees_with_jsonschema(registry, name, instance, valid):
+    check = validate_schema.get_generated_validator(SCHEMA_URL, name, registry)
+    validator = validate_schema.get_compiled_validator(SCHEMA_URL, name, registry)
+    assert check is not None
+    assert validator.is_valid(instance) is valid
+    assert check(instance) is valid
+    assert reported_error(validator, instance, check) == reported_error(validator, instance)
+
+
+def test_unsupported_schema_falls_back_to_jsonschema(registry):
+    assert validate_schema.get_generated_validator(SCHEMA_URL, "Unique", registry) is None
+    validator = validate_schema.get_compiled_validator(SCHEMA_URL, "Unique", registry)
+    assert reported_error(validator, [1, 2]) is None
+    message, path = reported_error(validator, [1, 1])
+    assert "non-unique" in message and path == []
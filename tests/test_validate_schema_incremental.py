@@ -0,0 +1,98 @@
+"""Regression tests for `validate_schema.py --incremental objects` (process_files_incremental)."""
+
+import copy
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("validate_schema", SCRIPTS_DIR / "validate_schema.py")
+validate_schema = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(validate_schema)
+
+CONTEXT_URL = "https://example.org/schema/TestOffer/v1/context.jsonld"
+SCHEMA_URL = validate_schema.get_attributes_url_from_context_url(CONTEXT_URL)
+
+
+def offer_schema(units):
+    """attributes.yaml content with one attribute type whose unit must be one of units."""
+    return {
+        "components": {
+            "schemas": {
+                "TestOffer": {
+                    "type": "object",
+                    "properties": {
+                        "unit": {"enum": units},
+                        "detail": {"type": "object", "properties": {"unit": {"enum": units}}},
+                    },
+                }
+            }
+        }
+    }
+
+
+def load_store(schema):
+    """Registry and attribute map holding schema, as a fresh run that loaded it would have."""
+    schema = validate_schema._intern_schema(SCHEMA_URL, schema)
+    registry_list = [validate_schema.Registry()]
+    validate_schema.register_schemas(registry_list, {SCHEMA_URL: schema})
+    return registry_list, {CONTEXT_URL: ("TestOffer", schema, SCHEMA_URL)}
+
+
+def offer(unit, detail_unit=None):
+    # detail has a @type without a schema, so it is only validated as part of its parent
+    return {"@context": CONTEXT_URL, "@type": "TestOffer", "unit": unit,
+            "detail": {"@context": CONTEXT_URL, "@type": "TestDetail", "unit": detail_unit or unit}}
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path):
+    validate_schema.configure_schema_cache(cache_dir=str(tmp_path / "schemas"), offline=True)
+    validate_schema.configure_reporting(verbose=False)
+
+
+def run(path, payload, schema, manifest):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    registry_list, attribute_schemas_map = load_store(schema)
+    results = validate_schema.process_files_incremental([str(path)], registry_list, None, attribute_schemas_map,
+                                                        manifest, mode="objects")
+    return results[str(path)]
+
+
+def test_schema_change_with_content_edit_revalidates_objects(tmp_path):
+    path = tmp_path / "message.json"
+    manifest = {"version": validate_schema.MANIFEST_VERSION, "files": {}}
+    payload = {"context": {"message_id": "1"}, "message": {"offers": [offer("PER_KWH"), offer("PER_MINUTE")]}}
+    assert run(path, payload, offer_schema(["PER_KWH", "PER_MINUTE"]), manifest) == []
+
+    # Tighter schema, and an edit outside the offers: both offers must be validated again
+    edited = copy.deepcopy(payload)
+    edited["context"]["message_id"] = "2"
+    errors = run(path, edited, offer_schema(["PER_MINUTE"]), manifest)
+    assert len(errors) == 1 and "PER_KWH" in errors[0]
+
+    fresh = {"version": validate_schema.MANIFEST_VERSION, "files": {}}
+    assert len(run(tmp_path / "fresh.json", edited, offer_schema(["PER_MINUTE"]), fresh)) == 1
+
+
+def test_schema_only_change_keeps_per_object_results(tmp_path):
+    path = tmp_path / "message.json"
+    manifest = {"version": validate_schema.MANIFEST_VERSION, "files": {}}
+    payload = {"message": {"offers": [offer("PER_KWH")]}}
+    assert run(path, payload, offer_schema(["PER_KWH", "PER_MINUTE"]), manifest) == []
+
+    errors = run(path, payload, offer_schema(["PER_MINUTE"]), manifest)
+    assert len(errors) == 1
+    assert "objects" in manifest["files"][str(path.resolve())]
+
+
+def test_edit_inside_unvalidated_child_revalidates_parent(tmp_path):
+    path = tmp_path / "message.json"
+    manifest = {"version": validate_schema.MANIFEST_VERSION, "files": {}}
+    schema = offer_schema(["PER_KWH"])
+    assert run(path, {"message": {"offer": offer("PER_KWH")}}, schema, manifest) == []
+
+    errors = run(path, {"message": {"offer": offer("PER_KWH", detail_unit="BAD")}}, schema, manifest)
+    assert len(errors) == 1 and "BAD" in errors[0]
@@ -0,0 +1,68 @@
+"""Postman collections: request bodies are validated once per distinct body, reported per item."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+spec = importlib.util.spec_from_file_location("validate_schema", SCRIPTS_DIR / "validate_schema.py")
+validate_schema = importlib.util.module_from_spec(spec)
+# Worker processes (-j) look the validation function up by module name
+sys.modules[spec.name] = validate_schema
+spec.loader.exec_module(validate_schema)
+
+CONTEXT_URL = "https://example.org/schema/TestOffer/v1/context.jsonld"
+SCHEMA_URL = validate_schema.get_attributes_url_from_context_url(CONTEXT_URL)
+SCHEMA = {"components": {"schemas": {"TestOffer": {"type": "object", "properties": {"unit": {"enum": ["PER_KWH"]}}}}}}
+
+
+def body(message_id, unit):
+    return {"context": {"action": "select", "message_id": message_id},
+            "message": {"offer": {"@context": CONTEXT_URL, "@type": "TestOffer", "unit": unit}}}
+
+
+def item(name, payload):
+    return {"name": name, "request": {"method": "POST", "body": {"mode": "raw", "raw": json.dumps(payload)}}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    validate_schema.configure_schema_cache(cache_dir=str(tmp_path / "schemas"), offline=True)
+    validate_schema.configure_reporting(verbose=False)
+    schema = validate_schema._intern_schema(SCHEMA_URL, SCHEMA)
+    registry_list = [validate_schema.Registry()]
+    validate_schema.register_schemas(registry_list, {SCHEMA_URL: schema})
+    return registry_list, None, {CONTEXT_URL: ("TestOffer", schema, SCHEMA_URL)}
+
+
+@pytest.fixture
+def collection(tmp_path):
+    # Same body apart from message_id under two names, and one different body
+    data = {
+        "info": {"_postman_id": "test", "name": "test"},
+        "item": [{"name": "select", "item": [
+            item("Per minute", body("1", "PER_MINUTE")),
+            item("Per minute again", body("2", "PER_MINUTE")),
+            item("Per hour", body("3", "PER_HOUR")),
+        ]}],
+    }
+    path = tmp_path / "test.postman_collection.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_duplicate_bodies_are_reported_for_every_item(store, collection, jobs):
+    registry_list, attributes_schema, attribute_schemas_map = store
+    records = []
+    errors = validate_schema.process_file(collection, registry_list, attributes_schema, attribute_schemas_map,
+                                          records=records, jobs=jobs)
+
+    names = ["select / Per minute", "select / Per minute again", "select / Per hour"]
+    assert [error.split(": ", 1)[0] for error in errors] == names
+    assert "PER_MINUTE" in errors[0] and "PER_MINUTE" in errors[1] and "PER_HOUR" in errors[2]
+    assert [record["item"] for record in records] == names
+    assert all(not record["valid"] and record["file"] == collection for record in records)